@@ -0,0 +1,51 @@
+"""
+Compares parsing of the feed file with loading it from the feed cache.
+
+Usage:
+    python -m benchmarks.cache [offers]
+"""
+import os
+import sys
+import tempfile
+import time
+import warnings
+from xml.etree import ElementTree as ET
+
+from yandex_market_language import convert_stream, parse
+from yandex_market_language.cache import FeedCache
+from yandex_market_language.models import Feed, Shop
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def main(offers: int = 20000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    root = ET.parse(FIXTURE_PATH).getroot()
+    offer_els = list(root.find("shop/offers"))
+    root.find("shop/offers").clear()
+    header = Feed.from_xml(root)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        convert_stream(path, header, (
+            Shop.offer_from_xml(offer_els[i % len(offer_els)])
+            for i in range(offers)
+        ))
+        cache = FeedCache(os.path.join(tmp, "cache"))
+
+        for name in ("parse", "miss", "hit"):
+            start = time.perf_counter()
+            parse(path, cache=cache if name != "parse" else None)
+            print("{name:<5} {offers} offers: {s:.3f}s".format(
+                name=name, offers=offers, s=time.perf_counter() - start
+            ))
+        print("snapshot {m:.1f} MiB, feed {f:.1f} MiB".format(
+            m=cache.size / 2 ** 20, f=os.path.getsize(path) / 2 ** 20
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,79 @@
+"""
+Measures subtree queries over the category tree index against walking the
+parent ids of the categories.
+
+Usage:
+    python -m benchmarks.categories [categories] [offers]
+"""
+import os
+import random
+import sys
+import time
+import warnings
+
+from yandex_market_language import parse
+from yandex_market_language.models import Category
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    result = func()
+    print("{name:<28} {s:.4f}s".format(
+        name=name, s=time.perf_counter() - start
+    ))
+    return result
+
+
+def in_subtree(parents: dict, category_id: str, ancestor_id: str) -> bool:
+    while category_id is not None:
+        if category_id == ancestor_id:
+            return True
+        category_id = parents.get(category_id)
+    return False
+
+
+def main(categories: int = 10000, offers: int = 100000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    rnd = random.Random(0)
+    shop = parse(FIXTURE_PATH).shop
+    source = shop.offers
+
+    shop.categories = [Category("0", "root")] + [
+        Category(str(i), "category", str(rnd.randrange(i)))
+        for i in range(1, categories)
+    ]
+    shop.offers = [source[i % len(source)] for i in range(offers)]
+    for o in shop.offers:
+        o.category_id = str(rnd.randrange(categories))
+    shop.offers = shop.offers[:]
+
+    index = timed("build", lambda: shop.category_index)
+    pairs = [
+        (str(rnd.randrange(categories)), str(rnd.randrange(categories)))
+        for _ in range(100000)
+    ]
+    parents = {c.category_id: c.parent_id for c in shop.categories}
+    timed("100k is_descendant", lambda: [
+        index.is_descendant(a, b) for a, b in pairs
+    ])
+    timed("100k parent walks", lambda: [
+        in_subtree(parents, a, b) for a, b in pairs
+    ])
+
+    ids = [str(rnd.randrange(10)) for _ in range(100)]
+    timed("100 subtrees by index", lambda: [
+        shop.offers_in_category(i) for i in ids
+    ])
+    timed("100 subtrees by scan", lambda: [
+        [o for o in shop.offers if in_subtree(parents, o.category_id, i)]
+        for i in ids
+    ])
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Measures the time and the peak RSS of the process for the diff of two feed
+files with 1% of changed offers, streaming the offers of both files.
+
+Usage:
+    python -m benchmarks.delta [offers ...]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+import warnings
+from xml.etree import ElementTree as ET
+
+from yandex_market_language import convert_stream, diff_feeds, iter_offers
+from yandex_market_language.models import Feed, Shop
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def write_feed(path, header: "Feed", offer_els: list, offers: int, step: int):
+    """
+    Writes the feed with the offers repeated from the elements, the price
+    of every offer with the index divisible by the step is changed.
+    """
+    def generate():
+        for i in range(offers):
+            offer = Shop.offer_from_xml(offer_els[i % len(offer_els)])
+            offer.offer_id = str(i)
+            if step and i % step == 0:
+                offer.price.value = offer.price.value + 1
+            yield offer
+
+    convert_stream(path, header, generate(), pretty=False)
+
+
+def main(*offers: int):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    root = ET.parse(FIXTURE_PATH).getroot()
+    offer_els = list(root.find("shop/offers"))
+    root.find("shop/offers").clear()
+    header = Feed.from_xml(root)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "old.xml")
+        new_path = os.path.join(tmp, "new.xml")
+        for n in offers or (10000, 20000, 40000):
+            write_feed(old_path, header, offer_els, n, 0)
+            write_feed(new_path, header, offer_els, n, 100)
+
+            start = time.perf_counter()
+            delta = diff_feeds(iter_offers(old_path), iter_offers(new_path))
+            print("{n} offers: {s:.2f}s, peak RSS {m:.1f} MiB, {d}".format(
+                n=n,
+                s=time.perf_counter() - start,
+                m=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                d=delta,
+            ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""
+Compares exporting the offers of a synthetic feed to JSON lines through
+the offer models, parsing the whole feed or iterating over the offers,
+with the direct export bypassing the models. Every way runs in its own
+process, which reports its time and peak RSS, so the memory held by the
+benchmark doesn't count.
+
+Usage:
+    python -m benchmarks.dicts [offers]
+"""
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.generator import generate_feed
+
+# Export code by name, formatted with the feed and the output paths
+WAYS = (
+    ("parse + to_dict", (
+        "import json; from yandex_market_language import parse; "
+        "f = open({out!r}, 'w', encoding='utf-8'); "
+        "[f.write(json.dumps(o.to_dict(), ensure_ascii=False, default=str) "
+        "+ '\\n') for o in parse({path!r}).shop.offers]"
+    )),
+    ("iter_offers + to_dict", (
+        "import json; from yandex_market_language import iter_offers; "
+        "f = open({out!r}, 'w', encoding='utf-8'); "
+        "[f.write(json.dumps(o.to_dict(), ensure_ascii=False, default=str) "
+        "+ '\\n') for o in iter_offers({path!r})]"
+    )),
+    ("parse_to_jsonl", (
+        "from yandex_market_language import parse_to_jsonl; "
+        "parse_to_jsonl({path!r}, {out!r})"
+    )),
+)
+
+
+# Runs the export code and prints its time and the peak RSS in MB
+CHILD = (
+    "import json, resource, time; start = time.perf_counter(); {0}; "
+    "print(json.dumps([time.perf_counter() - start, "
+    "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024]))"
+)
+
+
+def timed(code: str) -> tuple:
+    out = subprocess.check_output(
+        [sys.executable, "-W", "ignore", "-c", CHILD.format(code)]
+    )
+    elapsed, rss = json.loads(out)
+    return elapsed, rss
+
+
+def digest(path: str) -> str:
+    # Hashed by chunks, the outputs held by this process would be
+    # counted in the peak RSS of the next children
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(2 ** 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def main(offers: int = 20000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        generate_feed(path, offers)
+        print("{0} offers, {1:.1f} MB".format(
+            offers, os.path.getsize(path) / 2 ** 20
+        ))
+
+        outputs = []
+        for i, (name, code) in enumerate(WAYS):
+            out = os.path.join(tmp, "offers{0}.jsonl".format(i))
+            elapsed, rss = timed(code.format(path=path, out=out))
+            print("{name:<22} {s:>8.3f}s {rss:>8.1f} MB".format(
+                name=name, s=elapsed, rss=rss
+            ))
+            outputs.append(digest(out))
+        assert len(set(outputs)) == 1, "outputs differ"
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+Measures parsing with the errors collected against the default parsing,
+on a valid feed and on a feed with a share of invalid offers.
+
+Usage:
+    python -m benchmarks.errors [offers] [invalid per mille]
+"""
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+from yandex_market_language import convert_stream, parse
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    result = func()
+    print("{name:<24} {s:.4f}s".format(
+        name=name, s=time.perf_counter() - start
+    ))
+    return result
+
+
+def generate(source: list, offers: int):
+    for i in range(offers):
+        offer = source[i % len(source)]
+        offer.offer_id = str(i)
+        yield offer
+
+
+def main(offers: int = 20000, invalid: int = 10):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    feed = parse(FIXTURE_PATH)
+    source = feed.shop.offers
+    feed.shop.offers = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        convert_stream(path, feed, generate(source, offers))
+        timed("raise", lambda: parse(path))
+        timed("mapped", lambda: parse(path, mapped=True))
+        timed("collect", lambda: parse(path, errors="collect"))
+
+        with open(path, "rb") as f:
+            chunks = f.read().split(b"<price>")
+        step = 1000 // invalid if invalid else len(chunks)
+        data = b"<price>".join(
+            b"x" + c if i % step == 0 and i else c
+            for i, c in enumerate(chunks)
+        )
+        with open(path, "wb") as f:
+            f.write(data)
+        result = timed("collect invalid", lambda: parse(
+            path, errors="collect"
+        ))
+        print("{n} offers, {e} errors".format(
+            n=len(result.shop.offers), e=len(result.errors)
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
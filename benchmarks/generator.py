@@ -0,0 +1,252 @@
+"""
+Deterministic generator of large synthetic feeds.
+
+The feed has the same shape as the test fixture and the test factories:
+currencies, a category tree, delivery options, offers of all eight types
+with pictures, params, options and barcodes, gifts and promos. Offers are
+written straight to the file from templates, so feeds of millions of
+offers are generated in seconds and in constant memory, and the same
+arguments always give the same bytes.
+
+Usage:
+    python -m benchmarks.generator offers path [seed]
+"""
+import random
+import sys
+from typing import BinaryIO, Union
+from xml.sax.saxutils import escape
+
+# Offer types by their share of every 100 offers
+OFFER_MIX = (
+    (None, 50),
+    ("vendor.model", 20),
+    ("book", 8),
+    ("audiobook", 3),
+    ("artist.title", 5),
+    ("medicine", 5),
+    ("event-ticket", 5),
+    ("alco", 4),
+)
+
+VENDORS = ("Brother", "Brand", "Xiaomi", "Santa Margherita", "Эксмо")
+COUNTRIES = ("Китай", "Россия", "Италия", "Австралия")
+PARAMS = (
+    '<param name="Цвет">черный</param>',
+    '<param name="Размер дисплея" unit="дюйм">5.6</param>',
+    '<param name="Мощность">750 Вт</param>',
+    '<param name="Объем" unit="л">0.75</param>',
+)
+
+# Number of offers per category and per promo
+OFFERS_PER_CATEGORY = 100
+OFFERS_PER_PROMO = 1000
+
+# Number of offers written at once
+CHUNK_SIZE = 1000
+
+
+def _header(offers: int, rnd: random.Random) -> str:
+    categories = max(offers // OFFERS_PER_CATEGORY, 1)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<yml_catalog date="2020-01-01 10:00">',
+        "<shop>",
+        "<name>Benchmark</name>",
+        "<company>Benchmark Ltd</company>",
+        "<url>https://example.shop</url>",
+        "<platform>Django</platform>",
+        "<version>2.2.5</version>",
+        "<email>shop@example.shop</email>",
+        "<currencies>",
+        '<currency id="RUR" rate="1"/>',
+        '<currency id="USD" rate="60"/>',
+        '<currency id="EUR" rate="CBRF" plus="1"/>',
+        "</currencies>",
+        "<categories>",
+    ]
+    for i in range(1, categories + 1):
+        # Every category but the first ones has a parent with a lower id
+        parent = rnd.randrange(1, i) if i > 10 else None
+        lines.append(
+            '<category id="{i}"{p}>Category {i}</category>'.format(
+                i=i, p=' parentId="{0}"'.format(parent) if parent else ""
+            )
+        )
+    lines += [
+        "</categories>",
+        "<delivery-options>",
+        '<option cost="0" days="10"/>',
+        '<option cost="300" days="4"/>',
+        '<option cost="350" days="3-4" order-before="15"/>',
+        "</delivery-options>",
+        "<pickup-options>",
+        '<option cost="150" days="3"/>',
+        "</pickup-options>",
+        "<enable_auto_discounts>1</enable_auto_discounts>",
+        "<offers>",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _footer(offers: int) -> str:
+    promos = max(offers // OFFERS_PER_PROMO, 1)
+    lines = [
+        "</offers>",
+        "<gifts>",
+        '<gift id="1"><name>Кружка 300 мл</name>'
+        "<picture>https://example.shop/promos/1.jpg</picture></gift>",
+        "</gifts>",
+        "<promos>",
+    ]
+    for i in range(promos):
+        products = "".join(
+            '<product offer-id="{0}"/>'.format(j)
+            for j in range(i * OFFERS_PER_PROMO, min(
+                (i + 1) * OFFERS_PER_PROMO, offers
+            ), OFFERS_PER_PROMO // 10)
+        )
+        lines.append(
+            '<promo id="promo{i}" type="gift with purchase">'
+            "<start-date>2020-02-01 09:00:00</start-date>"
+            "<end-date>2020-03-01 22:00:00</end-date>"
+            "<description>Promo {i}</description>"
+            "<url>https://example.shop/promos/{i}</url>"
+            "<purchase>{products}</purchase>"
+            '<promo-gifts><promo-gift gift-id="1"/></promo-gifts>'
+            "</promo>".format(i=i, products=products)
+        )
+    lines += ["</promos>", "</shop>", "</yml_catalog>"]
+    return "\n".join(lines) + "\n"
+
+
+def _offer(i: int, offer_type, categories: int, rnd: random.Random) -> str:
+    price = rnd.randrange(100, 100000)
+    parts = [
+        "<url>https://example.shop/product_page.asp?pid={0}</url>".format(i),
+        "<price>{0}</price>".format(price),
+    ]
+    if rnd.random() < 0.3:
+        parts.append("<oldprice>{0}</oldprice>".format(price + 100))
+    category = rnd.randrange(1, categories + 1)
+    parts += [
+        "<currencyId>RUR</currencyId>",
+        "<categoryId>{0}</categoryId>".format(category),
+    ]
+    parts += [
+        "<picture>https://example.shop/img/{0}_{1}.jpg</picture>".format(i, n)
+        for n in range(rnd.randrange(1, 4))
+    ]
+    parts += [
+        "<delivery>true</delivery>",
+        "<pickup>{0}</pickup>".format("true" if i % 2 else "false"),
+    ]
+    if rnd.random() < 0.5:
+        parts.append(
+            '<delivery-options><option cost="300" days="1-3"/>'
+            "</delivery-options>"
+        )
+    parts += [
+        "<description>Description of the offer {0}</description>".format(i),
+        "<min-quantity>1</min-quantity>",
+        "<country_of_origin>{0}</country_of_origin>".format(
+            COUNTRIES[i % len(COUNTRIES)]
+        ),
+    ]
+    vendor = escape(VENDORS[i % len(VENDORS)])
+
+    if offer_type is None:
+        head = "<name>Offer {0}</name><vendor>{1}</vendor>".format(i, vendor)
+    elif offer_type == "vendor.model":
+        head = (
+            "<typePrefix>Принтер</typePrefix><vendor>{1}</vendor>"
+            "<model>M{0}</model>".format(i, vendor)
+        )
+    elif offer_type in ("book", "audiobook"):
+        head = (
+            "<name>Book {0}</name><publisher>Эксмо</publisher>"
+            "<author>Author {1}</author><year>2007</year>"
+            "<ISBN>978-5-699-23647-3</ISBN><language>rus</language>"
+            '<age unit="year">18</age>'.format(i, i % 1000)
+        )
+        if offer_type == "book":
+            head += "<binding>70x90/32</binding><page_extent>288</page_extent>"
+        else:
+            head += (
+                "<performed_by>Reader</performed_by><storage>CD</storage>"
+                "<format>mp3</format>"
+            )
+    elif offer_type == "artist.title":
+        head = (
+            "<title>Album {0}</title><artist>Artist</artist>"
+            "<year>1999</year><media>DVD</media>".format(i)
+        )
+    elif offer_type == "medicine":
+        head = "<name>Medicine {0}</name><vendor>{1}</vendor>".format(
+            i, vendor
+        )
+    elif offer_type == "event-ticket":
+        head = (
+            "<name>Concert {0}</name><place>Hall</place>"
+            "<date>2020-02-25 19:00:00</date><is_kids>false</is_kids>"
+            "<age>6</age>".format(i)
+        )
+    else:
+        head = "<name>Wine {0}</name><vendor>{1}</vendor>".format(i, vendor)
+
+    parts += PARAMS[:rnd.randrange(1 if offer_type == "alco" else 0, 4)]
+    if offer_type == "alco" or rnd.random() < 0.5:
+        parts.append("<barcode>46{0:011d}</barcode>".format(i))
+    if rnd.random() < 0.3:
+        parts.append("<weight>{0:.2f}</weight>".format(rnd.random() * 10))
+
+    return '<offer id="{i}"{t} bid="80">{head}{body}</offer>\n'.format(
+        i=i,
+        t=' type="{0}"'.format(offer_type) if offer_type else "",
+        head=head,
+        body="".join(parts),
+    )
+
+
+def offer_types(seed: int = 0) -> list:
+    """
+    Returns the types of every 100 offers in the order they're written.
+    """
+    types = [t for t, share in OFFER_MIX for _ in range(share)]
+    random.Random(seed).shuffle(types)
+    return types
+
+
+def generate_feed(
+    file_or_path: Union[str, BinaryIO], offers: int, seed: int = 0
+) -> int:
+    """
+    Writes the synthetic feed with the number of offers to the file,
+    returns the number of bytes written.
+    """
+    if isinstance(file_or_path, str):
+        with open(file_or_path, "wb") as f:
+            return generate_feed(f, offers, seed)
+
+    rnd = random.Random(seed)
+    types = offer_types(seed)
+    categories = max(offers // OFFERS_PER_CATEGORY, 1)
+    written = file_or_path.write(_header(offers, rnd).encode("utf-8"))
+    for start in range(0, offers, CHUNK_SIZE):
+        chunk = "".join(
+            _offer(i, types[i % len(types)], categories, rnd)
+            for i in range(start, min(start + CHUNK_SIZE, offers))
+        )
+        written += file_or_path.write(chunk.encode("utf-8"))
+    written += file_or_path.write(_footer(offers).encode("utf-8"))
+    return written
+
+
+def main(offers: int, path: str, seed: int = 0):
+    size = generate_feed(path, offers, seed)
+    print("{offers} offers, {mb:.1f} MB: {path}".format(
+        offers=offers, mb=size / 2 ** 20, path=path
+    ))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]), sys.argv[2], *(int(a) for a in sys.argv[3:]))
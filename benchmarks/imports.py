@@ -0,0 +1,64 @@
+"""
+Measures the cold start: runs every statement in fresh interpreters and
+prints the median time above the bare interpreter start and the number of
+the modules loaded by the statement.
+
+Usage:
+    python -m benchmarks.imports [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_PATH = os.path.join(ROOT_DIR, "tests", "fixtures", "valid_feed.xml")
+
+STATEMENTS = (
+    "import yandex_market_language",
+    "from yandex_market_language import parse",
+    "from yandex_market_language import models",
+    "from yandex_market_language.models import SimplifiedOffer",
+    "from yandex_market_language import parse; parse({0!r})".format(
+        FIXTURE_PATH
+    ),
+    "from yandex_market_language import convert, parse; "
+    "convert(\"/dev/null\", parse({0!r}))".format(FIXTURE_PATH),
+)
+
+# Prints the number of the modules loaded by the statement
+COUNT = (
+    "import sys; before = len(sys.modules); {0}; "
+    "print(len(sys.modules) - before)"
+)
+
+
+def _run(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT_DIR)
+    return time.perf_counter() - start
+
+
+def timed(code: str, runs: int) -> float:
+    return statistics.median(_run(code) for _ in range(runs))
+
+
+def main(runs: int = 20):
+    bare = timed("pass", runs)
+    print("interpreter start {0:.1f} ms (median of {1})".format(
+        bare * 1e3, runs
+    ))
+    for statement in STATEMENTS:
+        modules = subprocess.check_output(
+            [sys.executable, "-c", COUNT.format(statement)], cwd=ROOT_DIR
+        ).decode().strip()
+        print("{ms:>7.1f} ms {modules:>4} modules  {s}".format(
+            ms=(timed(statement, runs) - bare) * 1e3,
+            modules=modules,
+            s=statement.replace(FIXTURE_PATH, "feed.xml"),
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
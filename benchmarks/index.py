@@ -0,0 +1,66 @@
+"""
+Measures building and loading of the feed index and loading of the offers
+by ids against streaming the feed file.
+
+Usage:
+    python -m benchmarks.index [offers]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+from yandex_market_language import convert_stream, iter_offers, parse
+from yandex_market_language.index import FeedIndex
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    result = func()
+    print("{name:<24} {s:.4f}s".format(
+        name=name, s=time.perf_counter() - start
+    ))
+    return result
+
+
+def generate(source: list, offers: int):
+    for i in range(offers):
+        offer = source[i % len(source)]
+        offer.offer_id = str(i)
+        yield offer
+
+
+def main(offers: int = 100000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    feed = parse(FIXTURE_PATH)
+    source = feed.shop.offers
+    feed.shop.offers = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        convert_stream(path, feed, generate(source, offers))
+        ids = [str(i) for i in random.Random(0).sample(range(offers), 10)]
+
+        index = timed("build", lambda: FeedIndex.build(path))
+        index.save()
+        print("{offers} offers, feed {f:.1f} MiB, index {i:.1f} MiB".format(
+            offers=offers,
+            f=os.path.getsize(path) / 2 ** 20,
+            i=os.path.getsize(FeedIndex.sidecar_path(path)) / 2 ** 20,
+        ))
+        index = timed("load", lambda: FeedIndex.load(path))
+        timed("10 offers by index", lambda: index.offers(ids))
+        timed("10 offers by streaming", lambda: [
+            o for o in iter_offers(path) if o.offer_id in ids
+        ])
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""
+Measures the overhead of the instrumentation hooks: parses and converts
+a synthetic feed without hooks and with the metrics collected, and prints
+the collected stage timings.
+
+Usage:
+    python -m benchmarks.instrumentation [offers]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generator import generate_feed
+from yandex_market_language import convert, parse
+from yandex_market_language.instrumentation import Metrics
+
+
+def timed(name: str, func, hooks: "Metrics", repeat: int = 5):
+    """
+    Runs the function without and with the hooks in turns, so both are
+    affected by the machine load alike, and prints the best times.
+    """
+    best = [None, None]
+    for _ in range(repeat):
+        for i, h in enumerate((None, hooks)):
+            gc.collect()
+            start = time.perf_counter()
+            func(h)
+            elapsed = time.perf_counter() - start
+            best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    print("{name:<8} {a:.3f}s, with hooks {b:.3f}s, {o:+.1%} (best of {r})"
+          .format(name=name, a=best[0], b=best[1], o=best[1] / best[0] - 1,
+                  r=repeat))
+
+
+def main(offers: int = 20000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        out = os.path.join(tmp, "out.xml")
+        generate_feed(path, offers)
+        feed = parse(path)
+        metrics = Metrics()
+
+        print("{0} offers".format(offers))
+        for name, func in (
+            ("parse", lambda hooks: parse(path, hooks=hooks)),
+            ("convert", lambda hooks: convert(out, feed, hooks=hooks)),
+        ):
+            timed(name, func, metrics)
+
+    for name, labels, value in metrics.samples():
+        print("{name}{labels} {value:.6g}".format(
+            name=name,
+            labels="{" + ",".join(
+                '{0}="{1}"'.format(k, v) for k, v in labels.items()
+            ) + "}" if labels else "",
+            value=value,
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
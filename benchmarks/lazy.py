@@ -0,0 +1,38 @@
+"""
+Compares eager and lazy offer parsing for a pipeline that reads only the
+offer id and the price.
+
+Usage:
+    python -m benchmarks.lazy [offers]
+"""
+import os
+import sys
+import time
+import warnings
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.models import Shop
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def main(offers: int = 100000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    source = list(ET.parse(FIXTURE_PATH).getroot().find("shop/offers"))
+    offer_els = [source[i % len(source)] for i in range(offers)]
+
+    for name, lazy in (("eager", False), ("lazy", True)):
+        start = time.perf_counter()
+        for el in offer_els:
+            offer = Shop.offer_from_xml(el, lazy)
+            offer.offer_id, offer.price.value
+        print("{name:<6} {offers} offers: {s:.3f}s".format(
+            name=name, offers=offers, s=time.perf_counter() - start
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""
+Measures offer lookups by id, group and barcode through the offers list
+indexes against scanning the list.
+
+Usage:
+    python -m benchmarks.lookups [offers] [lookups]
+"""
+import os
+import random
+import sys
+import time
+import warnings
+
+from yandex_market_language import parse
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    result = func()
+    print("{name:<24} {s:.4f}s".format(
+        name=name, s=time.perf_counter() - start
+    ))
+    return result
+
+
+def main(offers: int = 100000, lookups: int = 200):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    shop = parse(FIXTURE_PATH).shop
+    source = shop.offers
+    shop.offers = [
+        type(o).from_xml(o.to_xml()) for o in
+        (source[i % len(source)] for i in range(offers))
+    ]
+    for i, o in enumerate(shop.offers):
+        o.offer_id = str(i)
+        o.group_id = i // 10 + 1
+    shop.offers.reindex()
+
+    rnd = random.Random(0)
+    ids = [str(rnd.randrange(offers)) for _ in range(lookups)]
+    groups = [rnd.randrange(offers // 10) + 1 for _ in range(lookups)]
+
+    timed("build id index", lambda: shop.offers.by_id)
+    timed("build group index", lambda: shop.offers.by_group(1))
+    timed("{0} ids by index".format(lookups), lambda: [
+        shop.offers.by_id[i] for i in ids
+    ])
+    timed("{0} groups by index".format(lookups), lambda: [
+        shop.offers.by_group(g) for g in groups
+    ])
+    timed("{0} ids by scan".format(lookups), lambda: [
+        next(o for o in shop.offers if o.offer_id == i) for i in ids
+    ])
+    timed("{0} groups by scan".format(lookups), lambda: [
+        [o for o in shop.offers if o.group_id == g] for g in groups
+    ])
+    timed("{0} appends".format(offers), lambda: shop.offers.extend(
+        shop.offers[:offers]
+    ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Measures random access to the offers of the memory-mapped feed file
+against streaming the file up to the offer.
+
+Usage:
+    python -m benchmarks.mapped [offers]
+"""
+import os
+import sys
+import tempfile
+import time
+import warnings
+from itertools import islice
+
+from yandex_market_language import convert_stream, iter_offers, parse
+from yandex_market_language.mapped import MappedFeed
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    func()
+    print("{name:<28} {s:.4f}s".format(
+        name=name, s=time.perf_counter() - start
+    ))
+
+
+def main(offers: int = 100000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    feed = parse(FIXTURE_PATH)
+    source = feed.shop.offers
+    feed.shop.offers = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        convert_stream(
+            path, feed, (source[i % len(source)] for i in range(offers))
+        )
+        n = offers // 2
+        print("{offers} offers, {m:.1f} MiB".format(
+            offers=offers, m=os.path.getsize(path) / 2 ** 20
+        ))
+
+        timed("stream to offer #{0}".format(n), lambda: next(
+            islice(iter_offers(path), n, None)
+        ))
+        with MappedFeed(path) as mapped_feed:
+            timed("split into 32 chunks", lambda: mapped_feed.offer_chunks(32))
+            timed("scan offer spans", lambda: len(mapped_feed))
+            timed("mapped offer #{0}".format(n), lambda: mapped_feed[n])
+            timed("mapped offers #{0}-{1}".format(n, n + 1000), lambda: (
+                mapped_feed[n:n + 1000]
+            ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
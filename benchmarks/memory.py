@@ -0,0 +1,41 @@
+"""
+Reports the memory used by the parsed offer models, in bytes per offer.
+
+Usage:
+    python -m benchmarks.memory [offers]
+"""
+import os
+import sys
+import tracemalloc
+import warnings
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.models import Shop
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def bytes_per_offer(offers: int = 10000) -> float:
+    warnings.simplefilter("ignore", DeprecationWarning)
+    source = list(ET.parse(FIXTURE_PATH).getroot().find("shop/offers"))
+    offer_els = [source[i % len(source)] for i in range(offers)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = [Shop.offer_from_xml(el) for el in offer_els]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    del parsed
+    return used / offers
+
+
+def main(offers: int = 10000):
+    print("{b:.0f} bytes per offer".format(b=bytes_per_offer(offers)))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""
+Compares the single-process parser against the parallel one.
+
+Usage:
+    python -m benchmarks.parallel [offers] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from yandex_market_language import parse, parse_offers, convert_stream
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def write_feed(path, offers: int):
+    feed = parse(FIXTURE_PATH)
+    source = feed.shop.offers
+    feed.shop.offers = []
+    convert_stream(
+        path, feed, (source[i % len(source)] for i in range(offers))
+    )
+
+
+def main(offers: int = 50000, workers: int = None):
+    workers = workers or os.cpu_count()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.xml")
+        write_feed(path, offers)
+
+        for name, func in (
+            ("parse", lambda: parse(path)),
+            ("workers={0}".format(workers), lambda: parse(path, workers)),
+            (
+                "dicts, workers={0}".format(workers),
+                lambda: parse_offers(path, workers, as_dict=True),
+            ),
+        ):
+            start = time.perf_counter()
+            func()
+            print("{name:<20} {offers} offers: {s:.3f}s".format(
+                name=name, offers=offers, s=time.perf_counter() - start
+            ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,142 @@
+"""
+Measures parsing the offer elements of a synthetic feed with the parsers
+compiled from the field metadata against the generic from_xml, which
+merges the tag mappings and looks up the element parsers for every offer.
+
+Usage:
+    python -m benchmarks.parsers [offers]
+"""
+import sys
+import time
+from collections import deque
+
+from benchmarks.serializers import generate
+from yandex_market_language.models import (
+    Age,
+    Condition,
+    Dimensions,
+    Option,
+    Parameter,
+    Price,
+)
+from yandex_market_language.models.offers import get_offer_class
+from yandex_market_language.models.schema import TEXT, get_parser
+
+# Parsers of the child elements of the generic from_xml:
+# tag -> (keyword argument, list of values flag, parser)
+ELEMENT_PARSERS = {
+    "picture": ("pictures", True, lambda el: el.text),
+    "barcode": ("barcodes", True, lambda el: el.text),
+    "param": ("parameters", True, lambda el: Parameter.from_xml(el)),
+    "delivery-options": (
+        "delivery_options", False, lambda el: [Option.from_xml(o) for o in el]
+    ),
+    "pickup-options": (
+        "pickup_options", False, lambda el: [Option.from_xml(o) for o in el]
+    ),
+    "credit-template": (
+        "credit_template_id", False, lambda el: el.attrib["id"]
+    ),
+    "dimensions": ("dimensions", False, lambda el: Dimensions.from_xml(el)),
+    "price": ("price", False, lambda el: Price.from_xml(el)),
+    "condition": ("condition", False, lambda el: Condition.from_xml(el)),
+    "age": ("age", False, lambda el: Age.from_xml(el)),
+    "supplier": ("supplier", False, lambda el: el.attrib["ogrn"]),
+}
+
+
+def tag_mapping(offer_cls) -> dict:
+    """
+    Returns the text element tags of the offer model which differ from the
+    keyword arguments, as the models declared them before XML_FIELDS.
+    """
+    return {
+        f.tag: f.name
+        for f in offer_cls.XML_FIELDS
+        if f.kind == TEXT and f.tag != f.name
+    }
+
+
+def legacy_from_xml(offer_el, **mapping) -> dict:
+    kwargs = {}
+    mapping = dict(mapping)
+
+    for el in offer_el:
+        parser = ELEMENT_PARSERS.get(el.tag)
+        if parser is None:
+            kwargs[mapping.get(el.tag, el.tag)] = el.text
+            continue
+        k, many, parse = parser
+        if many:
+            values = kwargs.get(k)
+            if values is None:
+                kwargs[k] = values = []
+            values.append(parse(el))
+        else:
+            kwargs[k] = parse(el)
+
+    for k, value in kwargs.items():
+        if type(value) is list:
+            kwargs[k] = value[:]
+
+    kwargs["offer_id"] = offer_el.attrib["id"]
+    kwargs["bid"] = offer_el.attrib.get("bid")
+    kwargs["cbid"] = offer_el.attrib.get("cbid")
+    kwargs["available"] = offer_el.attrib.get("available")
+    return kwargs
+
+
+def legacy_parse(offer_el) -> dict:
+    offer_cls = get_offer_class(offer_el.attrib.get("type"))
+    return legacy_from_xml(offer_el, **tag_mapping(offer_cls))
+
+
+def compiled_parse(offer_el) -> dict:
+    return get_parser(get_offer_class(offer_el.attrib.get("type")))(offer_el)
+
+
+def legacy_offer(offer_el):
+    offer_cls = get_offer_class(offer_el.attrib.get("type"))
+    return offer_cls(**legacy_from_xml(offer_el, **tag_mapping(offer_cls)))
+
+
+def compiled_offer(offer_el):
+    return get_offer_class(offer_el.attrib.get("type")).from_xml(offer_el)
+
+
+def timed(name: str, func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print("{name:<20} {s:.3f}s (best of {r})".format(
+        name=name, s=best, r=repeat
+    ))
+    return best
+
+
+def main(offers: int = 100000):
+    elements = [offer.to_xml() for offer in generate(offers)]
+    for el in elements[:1000]:
+        assert legacy_offer(el).to_dict() == compiled_offer(el).to_dict()
+
+    print("{0} offers".format(offers))
+    for name, legacy, compiled in (
+        ("kwargs", legacy_parse, compiled_parse),
+        ("offers", legacy_offer, compiled_offer),
+    ):
+        before = timed("generic " + name, lambda: deque(
+            map(legacy, elements), 0
+        ))
+        after = timed("compiled " + name, lambda: deque(
+            map(compiled, elements), 0
+        ))
+        print("{0:.2f} vs {1:.2f} us per offer, {2:.1f}x".format(
+            before / offers * 1e6, after / offers * 1e6, before / after
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
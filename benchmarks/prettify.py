@@ -0,0 +1,58 @@
+"""
+Compares the pretty-printing of a feed element: the previous minidom
+round-trip against the in-place indenter.
+
+Usage:
+    python -m benchmarks.prettify [offers]
+"""
+import os
+import sys
+import time
+from copy import deepcopy
+from xml.dom import minidom
+from xml.etree import ElementTree as ET
+
+from yandex_market_language import parse
+from yandex_market_language.yml import YML
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def minidom_prettify_el(el: "ET.Element") -> "ET.Element":
+    raw = ET.tostring(el, "utf-8")
+    parsed = minidom.parseString(raw)
+    prettified = parsed.toprettyxml(indent="\t")
+    return ET.fromstring(prettified)
+
+
+def build_feed_el(offers: int) -> "ET.Element":
+    feed_el = parse(FIXTURE_PATH).to_xml()
+    offers_el = feed_el.find("shop/offers")
+    source = list(offers_el)
+    offers_el[:] = [deepcopy(source[i % len(source)]) for i in range(offers)]
+    return feed_el
+
+
+def timeit(func, el: "ET.Element") -> float:
+    start = time.perf_counter()
+    func(el)
+    return time.perf_counter() - start
+
+
+def main(offers: int = 50000):
+    feed_el = build_feed_el(offers)
+    for name, func in (
+        ("minidom", minidom_prettify_el),
+        ("indent", YML.prettify_el),
+    ):
+        seconds = timeit(func, deepcopy(feed_el))
+        print("{name:<10} {offers} offers: {s:.3f}s".format(
+            name=name, offers=offers, s=seconds
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
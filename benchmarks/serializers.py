@@ -0,0 +1,232 @@
+"""
+Measures serializing the offers of a synthetic feed with the serializers
+compiled from the field metadata against the generic create_xml, which
+merges the dictionary of the text fields and looks up every attribute.
+
+Usage:
+    python -m benchmarks.serializers [offers]
+"""
+import random
+import sys
+import time
+from collections import deque
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.models import (
+    BookOffer,
+    EventTicketOffer,
+    MusicVideoOffer,
+    Option,
+    Parameter,
+    Price,
+    SimplifiedOffer,
+)
+from yandex_market_language.models.age import Age
+from yandex_market_language.models.offers import AbstractOffer
+
+# Text elements of the offer models besides the common ones, as they were
+# passed to the generic create_xml
+LEGACY_TEXT_FIELDS = {
+    SimplifiedOffer: {},
+    BookOffer: {
+        "name": "name",
+        "publisher": "publisher",
+        "ISBN": "isbn",
+        "author": "author",
+        "series": "series",
+        "year": "_year",
+        "volume": "_volume",
+        "part": "_part",
+        "language": "language",
+        "table_of_contents": "table_of_contents",
+        "binding": "binding",
+        "page_extent": "_page_extent",
+    },
+    MusicVideoOffer: {
+        "artist": "artist",
+        "title": "title",
+        "year": "_year",
+        "media": "media",
+        "starring": "starring",
+        "director": "director",
+        "originalName": "original_name",
+        "country": "country",
+    },
+    EventTicketOffer: {
+        "name": "name",
+        "place": "place",
+        "hall": "hall",
+        "hall_part": "hall_part",
+        "date": "_date",
+        "is_premiere": "_is_premiere",
+        "is_kids": "_is_kids",
+    },
+}
+
+
+def legacy_create_xml(self) -> ET.Element:
+    offer_el = ET.Element("offer", {"id": self.offer_id})
+    if self.__TYPE__:
+        offer_el.attrib["type"] = self.__TYPE__
+    if self.bid:
+        offer_el.attrib["bid"] = self.bid
+    if self.cbid:
+        offer_el.attrib["cbid"] = self.cbid
+    if self.available is not None:
+        offer_el.attrib["available"] = self._available
+    for tag, attr in {
+        "vendor": "vendor",
+        "vendorCode": "vendor_code",
+        "url": "url",
+        "oldprice": "old_price",
+        "enable_auto_discounts": "_enable_auto_discounts",
+        "currencyId": "currency",
+        "categoryId": "category_id",
+        "delivery": "_delivery",
+        "pickup": "_pickup",
+        "store": "_store",
+        "description": "description",
+        "sales_notes": "sales_notes",
+        "min-quantity": "_min_quantity",
+        "manufacturer_warranty": "_manufacturer_warranty",
+        "country_of_origin": "country_of_origin",
+        "adult": "_adult",
+        "expiry": "_expiry",
+        "weight": "_weight",
+        "downloadable": "_downloadable",
+        "group_id": "_group_id",
+        **LEGACY_TEXT_FIELDS[self.__class__],
+    }.items():
+        value = getattr(self, attr)
+        if value:
+            el = ET.SubElement(offer_el, tag)
+            el.text = value
+    self.price.to_xml(offer_el)
+    if self.pictures:
+        for url in self.pictures:
+            picture_el = ET.SubElement(offer_el, "picture")
+            picture_el.text = url
+    if self.supplier:
+        ET.SubElement(offer_el, "supplier", {"ogrn": self.supplier})
+    if self.delivery_options:
+        delivery_options_el = ET.SubElement(offer_el, "delivery-options")
+        for o in self.delivery_options:
+            o.to_xml(delivery_options_el)
+    if self.pickup_options:
+        pickup_options_el = ET.SubElement(offer_el, "pickup-options")
+        for o in self.pickup_options:
+            o.to_xml(pickup_options_el)
+    if self.barcodes:
+        for b in self.barcodes:
+            b_el = ET.SubElement(offer_el, "barcode")
+            b_el.text = b
+    if self.parameters:
+        for p in self.parameters:
+            p.to_xml(offer_el)
+    if self.condition:
+        self.condition.to_xml(offer_el)
+    if self.credit_template_id:
+        ET.SubElement(
+            offer_el, "credit-template", {"id": self.credit_template_id}
+        )
+    if self.dimensions:
+        self.dimensions.to_xml(offer_el)
+    if self.age:
+        self.age.to_xml(offer_el)
+    if self.__class__ is SimplifiedOffer:
+        name_el = ET.Element("name")
+        name_el.text = self.name
+        offer_el.insert(0, name_el)
+    return offer_el
+
+
+def generate(offers: int) -> list:
+    """
+    Returns the offers of a synthetic feed: simplified offers mostly, and
+    books, music and event tickets, with pictures, params and options.
+    """
+    rnd = random.Random(0)
+    age = Age.trusted(value="18", unit="year")
+    options = [Option.trusted(cost="300", days="1-3")]
+    result = []
+    for i in range(offers):
+        common = dict(
+            offer_id=str(i),
+            url="https://best.seller.ru/product_page.asp?pid={0}".format(i),
+            price=Price.trusted(value=str(rnd.randrange(100, 100000))),
+            currency="RUR",
+            category_id=str(rnd.randrange(1, 1000)),
+            vendor="Vendor {0}".format(i % 500),
+            description="Description of the offer {0}".format(i),
+            pictures=[
+                "https://best.seller.ru/img/{0}-{1}.jpg".format(i, n)
+                for n in range(rnd.randrange(1, 4))
+            ],
+            delivery_options=options,
+            parameters=[
+                Parameter.trusted(name="Color", value="red"),
+                Parameter.trusted(name="Size", value="42", unit="RU"),
+            ],
+            weight="{0:.2f}".format(rnd.random() * 10),
+            available="true",
+        )
+        kind = i % 10
+        if kind == 7:
+            offer = BookOffer.trusted(
+                name="Book {0}".format(i),
+                publisher="Publisher",
+                age=age,
+                isbn="978-5-94878-004-7",
+                year="2020",
+                page_extent="320",
+                **common
+            )
+        elif kind == 8:
+            offer = MusicVideoOffer.trusted(
+                title="Album {0}".format(i), artist="Artist", year="1999",
+                **common
+            )
+        elif kind == 9:
+            offer = EventTicketOffer.trusted(
+                name="Concert {0}".format(i),
+                place="Hall",
+                date="2020-10-01 19:00:00",
+                **common
+            )
+        else:
+            offer = SimplifiedOffer.trusted(
+                name="Offer {0}".format(i), **common
+            )
+        result.append(offer)
+    return result
+
+
+def timed(name: str, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print("{name:<12} {s:.2f}s".format(name=name, s=elapsed))
+    return elapsed
+
+
+def main(offers: int = 1000000):
+    data = generate(offers)
+    for offer in data[:1000]:
+        assert ET.tostring(offer.to_xml()) == ET.tostring(
+            legacy_create_xml(offer)
+        )
+
+    print("{0} offers".format(offers))
+    legacy = timed("generic", lambda: deque(
+        map(legacy_create_xml, data), 0
+    ))
+    compiled = timed("compiled", lambda: deque(
+        map(AbstractOffer.create_xml, data), 0
+    ))
+    print("{0:.2f} vs {1:.2f} us per offer, {2:.1f}x".format(
+        legacy / offers * 1e6, compiled / offers * 1e6, legacy / compiled
+    ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
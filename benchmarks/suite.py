@@ -0,0 +1,259 @@
+"""
+Benchmark suite: times parsing, converting (pretty and plain), to_dict,
+clean_dict and the round trip on the synthetic feeds of the sizes, and
+records the peak RSS of every stage. Every stage runs in its own process,
+so the peak RSS is the one of the stage alone. The other benchmark
+scripts can be run by the suite as well, their output is recorded.
+
+The results are written as JSON, and two result files, e.g. of two
+commits, are compared with --compare.
+
+Usage:
+    python -m benchmarks.suite [--sizes 10000 100000] [--out results.json]
+        [--feeds DIR] [--stages parse to_dict] [--scripts memory lookups]
+    python -m benchmarks.suite --compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from benchmarks.generator import generate_feed
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SIZES = (10000,)
+
+
+def _parse(path: str):
+    from yandex_market_language import parse
+
+    return parse(path)
+
+
+def _convert(path: str, pretty: bool):
+    from yandex_market_language import convert
+
+    feed = _parse(path)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        convert(os.path.join(tmp, "feed.xml"), feed, pretty)
+        return time.perf_counter() - start
+
+
+def _to_dict(path: str, clean: bool):
+    feed = _parse(path)
+    start = time.perf_counter()
+    feed.to_dict(clean)
+    return time.perf_counter() - start
+
+
+def _round_trip(path: str):
+    from yandex_market_language import convert, parse
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, "feed.xml")
+        start = time.perf_counter()
+        feed = parse(path)
+        convert(out, feed, False)
+        parsed = parse(out)
+        elapsed = time.perf_counter() - start
+    assert len(parsed.shop.offers) == len(feed.shop.offers)
+    return elapsed
+
+
+def _timed_parse(path: str):
+    start = time.perf_counter()
+    _parse(path)
+    return time.perf_counter() - start
+
+
+# Stages by name, every stage returns its time without the preparation
+STAGES = {
+    "parse": _timed_parse,
+    "convert_pretty": lambda path: _convert(path, True),
+    "convert_plain": lambda path: _convert(path, False),
+    "to_dict": lambda path: _to_dict(path, False),
+    "clean_dict": lambda path: _to_dict(path, True),
+    "round_trip": _round_trip,
+}
+
+
+def _run_child(args: list) -> tuple:
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=ROOT_DIR
+    )
+    out, err = proc.communicate()
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError("{0} failed:\n{1}".format(
+            " ".join(args), err.decode("utf-8", "replace")
+        ))
+    # The peak RSS of the children is the largest one of all the children
+    # waited for, the process running the command has no other children.
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    rss = usage.ru_maxrss / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+    return out.decode("utf-8"), elapsed, rss
+
+
+def _run(args: list) -> tuple:
+    """
+    Runs the command in a child process, returns its output, the time
+    and the peak RSS of the process in MB. The command is run from a
+    process of its own, so its peak RSS isn't mixed with the ones of the
+    commands run before.
+    """
+    with ProcessPoolExecutor(1) as pool:
+        return pool.submit(_run_child, args).result()
+
+
+def feed_path(directory: str, offers: int, seed: int) -> str:
+    """
+    Returns the path of the feed with the number of offers in the
+    directory, generating it unless it was generated before.
+    """
+    path = os.path.join(directory, "feed-{0}-{1}.xml".format(offers, seed))
+    if not os.path.exists(path):
+        generate_feed(path + ".tmp", offers, seed)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def run_stage(stage: str, path: str, offers: int) -> dict:
+    out, _, rss = _run([
+        sys.executable, "-m", "benchmarks.suite", "--stage", stage, path
+    ])
+    result = dict(
+        offers=offers,
+        stage=stage,
+        seconds=json.loads(out)["seconds"],
+        peak_rss_mb=round(rss, 1),
+        feed_mb=round(os.path.getsize(path) / 2 ** 20, 1),
+    )
+    print(
+        "{offers:>9} {stage:<16} {seconds:>9.3f}s {peak_rss_mb:>9.1f} MB"
+        .format(**result)
+    )
+    return result
+
+
+def run_script(name: str) -> dict:
+    out, elapsed, rss = _run([sys.executable, "-m", "benchmarks." + name])
+    print("{name:<26} {s:>9.3f}s {rss:>9.1f} MB".format(
+        name=name, s=elapsed, rss=rss
+    ))
+    return dict(
+        script=name,
+        seconds=round(elapsed, 3),
+        peak_rss_mb=round(rss, 1),
+        output=out.splitlines(),
+    )
+
+
+def _commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    sizes=SIZES,
+    stages=tuple(STAGES),
+    scripts=(),
+    feeds: str = None,
+    seed: int = 0,
+) -> dict:
+    meta = dict(
+        commit=_commit(),
+        date=datetime.now().replace(microsecond=0).isoformat(),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        seed=seed,
+    )
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = feeds or tmp
+        for offers in sizes:
+            path = feed_path(directory, offers, seed)
+            for stage in stages:
+                results.append(run_stage(stage, path, offers))
+    return dict(
+        meta=meta,
+        results=results,
+        scripts=[run_script(name) for name in scripts],
+    )
+
+
+def compare(before: dict, after: dict):
+    """
+    Prints the times and the peak RSS of the stages of two runs.
+    """
+    old = {(r["offers"], r["stage"]): r for r in before["results"]}
+    print("{0} -> {1}".format(
+        before["meta"]["commit"], after["meta"]["commit"]
+    ))
+    for r in after["results"]:
+        o = old.get((r["offers"], r["stage"]))
+        if o is None:
+            continue
+        print(
+            "{offers:>9} {stage:<16} {a:>9.3f}s {b:>9.3f}s {t:>+7.1%} "
+            "{ra:>8.1f} MB {rb:>8.1f} MB".format(
+                offers=r["offers"],
+                stage=r["stage"],
+                a=o["seconds"],
+                b=r["seconds"],
+                t=r["seconds"] / o["seconds"] - 1,
+                ra=o["peak_rss_mb"],
+                rb=r["peak_rss_mb"],
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument(
+        "--stages", nargs="+", choices=tuple(STAGES), default=tuple(STAGES)
+    )
+    parser.add_argument("--scripts", nargs="+", default=())
+    parser.add_argument("--feeds", help="directory keeping generated feeds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="JSON file of the results")
+    parser.add_argument("--compare", nargs=2, metavar="JSON")
+    parser.add_argument("--stage", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.stage:
+        # Runs a single stage in the child process
+        stage, path = args.stage
+        print(json.dumps(dict(seconds=round(STAGES[stage](path), 4))))
+        return
+
+    if args.compare:
+        with open(args.compare[0]) as a, open(args.compare[1]) as b:
+            compare(json.load(a), json.load(b))
+        return
+
+    results = run(args.sizes, args.stages, args.scripts, args.feeds, args.seed)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the memory and the price filter latency of the list of offer
+models and the columnar OfferTable.
+
+Usage:
+    python -m benchmarks.table [offers]
+"""
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.models import Shop
+from yandex_market_language.table import OfferTable
+
+
+FIXTURE_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "fixtures", "valid_feed.xml"
+)
+
+
+def traced(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, used
+
+
+def timed(func, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(offers: int = 100000):
+    warnings.simplefilter("ignore", DeprecationWarning)
+    source = list(ET.parse(FIXTURE_PATH).getroot().find("shop/offers"))
+    offer_els = [source[i % len(source)] for i in range(offers)]
+
+    models, models_size = traced(
+        lambda: [Shop.offer_from_xml(el) for el in offer_els]
+    )
+    # Only the arrays, the table keeps the models as the source
+    table, _ = traced(lambda: OfferTable.from_offers(models))
+    _, table_size = traced(lambda: OfferTable.from_offers(
+        (Shop.offer_from_xml(el, lazy=True) for el in offer_els)
+    ))
+
+    models_time = timed(lambda: [o for o in models if o.price.value < 1000])
+    mask_time = timed(lambda: table.price < 1000)
+    table_time = timed(lambda: table[table.price < 1000])
+
+    print("{offers} offers".format(offers=offers))
+    print("memory: models {m:.1f} MiB, table {t:.1f} MiB".format(
+        m=models_size / 2 ** 20, t=table_size / 2 ** 20
+    ))
+    print("filter: models {m:.4f}s, table {t:.4f}s, mask {k:.5f}s".format(
+        m=models_time, t=table_time, k=mask_time
+    ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
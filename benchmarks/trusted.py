@@ -0,0 +1,81 @@
+"""
+Measures creating offers with the constructor, which validates every field
+in the setters, against trusted(), which writes the stored values as is.
+
+Usage:
+    python -m benchmarks.trusted [offers]
+"""
+import gc
+import random
+import sys
+import time
+
+from yandex_market_language.models import Price, SimplifiedOffer
+
+
+def timed(name: str, func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        # The garbage collector is off, as in timeit, so it doesn't add
+        # the same pauses to both ways of creating the offers
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    print("{name:<20} {s:.4f}s (best of {r})".format(
+        name=name, s=best, r=repeat
+    ))
+    return best, result
+
+
+def rows(offers: int) -> list:
+    rnd = random.Random(0)
+    return [
+        dict(
+            offer_id=str(i),
+            url="https://best.seller.ru/product_page.asp?pid={0}".format(i),
+            price=str(rnd.randrange(100, 100000)),
+            currency="RUR",
+            category_id=str(rnd.randrange(1, 1000)),
+            name="Offer {0}".format(i),
+            weight="{0:.2f}".format(rnd.random() * 10),
+            min_quantity=str(rnd.randrange(1, 10)),
+            delivery="true",
+            pickup="false",
+            available="true",
+        )
+        for i in range(offers)
+    ]
+
+
+def construct(data: list) -> list:
+    return [
+        SimplifiedOffer(price=Price(price), **fields)
+        for price, fields in data
+    ]
+
+
+def construct_trusted(data: list) -> list:
+    trusted = SimplifiedOffer.trusted
+    price_trusted = Price.trusted
+    return [
+        trusted(price=price_trusted(value=price), **fields)
+        for price, fields in data
+    ]
+
+
+def main(offers: int = 100000):
+    data = [(row.pop("price"), row) for row in rows(offers)]
+    print("{0} offers".format(offers))
+    init, expected = timed("__init__", lambda: construct(data))
+    trusted, result = timed("trusted", lambda: construct_trusted(data))
+    assert [o.to_dict() for o in result] == [o.to_dict() for o in expected]
+    print("speedup {0:.1f}x".format(init / trusted))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
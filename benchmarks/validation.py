@@ -0,0 +1,123 @@
+"""
+Measures the batch validation of price, weight and min_quantity columns
+against validating every value in the model setters, and the setters
+taking the prevalidated values.
+
+Usage:
+    python -m benchmarks.validation [values]
+"""
+import random
+import sys
+import time
+
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.models.abstract import AbstractModel
+from yandex_market_language.models.feed import DATE_FORMAT
+from yandex_market_language.validation import (
+    validate_columns,
+    validate_datetimes,
+    validate_ints,
+)
+
+
+def timed(name: str, func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print("{name:<28} {s:.4f}s (best of {r})".format(
+        name=name, s=best, r=repeat
+    ))
+    return result
+
+
+def per_object(columns: dict) -> dict:
+    checks = {
+        "price": lambda v: AbstractModel._is_valid_float(v, "price"),
+        "weight": lambda v: AbstractModel._is_valid_float(v, "weight", True),
+        "min_quantity": lambda v: AbstractModel._is_valid_int(
+            v, "min_quantity", True
+        ),
+    }
+    errors = {}
+    for name, values in columns.items():
+        check = checks[name]
+        errors[name] = []
+        for i, v in enumerate(values):
+            try:
+                check(v)
+            except ValidationError:
+                errors[name].append(i)
+    return errors
+
+
+def run(values: int, invalid: float):
+    rnd = random.Random(0)
+
+    def value(valid: str) -> str:
+        return valid if rnd.random() >= invalid else "n/a"
+
+    columns = {
+        "price": [
+            value(str(rnd.randrange(100, 100000))) for _ in range(values)
+        ],
+        "weight": [
+            value("{0:.2f}".format(rnd.random() * 10)) for _ in range(values)
+        ],
+        "min_quantity": [
+            value(str(rnd.randrange(1, 10))) for _ in range(values)
+        ],
+    }
+
+    print("{n} values of 3 columns, {p:.0%} invalid".format(
+        n=values, p=invalid
+    ))
+    errors = timed("per object", lambda: per_object(columns))
+    results = timed("batch", lambda: validate_columns(columns))
+    for name, result in results.items():
+        assert list(result.errors) == errors[name]
+    return results
+
+
+def main(values: int = 200000):
+    run(values, 0)
+    results = run(values, 0.01)
+
+    prices = [
+        v for v, valid in zip(results["price"].values, results["price"].mask)
+        if valid
+    ]
+    dates = ["2020-01-{0:02d} 10:00".format(i % 28 + 1) for i in range(values)]
+    validated_dates = validate_datetimes(dates, DATE_FORMAT).values
+    ints = [str(i) for i in range(values)]
+    validated_ints = validate_ints(ints).values
+    for name, helper, raw, validated in (
+        (
+            "datetime",
+            lambda v: AbstractModel._is_valid_datetime(v, DATE_FORMAT, "a"),
+            dates,
+            validated_dates,
+        ),
+        (
+            "int",
+            lambda v: AbstractModel._is_valid_int(v, "a"),
+            ints,
+            validated_ints,
+        ),
+        (
+            "float",
+            lambda v: AbstractModel._is_valid_float(v, "a"),
+            [str(v) for v in prices],
+            prices,
+        ),
+    ):
+        timed("{0} setter, raw".format(name), lambda: list(map(helper, raw)))
+        timed("{0} setter, validated".format(name), lambda: list(
+            map(helper, validated)
+        ))
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""
+Compares writing a feed from the offer dictionaries (JSON lines, as the
+ones of parse_to_jsonl) through the offer models, creating all of them or
+streaming them, with dicts_to_yml writing them without the models. Every
+way runs in its own process, which reports its time and peak RSS.
+
+Usage:
+    python -m benchmarks.writer [offers]
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.dicts import digest, timed
+from benchmarks.generator import generate_feed
+
+# Prepares the header and the offers dictionaries of the feed, the feed
+# date is kept in its XML form
+PREPARE = (
+    "import json; "
+    "from yandex_market_language import parse_header, parse_to_jsonl; "
+    "parse_to_jsonl({path!r}, {offers!r}); "
+    "header = parse_header({path!r}); "
+    "json.dump(dict(header.to_dict(), date=header._date), "
+    "open({header!r}, 'w'), default=str)"
+)
+
+# Loads the header as feed and opens the offers lines
+LOAD = (
+    "import json; from yandex_market_language.models import Feed; "
+    "from yandex_market_language.models.offers import AbstractOffer; "
+    "feed = json.load(open({header!r})); "
+    "lines = open({offers!r}, encoding='utf-8'); "
+)
+
+# Export code by name, formatted with the paths
+WAYS = (
+    ("from_dict + convert", LOAD + (
+        "from yandex_market_language import convert; "
+        "feed['shop']['offers'] = [json.loads(line) for line in lines]; "
+        "convert({out!r}, Feed.from_dict(feed))"
+    )),
+    ("from_dict + stream", LOAD + (
+        "from yandex_market_language import convert_stream; "
+        "convert_stream({out!r}, Feed.from_dict(feed), "
+        "(AbstractOffer.from_dict(json.loads(line)) for line in lines))"
+    )),
+    ("dicts_to_yml", LOAD + (
+        "from yandex_market_language import dicts_to_yml; "
+        "dicts_to_yml(feed['shop'], (json.loads(line) for line in lines), "
+        "{out!r}, date=feed['date'])"
+    )),
+)
+
+
+def main(offers: int = 20000):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = dict(
+            path=os.path.join(tmp, "feed.xml"),
+            offers=os.path.join(tmp, "offers.jsonl"),
+            header=os.path.join(tmp, "header.json"),
+        )
+        generate_feed(paths["path"], offers)
+        timed(PREPARE.format(**paths))
+        print("{0} offers, {1:.1f} MB of JSON lines".format(
+            offers, os.path.getsize(paths["offers"]) / 2 ** 20
+        ))
+
+        outputs = []
+        for i, (name, code) in enumerate(WAYS):
+            out = os.path.join(tmp, "feed{0}.xml".format(i))
+            elapsed, rss = timed(code.format(out=out, **paths))
+            print("{name:<22} {s:>8.3f}s {rss:>8.1f} MB".format(
+                name=name, s=elapsed, rss=rss
+            ))
+            outputs.append(digest(out))
+        assert len(set(outputs)) == 1, "outputs differ"
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -12,6 +12,8 @@ with open('HISTORY.rst') as history_file:
 
 requirements = []
 
+extras_requirements = {'table': ['numpy']}
+
 setup_requirements = ['pytest-runner']
 
 test_requirements = ['pytest>=3', 'faker==4.0.2']
@@ -33,6 +35,7 @@ setup(
     ],
     description="Yandex Market Language for Python provides user-friendly interface for parsing or creating XML files.",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT",
     long_description=readme + '\n\n' + history,
     include_package_data=True,
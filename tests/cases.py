@@ -1,3 +1,7 @@
+import os
+import shutil
+import tempfile
+import warnings
 from operator import attrgetter
 from unittest import TestCase
 from xml.etree import ElementTree as ET
@@ -5,6 +9,30 @@ from faker import Faker
 
 fake = Faker()
 
+BASE_DIR = os.path.dirname(__file__)
+VALID_XML_PATH = os.path.join(BASE_DIR, "fixtures/valid_feed.xml")
+
+
+def hide_offers(data: bytes) -> bytes:
+    """
+    Adds offer tags which aren't elements to the feed data: a commented-out
+    copy of the first offer with the id prefixed with "X", and the tags in
+    a processing instruction and in a CDATA section of a description.
+    """
+    start = data.index(b"<offer ")
+    end = data.index(b"</offer>", start) + len(b"</offer>")
+    offer = data[start:end].replace(b' id="', b' id="X', 1)
+    data = data.replace(
+        b"<offers>",
+        b"<offers><!-- " + offer + b' --><?note <offer id="Y1"/> ?>',
+        1,
+    )
+    return data.replace(
+        b"</description>",
+        b'<![CDATA[</offer><offer id="Y2">]]></description>',
+        1,
+    )
+
 
 class ModelTestCase(TestCase):
     def assertElementsEquals(self, el, expected_el):
@@ -14,3 +42,19 @@ class ModelTestCase(TestCase):
 
         # Check if elements are equal
         self.assertEqual(ET.tostring(el), ET.tostring(expected_el))
+
+
+class FeedTestCase(TestCase):
+    """
+    Test case of the feed files: the DeprecationWarning of the parser is
+    ignored only for the test, and tmp is a temporary directory removed
+    after the test.
+    """
+    def setUp(self):
+        catcher = warnings.catch_warnings()
+        catcher.__enter__()
+        self.addCleanup(catcher.__exit__, None, None, None)
+        warnings.simplefilter("ignore", DeprecationWarning)
+
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
@@ -0,0 +1,207 @@
+import pickle
+from unittest import TestCase
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import parse
+from yandex_market_language.models import Category, Product, Promo, Purchase
+from yandex_market_language.models.indexes import (
+    CategoryIndex,
+    OfferList,
+    VersionedList,
+)
+
+
+def ids(models) -> list:
+    return [m.category_id for m in models]
+
+
+class VersionedListTestCase(TestCase):
+    def test_version(self):
+        items = VersionedList([3, 1, 2])
+        self.assertEqual(items.version, 0)
+        items.append(4)
+        items.extend([5])
+        items[0] = 0
+        del items[0]
+        items += [6]
+        items.sort()
+        items.pop()
+        self.assertEqual(items.version, 7)
+        self.assertEqual(items, [1, 2, 4, 5])
+
+    def test_pickle(self):
+        items = pickle.loads(pickle.dumps(VersionedList([1, 2])))
+        self.assertIsInstance(items, VersionedList)
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(items.version, 0)
+
+
+class CategoryIndexTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.shop = parse(VALID_XML_PATH).shop
+
+    def test_tree(self):
+        index = self.shop.category_index
+        self.assertEqual(len(index), 7)
+        self.assertEqual(index.roots, ["1", "4", "6", "7"])
+        self.assertEqual(index.children["1"], ["2", "3"])
+        self.assertEqual(index.depth["5"], 1)
+        self.assertEqual(index.node(3).name, "Боевики")
+        self.assertEqual(ids(index.ancestors("5")), ["4"])
+        self.assertEqual(ids(index.descendants("1")), ["2", "3"])
+        self.assertTrue(index.is_descendant("2", "1"))
+        self.assertTrue(index.is_descendant("1", "1"))
+        self.assertFalse(index.is_descendant("1", "2"))
+        self.assertFalse(index.is_descendant("5", "1"))
+        self.assertFalse(index.is_descendant("100", "1"))
+
+    def test_cycle(self):
+        index = CategoryIndex([
+            Category("1", "A", "3"),
+            Category("2", "B", "1"),
+            Category("3", "C", "2"),
+            Category("4", "D", "4"),
+        ])
+        self.assertEqual(index.roots, ["4"])
+        self.assertEqual(len(index.order), 4)
+        self.assertEqual(ids(index.ancestors("3")), ["2", "1"])
+        self.assertIsNone(index.parent("1"))
+        self.assertTrue(index.is_descendant("3", "1"))
+
+    def test_offers_in_category(self):
+        offers = self.shop.offers
+        self.assertEqual(
+            self.shop.offers_in_category("3", recursive=False),
+            [o for o in offers if o.category_id == "3"],
+        )
+        self.assertEqual(
+            self.shop.offers_in_category("1"),
+            [o for o in offers if o.category_id in ("1", "2", "3")],
+        )
+        self.assertEqual(self.shop.offers_in_category("100"), [])
+        self.assertEqual(
+            self.shop.offers_in_category("101", recursive=False),
+            [o for o in offers if o.category_id == "101"],
+        )
+
+        # Changing the result doesn't change the cached offers
+        self.shop.offers_in_category("1").clear()
+        self.assertEqual(
+            self.shop.offers_in_category("1"),
+            [o for o in offers if o.category_id in ("1", "2", "3")],
+        )
+
+    def test_invalidation(self):
+        index = self.shop.category_index
+        self.assertIs(self.shop.category_index, index)
+
+        self.shop.categories.append(Category("8", "Детские", "2"))
+        index = self.shop.category_index
+        self.assertEqual(ids(index.ancestors("8")), ["2", "1"])
+
+        offer = self.shop.offers.pop()
+        self.assertIsNot(self.shop.category_index, index)
+        self.assertNotIn(offer, self.shop.offers_in_category("1"))
+
+        index = self.shop.category_index
+        self.shop.categories = [Category("1", "Книги")]
+        self.assertIsNot(self.shop.category_index, index)
+        self.assertEqual(len(self.shop.category_index), 1)
+
+
+class OfferListTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.shop = parse(VALID_XML_PATH).shop
+        self.offers = list(self.shop.offers)
+        self.offers[0].group_id = 12
+        self.offers[1].group_id = 12
+
+    def test_setter(self):
+        self.shop.offers = self.offers
+        self.assertIsNot(self.shop.offers, self.offers)
+        self.offers.pop()
+        self.assertEqual(len(self.shop.offers), len(self.offers) + 1)
+
+        offers = OfferList(self.offers)
+        self.shop.offers = offers
+        self.assertIs(self.shop.offers, offers)
+
+        categories = VersionedList(self.shop.categories)
+        self.shop.categories = categories
+        self.assertIs(self.shop.categories, categories)
+
+    def test_lookups(self):
+        offers = self.shop.offers
+        self.assertIsInstance(offers, OfferList)
+        self.assertIs(offers.by_id["1511AB"], self.offers[0])
+        self.assertEqual(len(offers.by_id), len(self.offers))
+        self.assertIn("A1VV", offers.by_id)
+        self.assertIsNone(offers.by_id.get("missing"))
+        self.assertEqual(offers.by_group(12), self.offers[:2])
+        self.assertEqual(offers.by_group(13), [])
+        self.assertEqual(offers.by_vendor("Brother"), [self.offers[0]])
+        self.assertEqual(offers.by_vendor_code("A1234567B"), [self.offers[1]])
+        self.assertEqual(
+            offers.by_barcode("9876543210"),
+            [o for o in self.offers if "9876543210" in (o.barcodes or ())],
+        )
+        self.assertEqual(offers.duplicates(), {})
+
+    def test_incremental(self):
+        offers = self.shop.offers
+        offers.by_id
+        offers.by_group(12)
+
+        offers.append(self.offers[0])
+        self.assertEqual(offers.duplicates(), {"1511AB": self.offers[:1] * 2})
+        self.assertEqual(
+            offers.by_group(12), self.offers[:2] + self.offers[:1]
+        )
+
+        offers.pop()
+        self.assertEqual(offers.duplicates(), {})
+        offers.remove(self.offers[1])
+        self.assertEqual(offers.by_group(12), self.offers[:1])
+        self.assertNotIn("A1VV", offers.by_id)
+
+        del offers[:2]
+        self.assertNotIn("1511AB", offers.by_id)
+        offers[0] = self.offers[1]
+        self.assertIs(offers.by_id["A1VV"], self.offers[1])
+        self.assertNotIn(self.offers[3].offer_id, offers.by_id)
+
+        offers += self.offers[:1]
+        self.assertEqual(offers.by_group(12), self.offers[1::-1])
+
+        offers.clear()
+        self.assertEqual(len(offers.by_id), 0)
+
+    def test_remove_changed_offer(self):
+        offers = self.shop.offers
+        offers.by_id
+        offers.by_group(12)
+
+        # The offer is indexed by its previous id
+        self.offers[0].offer_id = "changed"
+        offers.remove(self.offers[0])
+        self.assertEqual(list(offers), self.offers[1:])
+        self.assertNotIn("1511AB", offers.by_id)
+        self.assertNotIn("changed", offers.by_id)
+        self.assertEqual(len(offers.by_id), len(self.offers) - 1)
+        self.assertEqual(offers.by_group(12), self.offers[1:2])
+
+    def test_promo_offers(self):
+        promo = Promo("1", "gift", Purchase([
+            Product(offer_id="1511AB"),
+            Product(category_id="1"),
+            Product(offer_id="missing"),
+        ]), [])
+        self.assertEqual(
+            self.shop.promo_offers(promo),
+            self.offers[:1] + [
+                o for o in self.offers[1:]
+                if o.category_id in ("1", "2", "3")
+            ],
+        )
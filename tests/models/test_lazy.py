@@ -0,0 +1,121 @@
+from unittest import mock
+
+from tests.cases import ModelTestCase, ET, VALID_XML_PATH
+from tests.factories import BookOfferFactory, SimplifiedOfferFactory
+from yandex_market_language import models, parse
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.models.schema import REFERENCE, TEXTS, Field
+
+
+class NotedOffer(models.SimplifiedOffer):
+    __TYPE__ = "noted"
+
+    XML_FIELDS = (
+        *models.SimplifiedOffer.XML_FIELDS,
+        Field("note", "offerNote"),
+        Field("labels", "label", TEXTS),
+        Field("source", kind=REFERENCE, attribute="href"),
+    )
+
+    __slots__ = ["note", "labels", "source"]
+
+    def __init__(self, note=None, labels=None, source=None, **kwargs):
+        super().__init__(**kwargs)
+        self.note = note
+        self.labels = labels
+        self.source = source
+
+
+def to_dict(value):
+    if isinstance(value, list):
+        return [to_dict(v) for v in value]
+    return value.to_dict() if hasattr(value, "to_dict") else value
+
+
+class LazyOfferTestCase(ModelTestCase):
+    def setUp(self):
+        root = ET.parse(VALID_XML_PATH).getroot()
+        self.offer_els = list(root.find("shop/offers"))
+
+    def test_fields(self):
+        for el in self.offer_els:
+            offer = models.Shop.offer_from_xml(el)
+            lazy_offer = models.LazyOffer(el)
+            self.assertIs(lazy_offer.offer_cls, type(offer))
+            for name in type(offer).init_fields():
+                self.assertEqual(
+                    to_dict(getattr(lazy_offer, name)),
+                    to_dict(getattr(offer, name)),
+                )
+            self.assertEqual(lazy_offer.to_dict(), offer.to_dict())
+
+    def test_fields_of_registered_type(self):
+        models.register_offer_type(NotedOffer)
+        self.addCleanup(models.OFFER_TYPES.pop, "noted")
+
+        el = SimplifiedOfferFactory().create().to_xml()
+        el.set("type", "noted")
+        for tag, attrib, text in (
+            ("offerNote", {}, "first"),
+            ("label", {}, "a"),
+            ("source", {"href": "https://example.com"}, None),
+            ("label", {}, "b"),
+            ("offerNote", {}, "last"),
+        ):
+            ET.SubElement(el, tag, attrib).text = text
+
+        offer = models.Shop.offer_from_xml(el)
+        lazy_offer = models.LazyOffer(el)
+        self.assertIs(lazy_offer.offer_cls, NotedOffer)
+        for name in NotedOffer.init_fields():
+            self.assertEqual(
+                to_dict(getattr(lazy_offer, name)),
+                to_dict(getattr(offer, name)),
+                name,
+            )
+        self.assertEqual(
+            (lazy_offer.note, lazy_offer.labels, lazy_offer.source),
+            ("last", ["a", "b"], "https://example.com"),
+        )
+
+    def test_decodes_only_read_fields(self):
+        lazy_offer = models.LazyOffer(self.offer_els[0])
+
+        with mock.patch(
+            "yandex_market_language.models.Price.from_xml"
+        ) as price_p:
+            self.assertEqual(lazy_offer.offer_id, "1511AB")
+            self.assertEqual(price_p.call_count, 0)
+
+        with mock.patch(
+            "yandex_market_language.models.Parameter.from_xml"
+        ) as parameter_p:
+            self.assertEqual(lazy_offer.price.value, 80990.0)
+            self.assertIs(lazy_offer.price, lazy_offer.price)
+            self.assertEqual(parameter_p.call_count, 0)
+        self.assertIsNone(lazy_offer._offer)
+
+    def test_validates_on_read(self):
+        el = BookOfferFactory().create().to_xml()
+        el.find("weight").text = "heavy"
+        lazy_offer = models.LazyOffer(el)
+        self.assertEqual(lazy_offer.name, el.find("name").text)
+        with self.assertRaises(ValidationError):
+            lazy_offer.weight
+        with self.assertRaises(ValidationError):
+            lazy_offer.to_dict()
+
+    def test_setattr_materializes_offer(self):
+        lazy_offer = models.LazyOffer(self.offer_els[0])
+        lazy_offer.weight = 5
+        self.assertIsInstance(lazy_offer.materialize(), models.SimplifiedOffer)
+        self.assertEqual(lazy_offer.weight, 5.0)
+        self.assertEqual(lazy_offer.to_xml().find("weight").text, "5")
+
+    def test_parse_lazy(self):
+        feed = parse(VALID_XML_PATH)
+        lazy_feed = parse(VALID_XML_PATH, lazy=True)
+        self.assertTrue(
+            all(isinstance(o, models.LazyOffer) for o in lazy_feed.shop.offers)
+        )
+        self.assertEqual(lazy_feed.to_dict(), feed.to_dict())
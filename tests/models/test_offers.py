@@ -12,7 +12,7 @@ from tests.factories import (
     MusicVideoOfferFactory,
     MedicineOfferFactory, EventTicketOfferFactory, AlcoholOfferFactory)
 from yandex_market_language import models
-from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.exceptions import ParseError, ValidationError
 from yandex_market_language.models.offers import (
     AbstractOffer,
     SimplifiedOffer,
@@ -31,10 +31,44 @@ class BaseOfferModelTestCase(ModelTestCase):
 
     def test_to_xml_offer_type(self):
         o = AbstractOfferFactory().create()
-        o.__TYPE__ = "test"
-        el = o.to_xml()
+        with mock.patch.object(AbstractOffer, "__TYPE__", "test"):
+            el = o.to_xml()
         self.assertEqual(el.attrib["type"], "test")
 
+    def test_slots(self):
+        factories = [
+            SimplifiedOfferFactory,
+            ArbitraryOfferFactory,
+            BookOfferFactory,
+            AudioBookOfferFactory,
+            MusicVideoOfferFactory,
+            MedicineOfferFactory,
+            EventTicketOfferFactory,
+            AlcoholOfferFactory,
+        ]
+        for factory in factories:
+            o = factory().create()
+            self.assertFalse(hasattr(o, "__dict__"), type(o).__name__)
+            for slot in type(o).__slots__:
+                self.assertEqual(
+                    [c for c in type(o).__mro__[1:]
+                     if slot in getattr(c, "__slots__", ())],
+                    [],
+                    "{0}.{1}".format(type(o).__name__, slot)
+                )
+
+    def test_digest(self):
+        o = SimplifiedOfferFactory().create()
+        digest = o.digest()
+        self.assertIsInstance(digest, bytes)
+        self.assertEqual(len(digest), 16)
+
+        parsed = SimplifiedOffer.from_xml(o.to_xml())
+        self.assertEqual(parsed.digest(), digest)
+
+        o.price.value = o.price.value + 1
+        self.assertNotEqual(o.digest(), digest)
+
     def test_to_xml_available_attr(self):
         o = AbstractOfferFactory(available=False).create()
         el = o.create_xml()
@@ -560,3 +594,49 @@ class AlcoholOfferTestCase(ModelTestCase):
         d = o.to_dict()
         self.assertTrue(all(k in d for k in ("name",)))
         self.assertEqual(d["name"], o.name)
+
+
+class OfferTypesRegistryTestCase(ModelTestCase):
+    def test_get_offer_class(self):
+        for offer_cls in (
+            SimplifiedOffer,
+            ArbitraryOffer,
+            BookOffer,
+            AudioBookOffer,
+            MusicVideoOffer,
+            MedicineOffer,
+            EventTicketOffer,
+            AlcoholOffer,
+        ):
+            self.assertIs(
+                models.get_offer_class(offer_cls.__TYPE__), offer_cls
+            )
+
+    def test_get_offer_class_unexpected_type(self):
+        with self.assertRaises(ParseError) as e:
+            models.get_offer_class("error")
+        self.assertEqual(str(e.exception), "Got unexpected offer type: error")
+
+    def test_register_offer_type(self):
+        class CustomOffer(SimplifiedOffer):
+            __TYPE__ = "custom"
+
+        class CustomSimplifiedOffer(SimplifiedOffer):
+            pass
+
+        o = SimplifiedOfferFactory().create()
+        el = o.to_xml()
+        try:
+            models.register_offer_type(CustomOffer)
+            models.register_offer_type(CustomSimplifiedOffer)
+            parsed = models.Shop.offer_from_xml(el)
+            self.assertIsInstance(parsed, CustomSimplifiedOffer)
+            self.assertEqual(parsed.to_dict(), o.to_dict())
+
+            el.attrib["type"] = "custom"
+            self.assertIsInstance(
+                models.Shop.offer_from_xml(el), CustomOffer
+            )
+        finally:
+            del models.OFFER_TYPES["custom"]
+            models.register_offer_type(SimplifiedOffer)
@@ -0,0 +1,145 @@
+from unittest import TestCase
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from tests.factories import BookOfferFactory, SimplifiedOfferFactory
+from yandex_market_language import parse
+from yandex_market_language.models import Price
+from yandex_market_language.models.offers import (
+    AbstractOffer,
+    AudioBookOffer,
+    SimplifiedOffer,
+)
+from yandex_market_language.models.schema import (
+    ATTRIBUTE,
+    Field,
+    get_parser,
+    get_serializer,
+)
+
+
+class TaggedOffer(SimplifiedOffer):
+    __TYPE__ = "tagged"
+
+    XML_FIELDS = (
+        *SimplifiedOffer.XML_FIELDS,
+        Field("tag", "offerTag", ATTRIBUTE),
+        Field("note"),
+    )
+
+    __slots__ = ["tag", "note"]
+
+    def __init__(self, tag=None, note=None, **kwargs):
+        super().__init__(**kwargs)
+        self.tag = tag
+        self.note = note
+
+
+def tags(el) -> list:
+    return [child.tag for child in el]
+
+
+class SchemaTestCase(TestCase):
+    def test_serializer_cache(self):
+        serializer = get_serializer(SimplifiedOffer)
+        self.assertIs(get_serializer(SimplifiedOffer), serializer)
+        self.assertIsNot(get_serializer(TaggedOffer), serializer)
+        self.assertEqual(serializer.__qualname__, "SimplifiedOffer.create_xml")
+
+    def test_order(self):
+        el = SimplifiedOfferFactory().create().to_xml()
+        self.assertEqual(tags(el)[0], "name")
+        self.assertLess(tags(el).index("description"), tags(el).index("price"))
+
+        book_el = BookOfferFactory().create().to_xml()
+        self.assertLess(
+            tags(book_el).index("binding"), tags(book_el).index("price")
+        )
+        self.assertEqual(book_el.attrib["type"], "book")
+
+    def test_required_fields(self):
+        offer = SimplifiedOffer.trusted(
+            name=None,
+            offer_id="1",
+            url="https://example.shop/1",
+            price=Price.trusted(value="10"),
+            currency="RUR",
+            category_id="2",
+        )
+        el = offer.to_xml()
+        self.assertEqual(tags(el)[0], "name")
+        self.assertIsNone(el.find("name").text)
+        self.assertEqual(el.find("price").text, "10")
+        self.assertNotIn("bid", el.attrib)
+
+    def test_subclass_fields(self):
+        offer = TaggedOffer(
+            tag="sale",
+            note="Last items",
+            name="Offer",
+            offer_id="1",
+            url="https://example.shop/1",
+            price=Price("10"),
+            currency="RUR",
+            category_id="2",
+        )
+        el = offer.to_xml()
+        self.assertEqual(el.attrib["type"], "tagged")
+        self.assertEqual(el.attrib["offerTag"], "sale")
+        self.assertEqual(tags(el)[-1], "note")
+        self.assertEqual(el.find("note").text, "Last items")
+
+    def test_extra_text_fields(self):
+        offer = SimplifiedOfferFactory().create()
+        offer.description = "Description"
+        el = offer.create_xml(remark="description")
+        children = tags(el)
+        self.assertEqual(children.count("description"), 1)
+        self.assertEqual(children.index("remark"), children.index("price") - 1)
+        self.assertEqual(el.find("remark").text, "Description")
+
+    def test_invalid_kind(self):
+        with self.assertRaises(ValueError):
+            Field("name", kind="unknown")
+
+
+class ParserTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+
+    def test_round_trip(self):
+        for offer in parse(VALID_XML_PATH).shop.offers:
+            parsed = type(offer).from_xml(offer.to_xml())
+            self.assertEqual(parsed.to_dict(), offer.to_dict())
+
+        offer = TaggedOffer.from_xml(TaggedOffer(
+            tag="sale",
+            note="Last items",
+            name="Offer",
+            offer_id="1",
+            url="https://example.shop/1",
+            price=Price("10"),
+            currency="RUR",
+            category_id="2",
+            pictures=["https://example.shop/1.jpg"],
+        ).to_xml())
+        self.assertEqual((offer.tag, offer.note), ("sale", "Last items"))
+        self.assertEqual(offer.pictures, ["https://example.shop/1.jpg"])
+
+    def test_parser_cache(self):
+        parser = get_parser(AudioBookOffer)
+        self.assertIs(get_parser(AudioBookOffer), parser)
+        self.assertEqual(parser.__qualname__, "AudioBookOffer.from_xml")
+
+    def test_mapping(self):
+        el = SimplifiedOfferFactory().create().to_xml()
+        el.find("vendor").tag = "brand"
+        kwargs = AbstractOffer.from_xml(el, brand="vendor", name="title")
+        self.assertIsInstance(kwargs, dict)
+        self.assertIn("vendor", kwargs)
+        self.assertIn("title", kwargs)
+        self.assertNotIn("type", kwargs)
+
+        # Unknown elements are passed with the tag as the keyword argument
+        self.assertIn("brand", AbstractOffer.from_xml(el))
+        with self.assertRaises(TypeError):
+            SimplifiedOffer.from_xml(el)
@@ -0,0 +1,103 @@
+from unittest import mock
+from xml.etree import ElementTree as ET
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import parse
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.models import (
+    Dimensions,
+    Feed,
+    OfferList,
+    Price,
+    Shop,
+    SimplifiedOffer,
+)
+
+
+def stored_fields(model) -> dict:
+    """
+    Returns the constructor arguments of the model in the stored form.
+    """
+    return {
+        name: getattr(model, name if slot is None else slot)
+        for name, slot, _, _, _ in model._trusted_plan()
+    }
+
+
+class TrustedTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = parse(VALID_XML_PATH)
+
+    def test_offers(self):
+        for offer in self.feed.shop.offers:
+            trusted = type(offer).trusted(**stored_fields(offer))
+            self.assertEqual(trusted.to_dict(), offer.to_dict())
+            self.assertEqual(
+                ET.tostring(trusted.to_xml()), ET.tostring(offer.to_xml())
+            )
+            trusted.validate_trusted()
+
+    def test_defaults(self):
+        kwargs = dict(
+            offer_id="1",
+            url="https://example.shop/1",
+            price=Price.trusted(value="10"),
+            currency="RUR",
+            category_id="2",
+            name="Offer",
+        )
+        trusted = SimplifiedOffer.trusted(**kwargs)
+        kwargs["price"] = Price("10")
+        self.assertEqual(
+            trusted.to_dict(), SimplifiedOffer(**kwargs).to_dict()
+        )
+        self.assertEqual(trusted._min_quantity, "1")
+        self.assertEqual(trusted._delivery, "true")
+
+        # Mutable defaults aren't shared
+        trusted.parameters.append("x")
+        self.assertEqual(SimplifiedOffer.trusted(**kwargs).parameters, [])
+
+    def test_fields(self):
+        with self.assertRaises(TypeError):
+            Price.trusted()
+        with self.assertRaises(TypeError):
+            Price.trusted(value="10", currency="RUR")
+
+        dimensions = Dimensions.trusted(length="1", wight="2", height="3")
+        self.assertEqual(dimensions.width, 2.0)
+
+    def test_shop_and_feed(self):
+        shop = Shop.trusted(**stored_fields(self.feed.shop))
+        self.assertIsInstance(shop.offers, OfferList)
+        self.assertEqual(shop.to_dict(), self.feed.shop.to_dict())
+        self.assertEqual(len(shop.category_index), 7)
+
+        feed = Feed.trusted(shop=shop, date=self.feed._date)
+        self.assertEqual(feed.to_dict(), self.feed.to_dict())
+        self.assertEqual(feed.errors, [])
+
+    def test_validate_trusted(self):
+        offer = self.feed.shop.offers[0]
+        for name, value in (("weight", "abc"), ("delivery", True)):
+            fields = stored_fields(offer)
+            fields[name] = value
+            trusted = type(offer).trusted(**fields)
+            with self.assertRaises(ValidationError) as cm:
+                trusted.validate_trusted()
+            self.assertEqual(cm.exception.field, name)
+            self.assertEqual(getattr(trusted, "_" + name), value)
+
+    def test_sampled_validation(self):
+        fields = stored_fields(self.feed.shop.offers[0])
+        fields["weight"] = "abc"
+        offer_cls = type(self.feed.shop.offers[0])
+        offer_cls.trusted(**fields)
+
+        with mock.patch(
+            "yandex_market_language.models.abstract.TRUSTED_VALIDATION_RATE",
+            1.0,
+        ):
+            with self.assertRaises(ValidationError):
+                offer_cls.trusted(**fields)
@@ -0,0 +1,147 @@
+import os
+import shutil
+from unittest import mock
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import parse
+from yandex_market_language.cache import FeedCache
+from yandex_market_language.exceptions import ValidationError
+
+
+class FeedCacheTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp, "feed.xml")
+        shutil.copy(VALID_XML_PATH, self.path)
+        self.cache = FeedCache(os.path.join(self.tmp, "cache"))
+
+    def test_hit_skips_parsing(self):
+        feed = parse(self.path, cache=self.cache)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        with mock.patch("yandex_market_language.yml.ET.parse") as p:
+            cached = parse(self.path, cache=self.cache)
+            self.assertEqual(p.call_count, 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(cached.to_dict(), feed.to_dict())
+
+    def test_changed_file(self):
+        parse(self.path, cache=self.cache)
+        with open(self.path, "a") as f:
+            f.write("\n")
+        parse(self.path, cache=self.cache)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        # The snapshot of the previous version was replaced
+        self.assertEqual(len(os.listdir(self.cache.directory)), 1)
+
+    def write_invalid_feed(self):
+        with open(VALID_XML_PATH, "rb") as f:
+            data = f.read()
+        with open(self.path, "wb") as f:
+            f.write(data.replace(
+                b"<weight>1.03</weight>", b"<weight>abc</weight>"
+            ))
+
+    def test_collect_then_raise(self):
+        self.write_invalid_feed()
+        for _ in range(2):
+            feed = parse(self.path, cache=self.cache, errors="collect")
+            self.assertEqual(len(feed.errors), 1)
+            with self.assertRaises(ValidationError):
+                parse(self.path, cache=self.cache)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_raise_then_collect(self):
+        feed = parse(self.path, cache=self.cache)
+        collected = parse(self.path, cache=self.cache, errors="collect")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertEqual(collected.errors, [])
+        self.assertEqual(collected.to_dict(), feed.to_dict())
+        self.assertEqual(len(os.listdir(self.cache.directory)), 2)
+
+        self.write_invalid_feed()
+        with self.assertRaises(ValidationError):
+            parse(self.path, cache=self.cache)
+        feed = parse(self.path, cache=self.cache, errors="collect")
+        self.assertEqual(len(feed.errors), 1)
+        self.assertEqual(len(feed.shop.offers), len(collected.shop.offers) - 1)
+
+    def test_key(self):
+        key = self.cache.key(self.path)
+        self.assertEqual(self.cache.key(self.path), key)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertNotEqual(self.cache.key(self.path), key)
+        self.assertNotEqual(
+            self.cache.key(self.path, "collect"), self.cache.key(self.path)
+        )
+
+    def test_invalidate(self):
+        parse(self.path, cache=self.cache)
+        self.cache.invalidate(self.path)
+        self.assertIsNone(self.cache.get(self.path))
+        self.assertEqual(self.cache.size, 0)
+
+        parse(self.path, cache=self.cache)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.size, 0)
+
+    def test_lru_eviction(self):
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.tmp, "feed{0}.xml".format(i))
+            shutil.copy(VALID_XML_PATH, path)
+            paths.append(path)
+
+        parse(paths[0], cache=self.cache)
+        entry_size = self.cache.size
+        self.cache.max_size = entry_size * 2
+        parse(paths[1], cache=self.cache)
+
+        # Make the first snapshot the oldest one, then use it
+        entry = os.path.join(
+            self.cache.directory, self.cache.key(paths[0]) + ".pickle"
+        )
+        os.utime(entry, ns=(0, 0))
+        self.assertIsNotNone(self.cache.get(paths[0]))
+
+        parse(paths[2], cache=self.cache)
+        self.assertEqual(self.cache.size, entry_size * 2)
+        self.assertIsNotNone(self.cache.get(paths[0]))
+        self.assertIsNone(self.cache.get(paths[1]))
+        self.assertIsNotNone(self.cache.get(paths[2]))
+
+    def test_stale_snapshot(self):
+        entry = os.path.join(
+            self.cache.directory, self.cache.key(self.path) + ".pickle"
+        )
+        for data in (
+            b"",  # EOFError
+            b"\x00",  # UnpicklingError
+            b"cyandex_market_language.models\nRemovedModel\n.",
+            b"cremoved_module\nFeed\n.",
+            b"cbuiltins\nint\n(S'1'\nS'2'\nS'3'\ntR.",  # TypeError
+        ):
+            with open(entry, "wb") as f:
+                f.write(data)
+            self.assertIsNone(self.cache.get(self.path))
+            self.assertFalse(os.path.exists(entry))
+
+        feed = parse(self.path, cache=self.cache)
+        self.assertEqual(self.cache.misses, 6)
+        self.assertEqual(
+            parse(self.path, cache=self.cache).to_dict(), feed.to_dict()
+        )
+
+    def test_evicted_while_read(self):
+        parse(self.path, cache=self.cache)
+        with mock.patch(
+            "yandex_market_language.cache.os.utime",
+            side_effect=FileNotFoundError,
+        ):
+            self.assertIsNotNone(self.cache.get(self.path))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_lazy(self):
+        with self.assertRaises(ValueError):
+            parse(self.path, lazy=True, cache=self.cache)
@@ -0,0 +1,101 @@
+import gzip
+import os
+from pathlib import Path
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import (
+    convert,
+    convert_stream,
+    iter_offers,
+    parse,
+    parse_header,
+)
+from yandex_market_language import compression
+from yandex_market_language.yml import YML
+
+
+class CompressionTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = parse(VALID_XML_PATH)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp, name)
+
+    def test_detect(self):
+        for name, (extension, _) in compression.FORMATS.items():
+            path = self.path("feed.xml" + extension)
+            self.assertEqual(compression.detect(path, "wb"), name)
+        self.assertIsNone(compression.detect(self.path("feed.xml"), "wb"))
+        self.assertIsNone(compression.detect(VALID_XML_PATH))
+
+        # Existing files are detected by the magic bytes
+        path = self.path("feed")
+        with gzip.open(path, "wb") as f:
+            f.write(b"<yml_catalog/>")
+        self.assertEqual(compression.detect(path), "gzip")
+
+    def test_convert_and_parse(self):
+        for extension in (".gz", ".bz2", ".xz"):
+            path = self.path("feed.xml" + extension)
+            convert(path, self.feed)
+            self.assertNotEqual(compression.detect(path), None)
+            self.assertEqual(parse(path).to_dict(), self.feed.to_dict())
+
+    def test_path_objects(self):
+        path = Path(self.path("feed.xml.gz"))
+        self.assertEqual(compression.detect(path, "wb"), "gzip")
+        convert(path, self.feed)
+        self.assertEqual(compression.detect(path), "gzip")
+        self.assertEqual(parse(path).to_dict(), self.feed.to_dict())
+
+        # File objects are read as is, the caller decodes them
+        with gzip.open(str(path)) as f:
+            self.assertEqual(YML(f).parse().to_dict(), self.feed.to_dict())
+
+    def test_stream(self):
+        path = self.path("feed.xml.gz")
+        convert_stream(path, self.feed)
+        with gzip.open(path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"<yml_catalog"))
+        self.assertEqual(
+            [o.to_dict() for o in iter_offers(path)],
+            [o.to_dict() for o in self.feed.shop.offers],
+        )
+        self.assertEqual(
+            parse_header(path).shop.to_dict()["currencies"],
+            self.feed.shop.to_dict()["currencies"],
+        )
+
+    def test_options(self):
+        plain_path = self.path("feed.xml")
+        convert(plain_path, self.feed)
+
+        sizes = []
+        for level in (1, 9):
+            path = self.path("feed{0}.xml.gz".format(level))
+            YML(path, compression_level=level, buffer_size=4096).convert(
+                self.feed
+            )
+            sizes.append(os.path.getsize(path))
+        self.assertGreater(sizes[0], sizes[1])
+
+        # Explicit compression overrides the extension
+        path = self.path("feed.data")
+        YML(path, compression="bz2").convert(self.feed)
+        self.assertEqual(compression.detect(path), "bz2")
+        self.assertEqual(parse(path).to_dict(), self.feed.to_dict())
+
+        path = self.path("plain.xml.gz")
+        YML(path, compression=None).convert(self.feed)
+        self.assertIsNone(compression.detect(path))
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            YML(self.path("feed.xml"), compression="rar").convert(self.feed)
+
+    def test_workers(self):
+        path = self.path("feed.xml.gz")
+        convert(path, self.feed)
+        with self.assertRaises(ValueError):
+            parse(path, workers=2)
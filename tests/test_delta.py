@@ -0,0 +1,60 @@
+import io
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import diff_feeds, iter_offers, parse
+from yandex_market_language.delta import FeedDelta
+
+
+class DiffFeedsTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.old = parse(VALID_XML_PATH)
+        self.new = parse(VALID_XML_PATH)
+
+    def test_equal_feeds(self):
+        delta = self.old.delta(self.new)
+        self.assertIsInstance(delta, FeedDelta)
+        self.assertFalse(delta)
+        self.assertEqual(
+            (delta.added, delta.removed, delta.changed), ([], [], [])
+        )
+
+    def test_delta(self):
+        offers = self.new.shop.offers
+        removed = offers.pop(0)
+        added = offers.pop()
+        added.offer_id = "NEW"
+        offers.append(added)
+        offers[1].price.value = 1
+
+        delta = diff_feeds(self.old, self.new)
+        self.assertTrue(delta)
+        self.assertEqual(delta.added, [added])
+        self.assertEqual(delta.removed, [removed.offer_id, "ALCO111"])
+        self.assertEqual(delta.changed, [offers[1]])
+
+    def test_delta_of_offer_iterables(self):
+        self.new.shop.offers[2].description = "Changed"
+        delta = diff_feeds(iter_offers(VALID_XML_PATH), self.new)
+        self.assertEqual(delta.changed, [self.new.shop.offers[2]])
+        self.assertEqual((delta.added, delta.removed), ([], []))
+
+    def test_to_yml(self):
+        offers = self.new.shop.offers
+        offers[0].price.value = 1
+        offers[3].offer_id = "NEW"
+        delta = self.old.delta(self.new)
+
+        f = io.BytesIO()
+        delta.to_yml(f, self.new)
+        f.seek(0)
+        feed = parse(f)
+        self.assertEqual(
+            [o.to_dict() for o in feed.shop.offers],
+            [offers[3].to_dict(), offers[0].to_dict()],
+        )
+        self.assertEqual(
+            feed.shop.currencies[0].to_dict(),
+            self.new.shop.currencies[0].to_dict(),
+        )
+        self.assertEqual(len(self.new.shop.offers), 8)
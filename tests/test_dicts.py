@@ -0,0 +1,131 @@
+import gzip
+import io
+import json
+import os
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from tests.factories import SimplifiedOfferFactory
+from yandex_market_language import iter_offer_dicts, parse, parse_to_jsonl
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.models import (
+    Category,
+    Dimensions,
+    Price,
+    SimplifiedOffer,
+)
+from yandex_market_language.models.schema import (
+    Field,
+    dict_fields,
+    get_dict_parser,
+)
+
+
+class KeyedOffer(SimplifiedOffer):
+    __TYPE__ = "keyed"
+
+    XML_FIELDS = (
+        *SimplifiedOffer.XML_FIELDS,
+        Field("note", "offerNote", key="comment"),
+    )
+
+    DICT_KEYS = (*SimplifiedOffer.DICT_KEYS, "comment")
+
+    __slots__ = ["note"]
+
+    def __init__(self, note=None, **kwargs):
+        super().__init__(**kwargs)
+        self.note = note
+
+    def create_dict(self, **kwargs) -> dict:
+        return dict(super().create_dict(), comment=self.note)
+
+
+class OfferDictsTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.offers = parse(VALID_XML_PATH).shop.offers
+
+    def test_equal_to_models(self):
+        dicts = list(iter_offer_dicts(VALID_XML_PATH))
+        self.assertEqual(dicts, [o.to_dict() for o in self.offers])
+        for d, offer in zip(dicts, self.offers):
+            self.assertEqual(list(d), list(offer.to_dict()))
+
+        self.assertEqual(
+            list(iter_offer_dicts(VALID_XML_PATH, clean=True)),
+            [o.to_dict(clean=True) for o in self.offers],
+        )
+
+    def test_dict_fields(self):
+        self.assertEqual(dict_fields(Category)[0], dict(
+            id="category_id", name="name", parent_id="parent_id"
+        ))
+        self.assertEqual(dict_fields(Dimensions)[0]["width"], "wight")
+
+        arguments, nested = dict_fields(SimplifiedOffer)
+        self.assertEqual(list(arguments), list(SimplifiedOffer.DICT_KEYS))
+        self.assertIsNone(arguments["type"])
+        self.assertNotIn("cbid", arguments)
+        self.assertIs(nested["price"], Price)
+
+    def test_field_keys(self):
+        offer = KeyedOffer.from_dict(
+            dict(self.offers[0].to_dict(), comment="Note")
+        )
+        self.assertEqual(offer.note, "Note")
+        d = offer.to_dict()
+        self.assertEqual(get_dict_parser(KeyedOffer)(offer.to_xml()), d)
+        self.assertEqual(list(d), list(KeyedOffer.DICT_KEYS))
+
+    def test_parser_cache(self):
+        parser = get_dict_parser(SimplifiedOffer)
+        self.assertIs(get_dict_parser(SimplifiedOffer), parser)
+        self.assertEqual(parser.__qualname__, "SimplifiedOffer.dict_from_xml")
+
+    def test_validation(self):
+        parser = get_dict_parser(SimplifiedOffer)
+        el = SimplifiedOfferFactory().create().to_xml()
+        for store in el.findall("store"):
+            el.remove(store)
+        el.append(el.makeelement("store", {}))
+        el[-1].text = "maybe"
+        with self.assertRaises(ValidationError):
+            parser(el)
+
+        el = SimplifiedOfferFactory().create().to_xml()
+        el.remove(el.find("name"))
+        with self.assertRaisesRegex(TypeError, "missing required fields"):
+            parser(el)
+
+        el = SimplifiedOfferFactory().create().to_xml()
+        el.attrib["unknown"] = "1"
+        el.append(el.makeelement("unknown", {}))
+        with self.assertRaisesRegex(TypeError, "unexpected fields"):
+            parser(el)
+
+    def test_jsonl(self):
+        out = io.BytesIO()
+        count = parse_to_jsonl(VALID_XML_PATH, out)
+        self.assertEqual(count, len(self.offers))
+
+        lines = out.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(len(lines), count)
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [
+                json.loads(json.dumps(o.to_dict(), default=str))
+                for o in self.offers
+            ],
+        )
+
+    def test_jsonl_compressed(self):
+        path = os.path.join(self.tmp, "offers.jsonl.gz")
+
+        parse_to_jsonl(VALID_XML_PATH, path, clean=True)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            dicts = [json.loads(line) for line in f]
+        self.assertEqual(
+            [d["offer_id"] for d in dicts],
+            [o.offer_id for o in self.offers],
+        )
+        self.assertTrue(all(all(d.values()) for d in dicts))
@@ -0,0 +1,116 @@
+import gzip
+import io
+import os
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import parse
+from yandex_market_language.errors import OfferError
+from yandex_market_language.exceptions import ValidationError
+
+
+class CollectErrorsTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+
+        with open(VALID_XML_PATH, "rb") as f:
+            data = f.read()
+        data = data.replace(b"<weight>1.03</weight>", b"<weight>abc</weight>")
+        data = data.replace(b'type="medicine"', b'type="unknown"')
+        self.data = data
+        self.path = os.path.join(self.tmp, "feed.xml")
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        self.valid = parse(VALID_XML_PATH)
+        self.lines = data.split(b"\n")
+
+    def line_of(self, marker: bytes) -> int:
+        for i, line in enumerate(self.lines, 1):
+            if marker in line:
+                return i
+
+    def assertCollected(self, feed):
+        self.assertEqual(
+            [o.to_dict() for o in feed.shop.offers],
+            [
+                o.to_dict() for o in self.valid.shop.offers
+                if o.offer_id not in ("A1VV", "12541M")
+            ],
+        )
+        self.assertEqual(len(feed.errors), 2)
+        weight, unknown = feed.errors
+
+        self.assertIsInstance(weight, OfferError)
+        self.assertEqual(weight.index, 1)
+        self.assertEqual(weight.offer_id, "A1VV")
+        self.assertEqual(weight.field, "weight")
+        self.assertEqual(weight.value, "abc")
+        self.assertEqual(weight.message, "weight must be a valid float")
+        self.assertEqual(weight.element.attrib["id"], "A1VV")
+
+        self.assertEqual(unknown.index, 5)
+        self.assertEqual(unknown.offer_id, "12541M")
+        self.assertIsNone(unknown.field)
+
+        self.assertEqual(weight.line, self.line_of(b'<offer id="A1VV"'))
+        self.assertTrue(
+            self.data[weight.position:].startswith(b'<offer id="A1VV"')
+        )
+        self.assertEqual(unknown.line, self.line_of(b'<offer id="12541M"'))
+
+    def test_raise(self):
+        with self.assertRaises(ValidationError) as cm:
+            parse(self.path)
+        self.assertEqual(cm.exception.field, "weight")
+        self.assertEqual(cm.exception.value, "abc")
+
+    def test_collect(self):
+        self.assertCollected(parse(self.path, errors="collect"))
+
+    def test_collect_file_object(self):
+        self.assertCollected(parse(io.BytesIO(self.data), errors="collect"))
+
+    def test_collect_compressed(self):
+        path = self.path + ".gz"
+        with gzip.open(path, "wb") as f:
+            f.write(self.data)
+        self.assertCollected(parse(path, errors="collect"))
+
+    def test_commented_offer(self):
+        start = self.data.index(b'<offer id="1511AB"')
+        end = self.data.index(b"</offer>", start) + len(b"</offer>")
+        offer = self.data[start:end].replace(b'id="1511AB"', b'id="X1511AB"')
+        data = self.data.replace(
+            b"<offers>", b"<offers><!-- " + offer + b" -->", 1
+        )
+        with open(self.path, "wb") as f:
+            f.write(data)
+        self.data = data
+        self.lines = data.split(b"\n")
+
+        feed = parse(self.path, errors="collect")
+        self.assertNotIn("X1511AB", [o.offer_id for o in feed.shop.offers])
+        self.assertCollected(feed)
+
+    def test_to_dict(self):
+        error = parse(self.path, errors="collect").errors[0]
+        self.assertEqual(error.to_dict(), dict(
+            index=1,
+            offer_id="A1VV",
+            field="weight",
+            value="abc",
+            message="weight must be a valid float",
+            line=error.line,
+            position=error.position,
+        ))
+
+    def test_valid_feed(self):
+        self.assertEqual(parse(VALID_XML_PATH, errors="collect").errors, [])
+        self.assertEqual(self.valid.errors, [])
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            parse(self.path, errors="ignore")
+        for kwargs in (dict(lazy=True), dict(workers=2)):
+            with self.assertRaises(ValueError):
+                parse(self.path, errors="collect", **kwargs)
@@ -7,6 +7,10 @@ from yandex_market_language.models.fields.enable_auto_discounts import (
 )
 
 
+class Field(EnableAutoDiscountField):
+    __slots__ = ["_enable_auto_discounts"]
+
+
 class EnableAutoDiscountsFieldTestCase(TestCase):
     def test_enable_auto_discounts_validation_error(self):
         msg = (
@@ -16,12 +20,12 @@ class EnableAutoDiscountsFieldTestCase(TestCase):
             )
         )
         with self.assertRaises(ValidationError) as e:
-            f = EnableAutoDiscountField()
+            f = Field()
             f.enable_auto_discounts = "err"
             self.assertEqual(str(e), msg)
 
     def test_enable_auto_discounts_property(self):
-        f = EnableAutoDiscountField()
+        f = Field()
 
         for v in ["yes", "true", "1"]:
             f.enable_auto_discounts = v
@@ -0,0 +1,30 @@
+import io
+
+from benchmarks.generator import OFFER_MIX, generate_feed
+from tests.cases import FeedTestCase
+from yandex_market_language import parse
+
+
+class GeneratorTestCase(FeedTestCase):
+    def generate(self, offers: int, seed: int = 0) -> bytes:
+        f = io.BytesIO()
+        size = generate_feed(f, offers, seed)
+        self.assertEqual(size, len(f.getvalue()))
+        return f.getvalue()
+
+    def test_feed(self):
+        feed = parse(io.BytesIO(self.generate(300)))
+        offers = feed.shop.offers
+        self.assertEqual(len(offers), 300)
+        self.assertEqual(len(offers.by_id), 300)
+        self.assertEqual(
+            {o.__TYPE__ for o in offers}, {t for t, _ in OFFER_MIX}
+        )
+        self.assertTrue(any(o.parameters for o in offers))
+        self.assertTrue(any(o.delivery_options for o in offers))
+        self.assertTrue(feed.shop.promo_offers(feed.shop.promos[0]))
+        self.assertEqual(len(feed.shop.category_index), 3)
+
+    def test_deterministic(self):
+        self.assertEqual(self.generate(100), self.generate(100))
+        self.assertNotEqual(self.generate(100), self.generate(100, seed=1))
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import yandex_market_language
+from yandex_market_language import models
+
+
+def loaded_modules(statement: str) -> set:
+    """
+    Returns the modules loaded by the statement in a fresh interpreter.
+    """
+    out = subprocess.check_output([
+        sys.executable,
+        "-c",
+        "import sys; {0}; print(' '.join(sys.modules))".format(statement),
+    ])
+    return set(out.decode().split())
+
+
+class LazyImportTestCase(TestCase):
+    def test_package(self):
+        modules = loaded_modules("import yandex_market_language")
+        self.assertNotIn("yandex_market_language.yml", modules)
+        self.assertNotIn("yandex_market_language.models", modules)
+
+    def test_parse(self):
+        modules = loaded_modules("from yandex_market_language import parse")
+        for name in (
+            "xml.dom.minidom",
+            "xml.sax.saxutils",
+            "gzip",
+            "bz2",
+            "lzma",
+            "yandex_market_language.delta",
+            "yandex_market_language.mapped",
+            "yandex_market_language.models.lazy",
+            "yandex_market_language.models.promo",
+        ):
+            self.assertNotIn(name, modules)
+
+    def test_names(self):
+        for module in (yandex_market_language, models):
+            for name in module.__all__:
+                self.assertIsNotNone(getattr(module, name))
+                self.assertIn(name, dir(module))
+            with self.assertRaises(AttributeError):
+                module.unknown
+        self.assertIs(models.offers.SimplifiedOffer, models.SimplifiedOffer)
+        self.assertIs(yandex_market_language.models, models)
+        self.assertIs(
+            yandex_market_language.yml.parse, yandex_market_language.parse
+        )
+        self.assertIsNotNone(yandex_market_language.exceptions.ParseError)
+
+    def test_submodules(self):
+        modules = loaded_modules(
+            "import yandex_market_language as yml; "
+            "yml.exceptions.YMLException; yml.models.offers.BookOffer"
+        )
+        self.assertIn("yandex_market_language.models.offers", modules)
+        self.assertNotIn("yandex_market_language.yml", modules)
+        self.assertIs(models.get_offer_class("book"), models.BookOffer)
@@ -0,0 +1,117 @@
+import os
+from unittest import mock
+
+from tests.cases import FeedTestCase, VALID_XML_PATH, hide_offers
+from yandex_market_language import convert_stream, parse
+from yandex_market_language.exceptions import ParseError
+from yandex_market_language.index import FeedIndex
+
+
+class FeedIndexTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp, "feed.xml")
+
+        feed = parse(VALID_XML_PATH)
+        self.offers = feed.shop.offers
+        self.offers[0].group_id = 12
+        self.offers[1].group_id = 12
+        self.offers[2].offer_id = "A&B"
+        feed.shop.offers = []
+        convert_stream(self.path, feed, self.offers)
+
+    def test_build(self):
+        index = FeedIndex.build(self.path)
+        self.assertEqual(len(index), len(self.offers))
+        self.assertEqual(index.offer_ids, [o.offer_id for o in self.offers])
+        self.assertEqual(index.types, [o.__TYPE__ for o in self.offers])
+        self.assertEqual(
+            index.category_ids, [o.category_id for o in self.offers]
+        )
+        self.assertIn("A&B", index)
+        self.assertNotIn("missing", index)
+        self.assertEqual(index.type_of("A&B"), self.offers[2].__TYPE__)
+        self.assertEqual(
+            index.by_group(12), [o.offer_id for o in self.offers[:2]]
+        )
+        self.assertEqual(index.by_group(13), [])
+        self.assertEqual(
+            index.by_category("3"),
+            [o.offer_id for o in self.offers if o.category_id == "3"],
+        )
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        offset, length = index.span("A&B")
+        self.assertTrue(data[offset:offset + length].startswith(b"<offer "))
+        self.assertTrue(data[offset:offset + length].endswith(b"</offer>"))
+
+    def test_build_escaped_ids_and_invalid_groups(self):
+        with open(self.path, "rb") as f:
+            data = f.read()
+        ids = [o.offer_id for o in self.offers]
+        data = data.replace(
+            'id="{0}"'.format(ids[3]).encode(), b'id="&quot;Q&#39;&#x41;"'
+        ).replace(
+            'id="{0}"'.format(ids[4]).encode(), b"id='&apos;&lt;'"
+        ).replace(
+            b"<group_id>12</group_id>", b"<group_id>abc</group_id>", 1
+        )
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        index = FeedIndex.build(self.path)
+        self.assertEqual(len(index), len(self.offers))
+        self.assertEqual(index.offer_ids[3:5], ["\"Q'A", "'<"])
+        self.assertEqual(index.group_ids[:2].tolist(), [0, 12])
+        self.assertEqual(index.by_group(12), [ids[1]])
+
+    def test_build_hidden_offers(self):
+        with open(self.path, "rb") as f:
+            data = hide_offers(f.read())
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        index = FeedIndex.build(self.path)
+        self.assertEqual(index.offer_ids, [o.offer_id for o in self.offers])
+        self.assertEqual(
+            [o.to_dict() for o in index.offers(index.offer_ids)],
+            [o.to_dict() for o in parse(self.path).shop.offers],
+        )
+
+    def test_offers(self):
+        index = FeedIndex.build(self.path)
+        ids = [self.offers[5].offer_id, "A&B", self.offers[0].offer_id]
+        self.assertEqual(
+            [o.to_dict() for o in index.offers(ids)],
+            [self.offers[i].to_dict() for i in (5, 2, 0)],
+        )
+        self.assertEqual(index["A&B"].to_dict(), self.offers[2].to_dict())
+        self.assertIsNone(index.get("missing"))
+        with self.assertRaises(KeyError):
+            index.offers(["missing"])
+
+    def test_sidecar(self):
+        index = FeedIndex.build(self.path)
+        index.save()
+        self.assertTrue(os.path.exists(self.path + ".idx"))
+
+        loaded = FeedIndex.load(self.path)
+        self.assertEqual(loaded.offer_ids, index.offer_ids)
+        self.assertEqual(loaded.offsets, index.offsets)
+        self.assertEqual(loaded.group_ids, index.group_ids)
+
+        with mock.patch.object(FeedIndex, "build") as p:
+            FeedIndex.open(self.path)
+            self.assertEqual(p.call_count, 0)
+
+    def test_stale_sidecar(self):
+        FeedIndex.build(self.path).save()
+        with open(self.path, "ab") as f:
+            f.write(b"\n")
+        with self.assertRaises(ParseError):
+            FeedIndex.load(self.path)
+
+        index = FeedIndex.open(self.path)
+        self.assertEqual(index.fingerprint[0], os.path.getsize(self.path))
+        self.assertEqual(FeedIndex.load(self.path).offer_ids, index.offer_ids)
@@ -0,0 +1,118 @@
+import io
+import os
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import convert, parse
+from yandex_market_language.cache import FeedCache
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.instrumentation import Metrics
+
+
+OFFER_COUNTS = {
+    None: 1,
+    "vendor.model": 1,
+    "book": 1,
+    "audiobook": 1,
+    "artist.title": 1,
+    "medicine": 1,
+    "event-ticket": 1,
+    "alco": 1,
+}
+
+
+class InstrumentationTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.size = os.path.getsize(VALID_XML_PATH)
+
+    def stages(self, metrics: Metrics, operation: str) -> set:
+        return {s for o, s in metrics.seconds if o == operation}
+
+    def test_parse(self):
+        metrics = Metrics()
+        parse(VALID_XML_PATH, hooks=metrics)
+        self.assertEqual(self.stages(metrics, "parse"), {"read", "build"})
+        self.assertEqual(metrics.read, self.size)
+        self.assertEqual(
+            {t: n for (_, t), n in metrics.offer_counts.items()},
+            OFFER_COUNTS,
+        )
+        self.assertEqual(metrics.failures["parse"], 0)
+
+        metrics = Metrics()
+        with open(VALID_XML_PATH, "rb") as f:
+            parse(io.BytesIO(f.read()), hooks=metrics)
+        self.assertEqual(metrics.read, self.size)
+
+    def test_mapped_and_lazy(self):
+        metrics = Metrics()
+        feed = parse(VALID_XML_PATH, mapped=True, lazy=True, hooks=metrics)
+        self.assertEqual(self.stages(metrics, "parse"), {"parse"})
+        self.assertEqual(metrics.read, self.size)
+        self.assertEqual(sum(metrics.offer_counts.values()), 8)
+        # Lazy offers are counted without being parsed
+        self.assertTrue(all(o._offer is None for o in feed.shop.offers))
+
+    def test_cache(self):
+        cache = FeedCache(os.path.join(self.tmp, "cache"))
+        metrics = Metrics()
+        parse(VALID_XML_PATH, cache=cache, hooks=metrics)
+        self.assertEqual(
+            self.stages(metrics, "parse"), {"cache", "read", "build"}
+        )
+        self.assertEqual(metrics.read, self.size)
+
+        metrics = Metrics()
+        parse(VALID_XML_PATH, cache=cache, hooks=metrics)
+        self.assertEqual(self.stages(metrics, "parse"), {"cache"})
+        self.assertEqual(metrics.read, 0)
+        self.assertEqual(sum(metrics.offer_counts.values()), 8)
+
+    def test_validation_failures(self):
+        with open(VALID_XML_PATH, "rb") as f:
+            data = f.read().replace(
+                b"<weight>1.03</weight>", b"<weight>abc</weight>"
+            )
+        path = os.path.join(self.tmp, "feed.xml")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        metrics = Metrics()
+        with self.assertRaises(ValidationError):
+            parse(path, hooks=metrics)
+        self.assertEqual(metrics.failures["parse"], 1)
+
+        parse(path, errors="collect", hooks=metrics)
+        self.assertEqual(metrics.failures["parse"], 2)
+        self.assertEqual(sum(metrics.offer_counts.values()), 7)
+
+    def test_convert(self):
+        feed = parse(VALID_XML_PATH)
+        path = os.path.join(self.tmp, "feed.xml")
+        for pretty, stages in (
+            (True, {"serialize", "prettify", "write"}),
+            (False, {"serialize", "write"}),
+        ):
+            metrics = Metrics()
+            convert(path, feed, pretty, hooks=metrics)
+            self.assertEqual(self.stages(metrics, "convert"), stages)
+            self.assertEqual(metrics.written, os.path.getsize(path))
+            self.assertEqual(
+                {t: n for (_, t), n in metrics.offer_counts.items()},
+                OFFER_COUNTS,
+            )
+
+    def test_samples(self):
+        metrics = Metrics()
+        parse(VALID_XML_PATH, hooks=metrics)
+        samples = {
+            (name, tuple(labels.values())): value
+            for name, labels, value in metrics.samples()
+        }
+        self.assertEqual(
+            samples["yml_offers_total", ("parse", "simplified")], 1
+        )
+        self.assertEqual(samples["yml_read_bytes_total", ()], self.size)
+        self.assertGreater(
+            samples["yml_stage_seconds_total", ("parse", "read")], 0
+        )
@@ -0,0 +1,132 @@
+import os
+
+from tests.cases import FeedTestCase, VALID_XML_PATH, hide_offers
+from yandex_market_language import convert, convert_stream, parse
+from yandex_market_language.exceptions import ParseError
+from yandex_market_language.mapped import MappedFeed
+
+
+class MappedFeedTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = parse(VALID_XML_PATH)
+        self.offers = [o.to_dict() for o in self.feed.shop.offers]
+
+    def write(self, data: bytes) -> str:
+        path = os.path.join(self.tmp, "feed.xml")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_random_access(self):
+        with MappedFeed(VALID_XML_PATH) as feed:
+            self.assertEqual(len(feed), len(self.offers))
+            self.assertEqual(feed.encoding, "UTF-8")
+            self.assertEqual(feed[3].to_dict(), self.offers[3])
+            self.assertEqual(feed[-1].to_dict(), self.offers[-1])
+            self.assertEqual(
+                [o.to_dict() for o in feed[2:5]], self.offers[2:5]
+            )
+            self.assertEqual(
+                [o.to_dict() for o in feed.iter_offers(5)], self.offers[5:]
+            )
+            with self.assertRaises(IndexError):
+                feed.offer(len(self.offers))
+
+    def test_spans(self):
+        with open(VALID_XML_PATH, "rb") as f:
+            data = f.read()
+        with MappedFeed(VALID_XML_PATH) as feed:
+            for i in range(len(feed)):
+                start, end = feed.span(i)
+                self.assertTrue(data[start:end].startswith(b"<offer "))
+                self.assertTrue(data[start:end].endswith(b"</offer>"))
+
+    def test_offer_chunks(self):
+        with MappedFeed(VALID_XML_PATH) as feed:
+            for chunks in (1, 3, 100):
+                offers = [
+                    o.to_dict()
+                    for start, end in feed.offer_chunks(chunks)
+                    for o in feed.iter_range(start, end)
+                ]
+                self.assertEqual(offers, self.offers)
+
+    def test_parse(self):
+        for lazy in (False, True):
+            feed = parse(VALID_XML_PATH, mapped=True, lazy=lazy)
+            self.assertEqual(feed.to_dict(), self.feed.to_dict())
+
+    def test_hidden_offers(self):
+        with open(VALID_XML_PATH, "rb") as f:
+            path = self.write(hide_offers(f.read()))
+        expected = parse(path)
+        offers = [o.to_dict() for o in expected.shop.offers]
+        self.assertEqual(len(offers), len(self.offers))
+        self.assertNotIn("X1511AB", [o.offer_id for o in expected.shop.offers])
+
+        with MappedFeed(path) as feed:
+            self.assertEqual(len(feed), len(offers))
+            self.assertEqual([o.to_dict() for o in feed[:]], offers)
+            for chunks in range(1, 60):
+                self.assertEqual(
+                    [
+                        o.to_dict()
+                        for start, end in feed.offer_chunks(chunks)
+                        for o in feed.iter_range(start, end)
+                    ],
+                    offers,
+                )
+        self.assertEqual(
+            parse(path, mapped=True).to_dict(), expected.to_dict()
+        )
+
+    def test_markup_not_closed(self):
+        path = self.write(
+            b"<yml_catalog><shop><offers><!-- <offer/>"
+            b"</offers></shop></yml_catalog>"
+        )
+        with MappedFeed(path) as feed:
+            with self.assertRaises(ParseError):
+                len(feed)
+
+    def test_encoding(self):
+        path = os.path.join(self.tmp, "feed.xml")
+        convert(path, self.feed)
+        with open(path, "rb") as f:
+            data = f.read().decode("utf-8").encode("windows-1251")
+        data = b'<?xml version="1.0" encoding="windows-1251"?>' + data
+        path = self.write(data)
+        with MappedFeed(path) as feed:
+            self.assertEqual(feed.encoding, "windows-1251")
+            self.assertEqual(feed[0].to_dict(), self.offers[0])
+            self.assertEqual(
+                feed.parse_header().shop.name, self.feed.shop.name
+            )
+
+    def test_empty_offers(self):
+        self.feed.shop.offers = []
+        path = os.path.join(self.tmp, "feed.xml")
+        convert_stream(path, self.feed, pretty=False)
+        with open(path, "rb") as f:
+            data = f.read().replace(b"<offers></offers>", b"<offers/>")
+        path = self.write(data)
+        with MappedFeed(path) as feed:
+            self.assertEqual(len(feed), 0)
+            self.assertEqual(feed.offer_chunks(2), [])
+            self.assertEqual(feed.parse().shop.offers, [])
+
+    def test_no_offers(self):
+        path = self.write(b"<yml_catalog><shop></shop></yml_catalog>")
+        with MappedFeed(path) as feed:
+            with self.assertRaises(ParseError):
+                len(feed)
+
+    def test_offer_not_closed(self):
+        path = self.write(
+            b'<yml_catalog><shop><offers><offer id="1"><name>A</name>'
+            b"</offers></shop></yml_catalog>"
+        )
+        with MappedFeed(path) as feed:
+            with self.assertRaises(ParseError):
+                len(feed)
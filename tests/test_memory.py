@@ -0,0 +1,28 @@
+import tracemalloc
+from xml.etree import ElementTree as ET
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language.models import Shop
+
+
+# Parsed models of the fixture offers took 1651 bytes per offer while they
+# had the instance dictionaries
+BASELINE_BYTES_PER_OFFER = 1651
+
+
+class MemoryTestCase(FeedTestCase):
+    def bytes_per_offer(self, offers: int = 10000) -> float:
+        source = list(ET.parse(VALID_XML_PATH).getroot().find("shop/offers"))
+        offer_els = [source[i % len(source)] for i in range(offers)]
+
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        before = tracemalloc.get_traced_memory()[0]
+        parsed = [Shop.offer_from_xml(el) for el in offer_els]
+        used = tracemalloc.get_traced_memory()[0] - before
+        self.assertEqual(len(parsed), offers)
+        return used / offers
+
+    def test_bytes_per_offer(self):
+        used = self.bytes_per_offer()
+        self.assertLessEqual(used, BASELINE_BYTES_PER_OFFER * 0.6, used)
@@ -0,0 +1,89 @@
+import os
+
+from tests.cases import FeedTestCase, VALID_XML_PATH, hide_offers
+from yandex_market_language import parse, parse_offers, convert_stream
+from yandex_market_language import parallel
+from yandex_market_language.mapped import MappedFeed
+
+
+class ParallelParseTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp, "feed.xml")
+        self.feed = parse(VALID_XML_PATH)
+        offers = self.feed.shop.offers * 20
+        self.feed.shop.offers = []
+        convert_stream(self.path, self.feed, offers)
+        self.feed.shop.offers = offers
+
+    def split_offers(self, path, chunks):
+        with MappedFeed(path) as feed:
+            start, end = feed.offers_bounds
+        return start, end, parallel.split_offers(path, chunks)
+
+    def test_split_offers(self):
+        start, end, ranges = self.split_offers(self.path, 7)
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual(ranges[-1][1], end)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        self.assertEqual(data[start - len(b"<offers>"):start], b"<offers>")
+        self.assertEqual(data[end:end + len(b"</offers>")], b"</offers>")
+        for (s, e), (next_s, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(e, next_s)
+        for s, _ in ranges:
+            self.assertTrue(data[s:].startswith(b"<offer "))
+
+    def test_split_offers_more_chunks_than_offers(self):
+        ranges = parallel.split_offers(VALID_XML_PATH, 1000)
+        self.assertEqual(len(ranges), len(self.feed.shop.offers) // 20)
+
+    def test_split_offers_empty(self):
+        self.feed.shop.offers = []
+        convert_stream(self.path, self.feed, pretty=False)
+        start, end, ranges = self.split_offers(self.path, 2)
+        self.assertEqual(start, end)
+        self.assertEqual(ranges, [])
+        self.assertEqual(parse(self.path, workers=2).shop.offers, [])
+
+        with open(self.path, "rb") as f:
+            data = f.read().replace(b"<offers></offers>", b"<offers/>")
+        with open(self.path, "wb") as f:
+            f.write(data)
+        start, end, ranges = self.split_offers(self.path, 2)
+        self.assertEqual(start, end)
+        self.assertEqual(ranges, [])
+        self.assertEqual(parse(self.path, workers=2).shop.offers, [])
+
+    def test_parse(self):
+        feed = parse(self.path, workers=2)
+        self.assertEqual(feed.to_dict(), self.feed.to_dict())
+
+    def test_parse_hidden_offers(self):
+        with open(self.path, "rb") as f:
+            data = hide_offers(f.read())
+        with open(self.path, "wb") as f:
+            f.write(data)
+        expected = parse(self.path).to_dict()
+        for workers in (2, 7):
+            self.assertEqual(
+                parse(self.path, workers=workers).to_dict(), expected
+            )
+
+    def test_parse_offers(self):
+        offers = parse_offers(self.path, workers=2)
+        self.assertEqual(
+            [o.to_dict() for o in offers],
+            [o.to_dict() for o in self.feed.shop.offers],
+        )
+
+    def test_parse_offers_as_dict(self):
+        offers = parse_offers(self.path, workers=2, as_dict=True)
+        self.assertEqual(
+            offers, [o.to_dict() for o in self.feed.shop.offers]
+        )
+
+    def test_parse_requires_path(self):
+        with open(self.path, "rb") as f:
+            with self.assertRaises(ValueError):
+                parse(f, workers=2)
@@ -0,0 +1,82 @@
+import unittest
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from yandex_market_language import parse, parse_offers
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class OfferTableTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = parse(VALID_XML_PATH)
+        self.offers = self.feed.shop.offers
+
+    def assertTableEqualsOffers(self, table, offers):
+        self.assertEqual(len(table), len(offers))
+        for i, o in enumerate(offers):
+            self.assertEqual(table.price[i], o.price.value)
+            self.assertEqual(table.min_quantity[i], o.min_quantity)
+            self.assertEqual(table.group_id[i], o.group_id or 0)
+            self.assertEqual(table.offer_id[i], o.offer_id)
+            self.assertEqual(table.category_id[i], o.category_id)
+            self.assertEqual(table.currency[i], o.currency)
+            self.assertEqual(table.pictures[i], o.pictures)
+            self.assertEqual(table.barcodes[i], o.barcodes or [])
+            self.assertEqual(
+                table.parameters[i],
+                [(p.name, p.value, p.unit) for p in o.parameters],
+            )
+            for name in ("old_price", "weight", "bid"):
+                value = getattr(o, name)
+                if value is None:
+                    self.assertTrue(np.isnan(getattr(table, name)[i]))
+                else:
+                    self.assertEqual(getattr(table, name)[i], float(value))
+
+    def test_offers_table(self):
+        table = self.feed.shop.offers_table()
+        self.assertTableEqualsOffers(table, self.offers)
+        self.assertEqual(table.price.dtype, np.float64)
+        self.assertEqual(table.min_quantity.dtype, np.int64)
+
+    def test_parse_offers_columnar(self):
+        table = parse_offers(VALID_XML_PATH, columnar=True)
+        self.assertTableEqualsOffers(table, self.offers)
+
+    def test_filter(self):
+        table = self.feed.shop.offers_table()
+        mask = table.price > 100
+        filtered = table[mask]
+        expected = [o for o in self.offers if o.price.value > 100]
+        self.assertTableEqualsOffers(filtered, expected)
+        self.assertEqual(filtered.to_offers(), expected)
+
+        reversed_table = filtered[::-1]
+        self.assertTableEqualsOffers(reversed_table, expected[::-1])
+        self.assertEqual(len(table[table.price < 0]), 0)
+
+    def test_to_offers_from_file(self):
+        table = parse_offers(VALID_XML_PATH, columnar=True)
+        filtered = table[[5, 1, 1]]
+        offers = filtered.to_offers()
+        self.assertEqual(
+            [o.to_dict() for o in offers],
+            [self.offers[i].to_dict() for i in (5, 1, 1)],
+        )
+        self.assertEqual(table[[]].to_offers(), [])
+
+    def test_to_offers_without_source(self):
+        with open(VALID_XML_PATH, "rb") as f:
+            table = parse_offers(f, columnar=True)
+        self.assertEqual(len(table), len(self.offers))
+        with self.assertRaises(ValueError):
+            table.to_offers()
+
+    def test_columnar_in_workers(self):
+        with self.assertRaises(ValueError):
+            parse_offers(VALID_XML_PATH, workers=2, columnar=True)
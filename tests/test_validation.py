@@ -0,0 +1,143 @@
+from datetime import datetime
+from unittest import TestCase, mock, skipIf
+
+from tests.factories import SimplifiedOfferFactory
+from yandex_market_language import exceptions
+from yandex_market_language.models import Price
+from yandex_market_language.models.abstract import AbstractModel
+from yandex_market_language.validation import (
+    Validated,
+    validate_bools,
+    validate_columns,
+    validate_datetimes,
+    validate_floats,
+    validate_ints,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def accepted(convert, value) -> bool:
+    try:
+        convert(value)
+        return True
+    except (TypeError, ValueError, exceptions.ValidationError):
+        return False
+
+
+VALUES = [
+    "1", "-0", "+5", " 7 ", "1_000", "1__0", "_1", "1_", "١٢",
+    "1.5", ".5", "5.", "1e5", "1.e-3", "inf", "-Infinity", "nan", "NaN ",
+    "1e", "e5", "", "  ", "0x10", "1 2", "12a", "1.2.3", "--1", "1.5e1_0",
+    None, 12, 1.5, True, [], float("nan"),
+]
+
+
+class BatchValidationTestCase(TestCase):
+    def test_matches_scalar_validation(self):
+        for allow_none in (False, True):
+            ints = validate_ints(VALUES, allow_none)
+            floats = validate_floats(VALUES, allow_none)
+            for i, v in enumerate(VALUES):
+                self.assertEqual(bool(ints.mask[i]), accepted(
+                    lambda x: AbstractModel._is_valid_int(x, "a", allow_none),
+                    v,
+                ), v)
+                self.assertEqual(bool(floats.mask[i]), accepted(
+                    lambda x: AbstractModel._is_valid_float(
+                        x, "a", allow_none
+                    ),
+                    v,
+                ), v)
+
+    def test_errors(self):
+        result = validate_floats(["1.5", "abc", None, "2"])
+        self.assertEqual(list(result.mask), [True, False, False, True])
+        self.assertEqual(list(result.errors), [1, 2])
+        self.assertFalse(result)
+        self.assertTrue(validate_floats(["1.5", "2"]))
+
+    def test_marked_values(self):
+        result = validate_ints(["12", "012", 7, "x", None], allow_none=True)
+        self.assertEqual(
+            [type(v) for v in result.values],
+            [Validated, str, Validated, str, type(None)],
+        )
+        self.assertEqual(result.values[2], "7")
+
+        for v in validate_floats(["1.5", 2, 2.5]).values:
+            self.assertIs(type(v), Validated)
+            self.assertEqual(
+                AbstractModel._is_valid_float(v, "a"),
+                AbstractModel._is_valid_float(
+                    float(v) if "." in v else int(v), "a"
+                ),
+            )
+
+    def test_setters_skip_validation(self):
+        value = validate_floats(["1.5"]).values[0]
+        with mock.patch("yandex_market_language.models.abstract.float") as p:
+            price = Price(value)
+            self.assertEqual(p.call_count, 0)
+        self.assertIs(type(price._value), str)
+        self.assertEqual(price.value, 1.5)
+
+    def test_bools(self):
+        result = validate_bools(["true", True, "yes", None, False])
+        self.assertEqual(
+            list(result.mask), [True, True, False, False, True]
+        )
+        self.assertEqual(result.values[1], "true")
+        self.assertEqual(list(validate_bools([None], True).mask), [True])
+
+    def test_datetimes(self):
+        fmt = "%Y-%m-%d %H:%M"
+        result = validate_datetimes(
+            ["2020-01-02 10:00", "2020-02-30 10:00", datetime(2020, 1, 1)],
+            fmt,
+        )
+        self.assertEqual(list(result.mask), [True, False, True])
+        self.assertEqual(result.values[2], "2020-01-01 00:00")
+        self.assertEqual(
+            AbstractModel._is_valid_datetime(result.values[0], fmt, "a"),
+            "2020-01-02 10:00",
+        )
+
+    def test_columns(self):
+        results = validate_columns({
+            "price": ["10", "x"],
+            "weight": [None, "1.5"],
+            "min_quantity": ["1", "1.5"],
+        })
+        self.assertEqual(list(results["price"].errors), [1])
+        self.assertTrue(results["weight"])
+        self.assertEqual(list(results["min_quantity"].errors), [1])
+        with self.assertRaises(ValueError):
+            validate_columns({"name": []})
+
+    def test_group_ids(self):
+        offer = SimplifiedOfferFactory().create()
+        values = [
+            "123456789", "1234567890", 123456789, 1234567890, "-12345678",
+            "-123456789", "0000000012", 1e10, None, "x",
+        ]
+        result = validate_columns({"group_id": values})["group_id"]
+
+        def set_group_id(value):
+            offer.group_id = value
+
+        for valid, value in zip(result.mask, values):
+            self.assertEqual(bool(valid), accepted(set_group_id, value), value)
+
+    @skipIf(np is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        result = validate_ints(np.array([1.0, np.nan, 3.5, np.inf]))
+        self.assertEqual(list(result.mask), [True, False, True, False])
+        self.assertEqual(result.values[2], "3")
+        result = validate_floats(np.array([1, 2]))
+        self.assertTrue(result)
+        self.assertEqual(result.values, ["1", "2"])
+        self.assertTrue(validate_ints(np.arange(3)))
@@ -0,0 +1,137 @@
+import gzip
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree as ET
+
+from tests.cases import FeedTestCase, VALID_XML_PATH
+from tests.factories import SimplifiedOfferFactory
+from yandex_market_language import convert_stream, dicts_to_yml, parse
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.models import Feed, SimplifiedOffer
+from yandex_market_language.models.offers import AbstractOffer
+from yandex_market_language.models.schema import (
+    element_text,
+    get_dict_writer,
+)
+from yandex_market_language.yml import YML
+
+
+class DictsWriterTestCase(FeedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.feed = parse(VALID_XML_PATH)
+        self.shop = self.feed.shop.to_dict()
+        self.offers = self.shop.pop("offers")
+
+    def write(self, offers, pretty=True, batch_size=1000) -> bytes:
+        out = io.BytesIO()
+        count = dicts_to_yml(
+            self.shop, offers, out, pretty, self.feed._date, batch_size
+        )
+        self.assertEqual(count, len(offers))
+        return out.getvalue()
+
+    def test_from_dict(self):
+        data = self.feed.to_dict()
+        self.assertEqual(Feed.from_dict(data).to_dict(), data)
+
+        for offer in self.feed.shop.offers:
+            data = offer.to_dict()
+            created = AbstractOffer.from_dict(data)
+            self.assertIs(created.__class__, offer.__class__)
+            self.assertEqual(created.to_dict(), data)
+
+        with self.assertRaises(TypeError):
+            SimplifiedOffer.from_dict(dict(self.offers[0], unknown=1))
+
+    def test_matches_convert_stream(self):
+        for pretty in (True, False):
+            expected = io.BytesIO()
+            convert_stream(
+                expected,
+                Feed.from_dict(dict(
+                    shop=dict(self.shop, offers=[]), date=self.feed._date
+                )),
+                (AbstractOffer.from_dict(d) for d in self.offers),
+                pretty,
+            )
+            for batch_size in (1, 3, 1000):
+                self.assertEqual(
+                    self.write(self.offers, pretty, batch_size),
+                    expected.getvalue(),
+                )
+
+    def test_threads(self):
+        flags = ("store", "delivery", "pickup", "adult", "downloadable")
+        batches = [
+            [
+                dict(d, **{f: t % 2 == 0 for f in flags})
+                for d in self.offers * 5
+            ]
+            for t in range(8)
+        ]
+        expected = [self.write(offers, batch_size=1) for offers in batches]
+
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        with ThreadPoolExecutor(8) as pool:
+            written = list(pool.map(
+                lambda offers: self.write(offers, batch_size=1), batches * 4
+            ))
+        self.assertEqual(written, expected * 4)
+        # No model is shared by the calls
+        writer = get_dict_writer(SimplifiedOffer)
+        self.assertNotIn("_blank", writer.__globals__)
+
+    def test_round_trip(self):
+        path = os.path.join(self.tmp, "feed.xml.gz")
+
+        dicts_to_yml(
+            dict(self.shop, offers=self.offers[:2]), iter(self.offers[2:]),
+            path, date=self.feed._date,
+        )
+        with gzip.open(path) as f:
+            feed = YML(f).parse()
+        self.assertEqual(feed.to_dict(), self.feed.to_dict())
+
+    def test_element_text(self):
+        for offer in self.feed.shop.offers:
+            el = offer.to_xml()
+            el.set("note", "a\r\nb\t<c> & \"d\"")
+            self.assertEqual(element_text(el), ET.tostring(el, "unicode"))
+
+            indented = offer.to_xml()
+            YML.indent(indented, 3)
+            indented.tail = None
+            self.assertEqual(
+                element_text(offer.to_xml(), 3),
+                ET.tostring(indented, "unicode"),
+            )
+
+    def test_validation(self):
+        offer = SimplifiedOfferFactory().create().to_dict()
+        for field, value in (
+            ("weight", "heavy"),
+            ("store", "maybe"),
+            ("group_id", "1234567890"),
+            ("group_id", 1234567890),
+        ):
+            data = dict(offer, **{field: value})
+            with self.assertRaises(ValidationError):
+                AbstractOffer.from_dict(data)
+            with self.assertRaises(ValidationError):
+                self.write([data])
+
+        # The valid values of the batch don't skip the checks of the others
+        with self.assertRaises(ValidationError):
+            self.write([offer, dict(offer, group_id="1234567890")])
+        self.write([dict(offer, group_id="123456789")])
+
+        data = dict(offer)
+        del data["name"]
+        with self.assertRaisesRegex(TypeError, "missing required fields"):
+            self.write([data])
+        with self.assertRaisesRegex(TypeError, "unexpected fields"):
+            self.write([dict(offer, unknown=1)])
@@ -2,12 +2,20 @@ import os
 import re
 from operator import attrgetter
 
+from xml.dom import minidom
 from xml.etree import ElementTree as ET
 from unittest import TestCase
 
 from tests import factories
 from yandex_market_language import models
-from yandex_market_language import parse, convert
+from yandex_market_language.yml import YML
+from yandex_market_language import (
+    parse,
+    parse_header,
+    iter_offers,
+    convert,
+    convert_stream,
+)
 
 
 BASE_DIR = os.path.dirname(__file__)
@@ -67,3 +75,67 @@ class YMLTestCase(TestCase):
         parsed_feed = parse(TEST_XML_PATH)
         os.remove(TEST_XML_PATH)
         self.assertEqual(feed.to_dict(), parsed_feed.to_dict())
+
+    def test_iter_offers(self):
+        feed = parse(VALID_XML_PATH)
+        offers = list(iter_offers(VALID_XML_PATH))
+        self.assertEqual(
+            [o.to_dict() for o in offers],
+            [o.to_dict() for o in feed.shop.offers]
+        )
+
+    def test_iter_offers_releases_processed_elements(self):
+        # Offers and offer dicts are both read from this generator
+        elements = YML(VALID_XML_PATH)._iter_offer_elements()
+        next(elements)
+        next(elements)
+        offers_el = elements.gi_frame.f_locals["offers_el"]
+        self.assertEqual(offers_el.tag, "offers")
+        self.assertLessEqual(len(offers_el), 1)
+
+    def test_parse_header(self):
+        feed = parse(VALID_XML_PATH)
+        header = parse_header(VALID_XML_PATH)
+        self.assertEqual(header.shop.offers, [])
+
+        expected = feed.to_dict()
+        expected["shop"]["offers"] = []
+        self.assertEqual(header.to_dict(), expected)
+
+    def test_converts_feed_stream(self):
+        feed = factories.Feed()
+        expected = feed.to_dict()
+        offers = feed.shop.offers
+        feed.shop.offers = offers[:1]
+        convert_stream(TEST_XML_PATH, feed, (o for o in offers[1:]))
+        parsed_feed = parse(TEST_XML_PATH)
+        os.remove(TEST_XML_PATH)
+        self.assertEqual(expected, parsed_feed.to_dict())
+
+    def test_converts_feed_stream_to_file_object(self):
+        feed = factories.Feed()
+        with open(TEST_XML_PATH, "wb") as f:
+            convert_stream(f, feed)
+        parsed_feed = parse(TEST_XML_PATH)
+        os.remove(TEST_XML_PATH)
+        self.assertEqual(feed.to_dict(), parsed_feed.to_dict())
+
+    def test_prettify_el_matches_minidom(self):
+        feed = parse(VALID_XML_PATH)
+        raw = ET.tostring(feed.to_xml(), "utf-8")
+        prettified = minidom.parseString(raw).toprettyxml(indent="\t")
+        expected = ET.tostring(ET.fromstring(prettified), "utf-8")
+        el = YML.prettify_el(feed.to_xml())
+        self.assertEqual(ET.tostring(el, "utf-8"), expected)
+
+    def test_convert_stream_matches_convert(self):
+        feed = parse(VALID_XML_PATH)
+        for pretty in (True, False):
+            convert(TEST_XML_PATH, feed, pretty)
+            with open(TEST_XML_PATH, "rb") as f:
+                expected = f.read()
+            convert_stream(TEST_XML_PATH, feed, pretty=pretty)
+            with open(TEST_XML_PATH, "rb") as f:
+                data = f.read()
+            os.remove(TEST_XML_PATH)
+            self.assertEqual(data, expected)
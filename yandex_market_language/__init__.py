@@ -1,13 +1,91 @@
 """
 Top-level package for Yandex Market Language (YML) for Python.
 """
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 __author__ = """Alexandr Stefanitsky-Mozdor"""
 __email__ = "stefanitsky.mozdor@gmail.com"
 __version__ = "__version__ = '0.6.2'"
 
 
-from .yml import parse, convert
+if TYPE_CHECKING:
+    from .yml import (
+        parse,
+        parse_offers,
+        parse_header,
+        iter_offers,
+        iter_offer_dicts,
+        parse_to_jsonl,
+        dicts_to_yml,
+        convert,
+        convert_stream,
+    )
+    from .delta import diff_feeds
 
 
-__all__ = ["parse", "convert"]
+# Name -> module defining it, imported on the first access to the name
+_MODULES = {
+    "parse": ".yml",
+    "parse_offers": ".yml",
+    "parse_header": ".yml",
+    "iter_offers": ".yml",
+    "iter_offer_dicts": ".yml",
+    "parse_to_jsonl": ".yml",
+    "dicts_to_yml": ".yml",
+    "convert": ".yml",
+    "convert_stream": ".yml",
+    "diff_feeds": ".delta",
+}
+
+__all__ = [
+    "parse",
+    "parse_offers",
+    "parse_header",
+    "iter_offers",
+    "iter_offer_dicts",
+    "parse_to_jsonl",
+    "dicts_to_yml",
+    "convert",
+    "convert_stream",
+    "diff_feeds",
+]
+
+
+_SUBMODULES = frozenset({
+    "cache",
+    "compression",
+    "delta",
+    "errors",
+    "exceptions",
+    "index",
+    "instrumentation",
+    "mapped",
+    "models",
+    "parallel",
+    "table",
+    "validation",
+    "yml",
+})
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module("." + name, __name__)
+    if name not in _MODULES:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):  # Module __getattr__ is called since 3.7
+    for _name in __all__:
+        __getattr__(_name)
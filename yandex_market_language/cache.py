@@ -0,0 +1,178 @@
+"""
+On-disk cache of the parsed feeds.
+
+Feeds are stored as pickle snapshots keyed by the path, the errors mode of
+the parser, the size, the modification time and the content hash of the
+feed file, so a cache hit skips XML parsing and validation of the models.
+"""
+import os
+import pickle
+from hashlib import sha256
+from typing import Optional
+
+from yandex_market_language.models import Feed
+
+
+BLOCK_SIZE = 1024 * 1024
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+EXTENSION = ".pickle"
+
+
+class FeedCache:
+    """
+    Cache of the parsed feeds in the directory, limited by the total size
+    of the snapshots. The least recently used snapshots are removed when
+    the limit is exceeded.
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_size: int = DEFAULT_MAX_SIZE,
+        protocol: int = pickle.HIGHEST_PROTOCOL,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_size = max_size
+        self.protocol = protocol
+        self.hits = 0
+        self.misses = 0
+        # path -> (size, mtime, content hash) of the last hashed version
+        self._content_hashes = {}
+
+    def __repr__(self) -> str:
+        return "<FeedCache {d!r} hits={h} misses={m}>".format(
+            d=self.directory, h=self.hits, m=self.misses
+        )
+
+    @staticmethod
+    def _path_prefix(path) -> str:
+        path = os.path.abspath(path)
+        return sha256(path.encode()).hexdigest()[:16]
+
+    def _content_hash(self, path, size: int, mtime: int) -> str:
+        path = os.path.abspath(path)
+        cached = self._content_hashes.get(path)
+        if cached is not None and cached[:2] == (size, mtime):
+            return cached[2]
+
+        h = sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(BLOCK_SIZE), b""):
+                h.update(block)
+        content_hash = h.hexdigest()[:32]
+        self._content_hashes[path] = (size, mtime, content_hash)
+        return content_hash
+
+    def key(self, path, errors: str = "raise") -> str:
+        """
+        Returns the cache key of the feed file parsed in the errors mode.
+        """
+        stat = os.stat(path)
+        content_hash = self._content_hash(path, stat.st_size, stat.st_mtime_ns)
+        return "{p}-{e}-{s}-{m}-{h}".format(
+            p=self._path_prefix(path),
+            e=errors,
+            s=stat.st_size,
+            m=stat.st_mtime_ns,
+            h=content_hash,
+        )
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def _entries(self, prefix: str = "") -> list:
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.startswith(prefix) and name.endswith(EXTENSION)
+        ]
+
+    def get(self, path, errors: str = "raise") -> Optional["Feed"]:
+        """
+        Returns the cached feed of the file parsed in the errors mode or
+        None.
+        """
+        entry = self._entry(self.key(path, errors))
+        try:
+            with open(entry, "rb") as f:
+                feed = pickle.load(f)
+        except OSError:
+            self.misses += 1
+            return None
+        except (
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            TypeError,
+            ImportError,
+            IndexError,
+            ValueError,
+        ):
+            # Broken snapshot, or one of the models changed since it was
+            # stored
+            self._remove([entry])
+            self.misses += 1
+            return None
+        try:
+            os.utime(entry)  # mark the entry as recently used
+        except FileNotFoundError:  # evicted by another process meanwhile
+            pass
+        self.hits += 1
+        return feed
+
+    def put(self, path, feed: "Feed", errors: str = "raise"):
+        """
+        Stores the feed parsed from the file in the errors mode, replacing
+        the snapshots of the previous versions of the file in this mode.
+        """
+        key = self.key(path, errors)
+        self._remove(self._entries(
+            "{p}-{e}-".format(p=self._path_prefix(path), e=errors)
+        ))
+
+        entry = self._entry(key)
+        tmp = "{e}.{pid}.tmp".format(e=entry, pid=os.getpid())
+        with open(tmp, "wb") as f:
+            pickle.dump(feed, f, self.protocol)
+        os.replace(tmp, entry)
+        self._evict()
+
+    def invalidate(self, path=None):
+        """
+        Removes the snapshots of the file, or all snapshots without a path.
+        """
+        prefix = self._path_prefix(path) if path is not None else ""
+        self._remove(self._entries(prefix))
+
+    @staticmethod
+    def _remove(entries: list):
+        for entry in entries:
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                pass
+
+    @property
+    def size(self) -> int:
+        """
+        Returns the total size of the snapshots in bytes.
+        """
+        return sum(os.path.getsize(e) for e in self._entries())
+
+    def _evict(self):
+        """
+        Removes the least recently used snapshots exceeding the size limit.
+        """
+        entries = []
+        for entry in self._entries():
+            stat = os.stat(entry)
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        entries.sort(reverse=True)
+
+        total = 0
+        for _, size, entry in entries:
+            total += size
+            if total > self.max_size:
+                os.remove(entry)
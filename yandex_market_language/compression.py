@@ -0,0 +1,101 @@
+"""
+Transparent compression of the feed files.
+
+Compressed files are detected by the magic bytes when they're read and by
+the file extension when they're written, and are streamed through the codec
+without the uncompressed copy on disk. The codec modules are imported
+when the first compressed file is opened.
+"""
+import io
+from typing import Optional
+
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Compression format -> (file extension, magic bytes)
+FORMATS = {
+    "gzip": (".gz", b"\x1f\x8b"),
+    "bz2": (".bz2", b"BZh"),
+    "xz": (".xz", b"\xfd7zXZ\x00"),
+    "zstd": (".zst", b"\x28\xb5\x2f\xfd"),
+}
+
+
+def detect(path, mode: str = "rb") -> Optional[str]:
+    """
+    Returns the compression format of the file or None for a plain file.
+    The existing file is checked by the magic bytes, the file opened for
+    writing by the extension. Only paths are detected: file objects are
+    read and written as is, so a compressed file object must be wrapped
+    by its codec, e.g. gzip.open(f).
+    """
+    if "r" in mode:
+        with open(path, "rb") as f:
+            head = f.read(8)
+        for compression, (_, magic) in FORMATS.items():
+            if head.startswith(magic):
+                return compression
+        return None
+
+    path = str(path)
+    for compression, (extension, _) in FORMATS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+def _open_codec(path, mode: str, compression: str, level: Optional[int]):
+    if compression == "gzip":
+        import gzip
+        if level is None:
+            return gzip.open(path, mode)
+        return gzip.open(path, mode, compresslevel=level)
+    elif compression == "bz2":
+        import bz2
+        if level is None:
+            return bz2.open(path, mode)
+        return bz2.open(path, mode, compresslevel=level)
+    elif compression == "xz":
+        import lzma
+        return lzma.open(path, mode, preset=level)
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is required for the zstd compressed feeds, "
+                "install it with: pip install zstandard"
+            )
+        if "r" in mode:
+            return zstandard.open(path, mode)
+        cctx = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return zstandard.open(path, mode, cctx=cctx)
+    raise ValueError(
+        "Unknown compression {c!r}, expected one of: {f}".format(
+            c=compression, f=", ".join(FORMATS)
+        )
+    )
+
+
+def open_file(
+    path,
+    mode: str = "rb",
+    compression: Optional[str] = "infer",
+    level: int = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+):
+    """
+    Opens the feed file in the binary mode, compressed files are decoded or
+    encoded on the fly. The compression is one of FORMATS, "infer" to detect
+    it or None for a plain file. The level is passed to the codec, while the
+    buffer size sets the size of the blocks passed to the codec.
+    """
+    if compression == "infer":
+        compression = detect(path, mode)
+    if compression is None:
+        return open(path, mode, buffering=buffer_size)
+
+    f = _open_codec(path, mode, compression, level)
+    if "r" in mode:
+        return io.BufferedReader(f, buffer_size)
+    return io.BufferedWriter(f, buffer_size)
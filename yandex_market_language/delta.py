@@ -0,0 +1,86 @@
+"""
+Difference between two feeds, computed from the offer content digests.
+"""
+import copy
+from itertools import chain
+from typing import Iterable, List, Union
+
+from yandex_market_language.models import Feed
+from yandex_market_language.models.offers import AbstractOffer
+
+
+Offers = Union["Feed", Iterable["AbstractOffer"]]
+
+
+def _offers(feed_or_offers: Offers) -> Iterable["AbstractOffer"]:
+    if isinstance(feed_or_offers, Feed):
+        return feed_or_offers.shop.offers
+    return feed_or_offers
+
+
+class FeedDelta:
+    """
+    Offers added, removed and changed in the new feed.
+    The added and changed offers are taken from the new feed, while only ids
+    of the removed offers are kept.
+    """
+
+    __slots__ = [
+        "added",
+        "removed",
+        "changed",
+    ]
+
+    def __init__(
+        self,
+        added: List["AbstractOffer"],
+        removed: List[str],
+        changed: List["AbstractOffer"],
+    ):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __repr__(self) -> str:
+        return "<FeedDelta added={a} removed={r} changed={c}>".format(
+            a=len(self.added), r=len(self.removed), c=len(self.changed)
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_yml(self, file_or_path, feed: "Feed", pretty: bool = True):
+        """
+        Writes the partial feed with the added and the changed offers.
+        The feed is used as a header, its own offers aren't written.
+        """
+        from yandex_market_language.yml import convert_stream
+
+        header = copy.copy(feed)
+        header.shop = copy.copy(feed.shop)
+        header.shop.offers = []
+        offers = chain(self.added, self.changed)
+        convert_stream(file_or_path, header, offers, pretty)
+
+
+def diff_feeds(old: Offers, new: Offers) -> "FeedDelta":
+    """
+    Compares the offers of two feeds by ids and content digests.
+    Feeds may be given as models or as iterables of offers, e.g. from
+    iter_offers, then only the ids and the digests of the old offers and
+    the offers of the delta are kept in memory.
+    """
+    digests = {}
+    for offer in _offers(old):
+        digests[offer.offer_id] = offer.digest()
+
+    added = []
+    changed = []
+    for offer in _offers(new):
+        digest = digests.pop(offer.offer_id, None)
+        if digest is None:
+            added.append(offer)
+        elif digest != offer.digest():
+            changed.append(offer)
+
+    return FeedDelta(added, list(digests), changed)
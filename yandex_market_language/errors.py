@@ -0,0 +1,143 @@
+"""
+Records of the offers rejected while parsing a feed with errors collected.
+"""
+from typing import Dict, Optional, Tuple
+from xml.etree import ElementTree as ET
+from xml.parsers import expat
+
+from yandex_market_language.exceptions import YMLException
+
+
+ERROR_MODES = ("raise", "collect")
+
+# Errors of invalid offer data: validation errors, unknown offer types and
+# missing required elements or malformed offer markup
+COLLECTED_ERRORS = (YMLException, TypeError, ValueError, ET.ParseError)
+
+
+def check_mode(errors: str):
+    if errors not in ERROR_MODES:
+        raise ValueError("errors must be one of: {0}".format(
+            ", ".join(ERROR_MODES)
+        ))
+
+
+def _fixname(name: str) -> str:
+    # Expanded names as ElementTree writes them: "{uri}tag"
+    return "{" + name if "}" in name else name
+
+
+def parse_positions(
+    f, chunk_size: int = 64 * 1024
+) -> Tuple["ET.Element", Dict["ET.Element", Tuple[int, int]]]:
+    """
+    Parses the XML file to the element tree as ET.parse() does it, and
+    returns the root element with the line numbers and the byte positions
+    of the offer elements reported by the expat parser.
+    """
+    builder = ET.TreeBuilder()
+    parser = expat.ParserCreate(None, "}")
+    parser.buffer_text = True
+    positions = {}
+
+    def start(tag, attrib):
+        el = builder.start(
+            _fixname(tag), {_fixname(k): v for k, v in attrib.items()}
+        )
+        if tag == "offer":
+            positions[el] = (
+                parser.CurrentLineNumber, parser.CurrentByteIndex
+            )
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = lambda tag: builder.end(_fixname(tag))
+    parser.CharacterDataHandler = builder.data
+    try:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+    except expat.ExpatError as e:
+        error = ET.ParseError(str(e))
+        error.code = e.code
+        error.position = (e.lineno, e.offset)
+        raise error from None
+    return builder.close(), positions
+
+
+class OfferError:
+    """
+    Invalid offer skipped by the parser.
+
+    The index is the number of the offer in the feed, the field and the
+    value are set for validation errors. The line and the byte position of
+    the offer element in the uncompressed feed are set by the parser.
+    The offer element is kept to inspect or quarantine the offer.
+    """
+
+    __slots__ = (
+        "index",
+        "offer_id",
+        "field",
+        "value",
+        "message",
+        "line",
+        "position",
+        "element",
+    )
+
+    def __init__(
+        self,
+        index: int,
+        offer_id: Optional[str],
+        field: Optional[str],
+        value,
+        message: str,
+        line: int = None,
+        position: int = None,
+        element: "ET.Element" = None,
+    ):
+        self.index = index
+        self.offer_id = offer_id
+        self.field = field
+        self.value = value
+        self.message = message
+        self.line = line
+        self.position = position
+        self.element = element
+
+    @classmethod
+    def from_exception(
+        cls,
+        exc: Exception,
+        index: int,
+        element: "ET.Element" = None,
+        line: int = None,
+        position: int = None,
+    ) -> "OfferError":
+        offer_id = element.attrib.get("id") if element is not None else None
+        return cls(
+            index,
+            offer_id,
+            getattr(exc, "field", None),
+            getattr(exc, "value", None),
+            str(exc),
+            line,
+            position,
+            element,
+        )
+
+    def __repr__(self) -> str:
+        return "<OfferError #{i} id={id!r} field={f!r}: {m}>".format(
+            i=self.index, id=self.offer_id, f=self.field, m=self.message
+        )
+
+    def to_dict(self) -> dict:
+        return dict(
+            index=self.index,
+            offer_id=self.offer_id,
+            field=self.field,
+            value=self.value,
+            message=self.message,
+            line=self.line,
+            position=self.position,
+        )
@@ -8,8 +8,12 @@ class YMLException(Exception):
 class ValidationError(YMLException):
     """
     Data validation exception.
+    Keeps the name of the invalid field and its value when they're known.
     """
-    pass
+    def __init__(self, message, field: str = None, value=None):
+        super().__init__(message)
+        self.field = field
+        self.value = value
 
 
 class ParseError(YMLException):
@@ -0,0 +1,270 @@
+"""
+Byte-offset index of the feed offers.
+
+The feed file is scanned once and the spans of the offers are stored in a
+sidecar file together with the offer ids, types, groups and categories, so
+the offers are loaded by id reading only their own bytes of the feed.
+"""
+import os
+import pickle
+import re
+from array import array
+from html import unescape
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.exceptions import ParseError
+from yandex_market_language.mapped import MappedFeed
+from yandex_market_language.models import Shop
+from yandex_market_language.models.offers import AbstractOffer
+
+
+EXTENSION = ".idx"
+VERSION = 1
+
+id_pattern = re.compile(rb"""\sid\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+type_pattern = re.compile(rb"""\stype\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+group_id_pattern = re.compile(rb"<group_id>\s*([^<]*?)\s*</group_id>")
+category_id_pattern = re.compile(rb"<categoryId>\s*([^<]*?)\s*</categoryId>")
+
+
+def _attribute(pattern, data, start: int, end: int) -> Optional[bytes]:
+    m = pattern.search(data, start, end)
+    if m is None:
+        return None
+    return m.group(1) if m.group(1) is not None else m.group(2)
+
+
+def _group_id(m) -> int:
+    """
+    Returns the group id of the match, or 0 as for the offers without the
+    group if it's invalid: the error is raised when the offer is loaded.
+    """
+    if m is None:
+        return 0
+    try:
+        group_id = int(m.group(1))
+    except ValueError:
+        return 0
+    return group_id if 0 < group_id < 10 ** 9 else 0
+
+
+class FeedIndex:
+    """
+    Index of the offers of the feed file by offer id, with the offer type,
+    group id and category id of every offer.
+    """
+
+    def __init__(
+        self,
+        path,
+        encoding: str,
+        fingerprint: Tuple[int, int],
+        offer_ids: List[str],
+        types: List[Optional[str]],
+        group_ids: "array",
+        category_ids: List[Optional[str]],
+        offsets: "array",
+        lengths: "array",
+    ):
+        self.path = path
+        self.encoding = encoding
+        self.fingerprint = fingerprint
+        self.offer_ids = offer_ids
+        self.types = types
+        self.group_ids = group_ids
+        self.category_ids = category_ids
+        self.offsets = offsets
+        self.lengths = lengths
+        self._rows = {offer_id: i for i, offer_id in enumerate(offer_ids)}
+        self._groups = None
+        self._categories = None
+
+    def __repr__(self) -> str:
+        return "<FeedIndex {path!r} offers={n}>".format(
+            path=self.path, n=len(self)
+        )
+
+    def __len__(self) -> int:
+        return len(self.offer_ids)
+
+    def __contains__(self, offer_id: str) -> bool:
+        return offer_id in self._rows
+
+    @staticmethod
+    def _fingerprint(path) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def sidecar_path(path) -> str:
+        return str(path) + EXTENSION
+
+    @classmethod
+    def build(cls, path) -> "FeedIndex":
+        """
+        Scans the feed file and indexes its offers.
+        """
+        fingerprint = cls._fingerprint(path)
+        offer_ids = []
+        types = []
+        group_ids = array("q")
+        category_ids = []
+        offsets = array("q")
+        lengths = array("q")
+
+        with MappedFeed(path) as feed:
+            m = feed._map
+            encoding = feed.encoding
+
+            def decode(value: Optional[bytes]) -> Optional[str]:
+                if value is None:
+                    return None
+                return unescape(value.decode(encoding))
+
+            for start, end in zip(*feed.spans):
+                tag_end = m.find(b">", start, end)
+                offer_id = _attribute(id_pattern, m, start, tag_end)
+                if offer_id is None:
+                    raise ParseError(
+                        "Offer element at {0} has no id".format(start)
+                    )
+                offer_type = _attribute(type_pattern, m, start, tag_end)
+                group_id = group_id_pattern.search(m, tag_end, end)
+                category_id = category_id_pattern.search(m, tag_end, end)
+
+                offer_ids.append(decode(offer_id))
+                types.append(decode(offer_type))
+                group_ids.append(_group_id(group_id))
+                category_ids.append(
+                    decode(category_id.group(1)) if category_id else None
+                )
+                offsets.append(start)
+                lengths.append(end - start)
+
+        return cls(
+            path,
+            encoding,
+            fingerprint,
+            offer_ids,
+            types,
+            group_ids,
+            category_ids,
+            offsets,
+            lengths,
+        )
+
+    def save(self, index_path=None):
+        """
+        Writes the index to the sidecar file, by default next to the feed.
+        """
+        if index_path is None:
+            index_path = self.sidecar_path(self.path)
+        state = dict(
+            version=VERSION,
+            encoding=self.encoding,
+            fingerprint=self.fingerprint,
+            offer_ids=self.offer_ids,
+            types=self.types,
+            group_ids=self.group_ids,
+            category_ids=self.category_ids,
+            offsets=self.offsets,
+            lengths=self.lengths,
+        )
+        tmp = "{p}.{pid}.tmp".format(p=index_path, pid=os.getpid())
+        with open(tmp, "wb") as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_path)
+
+    @classmethod
+    def load(cls, path, index_path=None) -> "FeedIndex":
+        """
+        Reads the index of the feed file from the sidecar file.
+        Raises ParseError if the index is stale, i.e. the feed file was
+        changed after the index was built.
+        """
+        if index_path is None:
+            index_path = cls.sidecar_path(path)
+        with open(index_path, "rb") as f:
+            state = pickle.load(f)
+        if state.pop("version") != VERSION:
+            raise ParseError("Unsupported feed index version")
+        if tuple(state["fingerprint"]) != cls._fingerprint(path):
+            raise ParseError("Feed index is stale: {0}".format(index_path))
+        return cls(path, **state)
+
+    @classmethod
+    def open(cls, path, index_path=None) -> "FeedIndex":
+        """
+        Loads the index of the feed file, or builds and saves it if the
+        sidecar file is missing or stale.
+        """
+        try:
+            return cls.load(path, index_path)
+        except (OSError, EOFError, pickle.UnpicklingError, ParseError):
+            index = cls.build(path)
+            index.save(index_path)
+            return index
+
+    def span(self, offer_id: str) -> Tuple[int, int]:
+        """
+        Returns the byte offset and the length of the offer element.
+        """
+        i = self._rows[offer_id]
+        return self.offsets[i], self.lengths[i]
+
+    def type_of(self, offer_id: str) -> Optional[str]:
+        return self.types[self._rows[offer_id]]
+
+    def _grouped(self, keys) -> Dict[object, List[str]]:
+        groups = {}
+        for offer_id, key in zip(self.offer_ids, keys):
+            if key:
+                groups.setdefault(key, []).append(offer_id)
+        return groups
+
+    def by_group(self, group_id: int) -> List[str]:
+        """
+        Returns ids of the offers of the group.
+        """
+        if self._groups is None:
+            self._groups = self._grouped(self.group_ids)
+        return self._groups.get(group_id, [])
+
+    def by_category(self, category_id: str) -> List[str]:
+        """
+        Returns ids of the offers of the category.
+        """
+        if self._categories is None:
+            self._categories = self._grouped(self.category_ids)
+        return self._categories.get(category_id, [])
+
+    def get(self, offer_id: str) -> Optional["AbstractOffer"]:
+        """
+        Loads the offer by id or returns None if there is no such offer.
+        """
+        if offer_id not in self._rows:
+            return None
+        return self.offers([offer_id])[0]
+
+    def __getitem__(self, offer_id: str) -> "AbstractOffer":
+        return self.offers([offer_id])[0]
+
+    def offers(self, offer_ids: Iterable[str]) -> List["AbstractOffer"]:
+        """
+        Loads the offers by ids, reading only their elements from the feed
+        file in the order of their offsets.
+        Raises KeyError if any offer is missing.
+        """
+        offer_ids = list(offer_ids)
+        rows = [self._rows[offer_id] for offer_id in offer_ids]
+
+        elements = {}
+        with open(self.path, "rb") as f:
+            for i in sorted(set(rows), key=self.offsets.__getitem__):
+                f.seek(self.offsets[i])
+                parser = ET.XMLParser(encoding=self.encoding)
+                parser.feed(f.read(self.lengths[i]))
+                elements[i] = parser.close()
+
+        return [Shop.offer_from_xml(elements[i]) for i in rows]
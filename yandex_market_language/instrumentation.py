@@ -0,0 +1,161 @@
+"""
+Instrumentation of parsing and converting feeds.
+
+A hooks object passed to parse or convert receives the timings of the
+stages, the counts of the offers by type, the number of validation failures
+and the number of bytes read or written. Without hooks nothing is measured.
+"""
+from collections import Counter
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+PARSE = "parse"
+CONVERT = "convert"
+
+# Stages of parsing: tokenising the XML and building the models, which
+# validates the values in the setters. Feeds parsed from the memory-mapped
+# file or in workers interleave both, so the whole time is reported as
+# "parse". "cache" is the time spent in the feed cache.
+READ = "read"
+BUILD = "build"
+CACHE = "cache"
+
+# Stages of converting: building the XML tree from the models, indenting it
+# and encoding it to the file
+SERIALIZE = "serialize"
+PRETTIFY = "prettify"
+WRITE = "write"
+
+
+class Hooks:
+    """
+    Receiver of the metrics of parse and convert. The methods do nothing,
+    subclasses override the ones they need, e.g. to feed the metrics to
+    the Prometheus or StatsD client.
+
+    The operation is "parse" or "convert". The offer types are the values
+    of the type attribute, None for the offers without it.
+    """
+
+    def stage(self, operation: str, stage: str, seconds: float):
+        pass
+
+    def offers(self, operation: str, counts: Dict[Optional[str], int]):
+        pass
+
+    def validation_failures(self, operation: str, count: int):
+        pass
+
+    def bytes_read(self, count: int):
+        pass
+
+    def bytes_written(self, count: int):
+        pass
+
+
+class Metrics(Hooks):
+    """
+    Hooks accumulating the metrics of all operations, which can be
+    exported as the samples of counters.
+    """
+
+    def __init__(self):
+        self.seconds = Counter()
+        self.offer_counts = Counter()
+        self.failures = Counter()
+        self.read = 0
+        self.written = 0
+
+    def stage(self, operation: str, stage: str, seconds: float):
+        self.seconds[operation, stage] += seconds
+
+    def offers(self, operation: str, counts: Dict[Optional[str], int]):
+        for offer_type, count in counts.items():
+            self.offer_counts[operation, offer_type] += count
+
+    def validation_failures(self, operation: str, count: int):
+        self.failures[operation] += count
+
+    def bytes_read(self, count: int):
+        self.read += count
+
+    def bytes_written(self, count: int):
+        self.written += count
+
+    def samples(self) -> Iterator[Tuple[str, dict, float]]:
+        """
+        Yields the name, the labels and the value of every counter.
+        Offers without the type attribute are labelled "simplified".
+        """
+        for (operation, stage), seconds in self.seconds.items():
+            yield "yml_stage_seconds_total", dict(
+                operation=operation, stage=stage
+            ), seconds
+        for (operation, offer_type), count in self.offer_counts.items():
+            yield "yml_offers_total", dict(
+                operation=operation, type=offer_type or "simplified"
+            ), count
+        for operation, count in self.failures.items():
+            yield "yml_validation_failures_total", dict(
+                operation=operation
+            ), count
+        yield "yml_read_bytes_total", {}, self.read
+        yield "yml_written_bytes_total", {}, self.written
+
+
+class Timer:
+    """
+    Reports the time elapsed since the previous stage to the hooks.
+    """
+
+    __slots__ = ("hooks", "operation", "start")
+
+    def __init__(self, hooks: "Hooks", operation: str):
+        self.hooks = hooks
+        self.operation = operation
+        self.start = perf_counter()
+
+    def stage(self, stage: str):
+        now = perf_counter()
+        self.hooks.stage(self.operation, stage, now - self.start)
+        self.start = now
+
+    def reset(self):
+        """
+        Starts the next stage, e.g. after the time reported elsewhere.
+        """
+        self.start = perf_counter()
+
+
+class CountingFile:
+    """
+    File wrapper counting the bytes read from or written to the file.
+    """
+
+    __slots__ = ("file", "count")
+
+    def __init__(self, file):
+        self.file = file
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.file.read(size)
+        self.count += len(data)
+        return data
+
+    def write(self, data: bytes) -> int:
+        self.count += len(data)
+        return self.file.write(data)
+
+    def __getattr__(self, name: str):
+        return getattr(self.file, name)
+
+
+def offer_counts(offers: Iterable) -> Dict[Optional[str], int]:
+    """
+    Returns the number of the offers of every type. Lazy offers are
+    counted by their model without being parsed.
+    """
+    return Counter(
+        getattr(offer, "offer_cls", type(offer)).__TYPE__ for offer in offers
+    )
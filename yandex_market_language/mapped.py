@@ -0,0 +1,309 @@
+"""
+Memory-mapped feed files.
+
+The file is mapped into memory and the offer elements are located with a
+byte scan, so each offer is parsed from its slice of the mapping without
+reading the whole file, which allows random access to the offers. The scan
+skips comments, CDATA sections and processing instructions, as the tags in
+them aren't elements.
+"""
+import mmap
+import re
+from array import array
+from typing import Iterator, List, Tuple, Union
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.exceptions import ParseError
+from yandex_market_language.models import Feed, Shop
+from yandex_market_language.models.abstract import XMLElement
+from yandex_market_language.models.offers import AbstractOffer
+
+
+OFFER_TAG = b"<offer"
+OFFER_END_TAG = b"</offer>"
+OFFERS_START_TAG = b"<offers"
+OFFERS_END_TAG = b"</offers>"
+
+# Characters which may follow the tag name
+TAG_NAME_END = frozenset(b" \t\r\n/>")
+
+# Openings of the markup which may contain tags, and their closings
+MARKUP_CLOSINGS = {b"<!--": b"-->", b"<![CDATA[": b"]]>", b"<?": b"?>"}
+markup_pattern = re.compile(rb"<[!?]")
+
+encoding_pattern = re.compile(rb"""encoding=["']([A-Za-z0-9._-]+)["']""")
+
+
+class MappedFeed:
+    """
+    Feed file mapped into memory.
+
+    Offers are located by the byte scan on the first access by index and
+    their spans are kept in compact arrays, so any offer or a range of
+    offers can be parsed without parsing the preceding ones.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.encoding = self._detect_encoding()
+        self._bounds = None
+        self._starts = None
+        self._ends = None
+
+    def __repr__(self) -> str:
+        return "<MappedFeed {path!r}>".format(path=self.path)
+
+    def __enter__(self) -> "MappedFeed":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def _detect_encoding(self) -> str:
+        head = self._map[:256].split(b"?>", 1)[0]
+        m = encoding_pattern.search(head)
+        return m.group(1).decode() if m else "utf-8"
+
+    def _markup(self, start: int, stop: int) -> Tuple[int, bytes]:
+        """
+        Returns the position and the opening of the first comment, CDATA
+        section or processing instruction opened from the start position
+        before the stop position, or -1 and None if there is none.
+        """
+        m = self._map
+        match = markup_pattern.search(m, start, stop + 1)
+        while match is not None:
+            pos = match.start()
+            for opening in MARKUP_CLOSINGS:
+                if m[pos:pos + len(opening)] == opening:
+                    return pos, opening
+            # Declarations, e.g. <!DOCTYPE>, can't contain tags
+            match = markup_pattern.search(m, pos + 2, stop + 1)
+        return -1, None
+
+    def _markup_end(self, pos: int, opening: bytes) -> int:
+        """
+        Returns the position after the closing of the markup.
+        """
+        closing = MARKUP_CLOSINGS[opening]
+        end = self._map.find(closing, pos + len(opening))
+        if end == -1:
+            raise ParseError("Markup at {0} is not closed".format(pos))
+        return end + len(closing)
+
+    def find(self, sub: bytes, start: int, stop: int = None) -> int:
+        """
+        Returns the position of the bytes outside comments, CDATA sections
+        and processing instructions from the start position, which is
+        outside of them, or -1 if they weren't found.
+        """
+        m = self._map
+        if stop is None:
+            stop = len(m)
+        pos = m.find(sub, start, stop)
+        while pos != -1:
+            markup, opening = self._markup(start, pos)
+            if markup == -1:
+                return pos
+            start = self._markup_end(markup, opening)
+            pos = m.find(sub, start, stop)
+        return pos
+
+    def skip_markup(self, start: int, pos: int) -> int:
+        """
+        Returns the position, or the end of the comment, CDATA section or
+        processing instruction containing it. The start position is a
+        position before it outside of them.
+        """
+        markup, opening = self._markup(start, pos)
+        while markup != -1:
+            start = self._markup_end(markup, opening)
+            if start >= pos:
+                return start
+            markup, opening = self._markup(start, pos)
+        return pos
+
+    def find_tag(self, tag: bytes, start: int, stop: int = None) -> int:
+        """
+        Returns the position of the opening tag (and not of a tag with
+        a longer name) from the start position, or -1 if it wasn't found.
+        """
+        m = self._map
+        pos = self.find(tag, start, stop)
+        while pos != -1:
+            i = pos + len(tag)
+            if i < len(m) and m[i] in TAG_NAME_END:
+                return pos
+            pos = self.find(tag, i, stop)
+        return pos
+
+    @property
+    def offers_bounds(self) -> Tuple[int, int]:
+        """
+        Returns the start and the end of the <offers> element content.
+        """
+        if self._bounds is None:
+            m = self._map
+            pos = self.find_tag(OFFERS_START_TAG, 0)
+            if pos == -1:
+                raise ParseError("Feed file has no offers element")
+            start = m.find(b">", pos) + 1
+            if m[start - 2] == ord("/"):  # <offers/>
+                end = start
+            else:
+                end = self.find(OFFERS_END_TAG, start)
+                if end == -1:
+                    raise ParseError("Feed file has no closing offers element")
+            self._bounds = (start, end)
+        return self._bounds
+
+    def _scan(self):
+        """
+        Locates all offer elements in the <offers> element.
+        """
+        m = self._map
+        start, end = self.offers_bounds
+        starts = array("q")
+        ends = array("q")
+
+        pos = self.find_tag(OFFER_TAG, start, end)
+        while pos != -1:
+            gt = m.find(b">", pos, end)
+            if gt == -1:
+                raise ParseError(
+                    "Offer element at {0} is not closed".format(pos)
+                )
+            if m[gt - 1] == ord("/"):  # <offer .../>
+                offer_end = gt + 1
+            else:
+                offer_end = self.find(OFFER_END_TAG, gt, end)
+                if offer_end == -1:
+                    raise ParseError(
+                        "Offer element at {0} is not closed".format(pos)
+                    )
+                offer_end += len(OFFER_END_TAG)
+            starts.append(pos)
+            ends.append(offer_end)
+            pos = self.find_tag(OFFER_TAG, offer_end, end)
+
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        if self._starts is None:
+            self._scan()
+        return len(self._starts)
+
+    @property
+    def spans(self) -> Tuple["array", "array"]:
+        """
+        Returns the arrays of the start and the end positions of the offers.
+        """
+        if self._starts is None:
+            self._scan()
+        return self._starts, self._ends
+
+    def span(self, i: int) -> Tuple[int, int]:
+        """
+        Returns the start and the end position of the offer element.
+        """
+        i = range(len(self))[i]
+        return self._starts[i], self._ends[i]
+
+    def find_offer(self, start: int, stop: int) -> int:
+        """
+        Returns the position of the first offer element starting after the
+        start position, or the stop position if there is no such offer.
+        """
+        pos = self.find_tag(OFFER_TAG, start, stop)
+        return stop if pos == -1 else pos
+
+    def offer_chunks(self, chunks: int) -> List[Tuple[int, int]]:
+        """
+        Splits the <offers> element content into byte ranges aligned to the
+        offer elements, without locating every offer.
+        """
+        start, end = self.offers_bounds
+        size = max((end - start) // max(chunks, 1), 1)
+        bounds = [self.find_offer(start, end)]
+        for i in range(1, chunks):
+            pos = max(start + i * size, bounds[-1])
+            pos = min(self.skip_markup(bounds[-1], pos), end)
+            offer_start = self.find_offer(pos, end)
+            if offer_start > bounds[-1]:
+                bounds.append(offer_start)
+        bounds.append(end)
+        return [r for r in zip(bounds, bounds[1:]) if r[0] < r[1]]
+
+    def _parser(self) -> "ET.XMLParser":
+        return ET.XMLParser(encoding=self.encoding)
+
+    def _feed(self, parser: "ET.XMLParser", start: int, end: int):
+        """
+        Feeds the slice of the mapping to the parser without copying it.
+        """
+        with memoryview(self._map) as view, view[start:end] as data:
+            parser.feed(data)
+
+    def offer_element(self, i: int) -> XMLElement:
+        parser = self._parser()
+        self._feed(parser, *self.span(i))
+        return parser.close()
+
+    def offer(self, i: int, lazy: bool = False) -> "AbstractOffer":
+        """
+        Parses the offer by its index in the feed.
+        """
+        return Shop.offer_from_xml(self.offer_element(i), lazy)
+
+    def __getitem__(
+        self, key: Union[int, slice]
+    ) -> Union["AbstractOffer", List["AbstractOffer"]]:
+        if isinstance(key, slice):
+            return [self.offer(i) for i in range(len(self))[key]]
+        return self.offer(key)
+
+    def iter_range(
+        self, start: int, end: int, lazy: bool = False
+    ) -> Iterator["AbstractOffer"]:
+        """
+        Parses the offers from the byte range aligned to offer elements.
+        """
+        parser = self._parser()
+        parser.feed(b"<offers>")
+        self._feed(parser, start, end)
+        parser.feed(b"</offers>")
+        for offer_el in parser.close():
+            yield Shop.offer_from_xml(offer_el, lazy)
+
+    def iter_offers(
+        self, start: int = 0, stop: int = None, lazy: bool = False
+    ) -> Iterator["AbstractOffer"]:
+        """
+        Iterates over the offers with indexes from start to stop.
+        """
+        for i in range(len(self))[start:stop]:
+            yield self.offer(i, lazy)
+
+    def parse_header(self) -> "Feed":
+        """
+        Parses the feed without offers, skipping the <offers> content.
+        """
+        start, end = self.offers_bounds
+        parser = self._parser()
+        self._feed(parser, 0, start)
+        self._feed(parser, end, len(self._map))
+        return Feed.from_xml(parser.close())
+
+    def parse(self, lazy: bool = False) -> "Feed":
+        """
+        Parses the feed, every offer is parsed from its own slice.
+        """
+        feed = self.parse_header()
+        feed.shop.offers = list(self.iter_offers(lazy=lazy))
+        return feed
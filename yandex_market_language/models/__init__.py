@@ -1,29 +1,78 @@
-from . import fields
-
-from .abstract import AbstractModel
-from .feed import Feed
-from .shop import Shop
-from .currency import Currency
-from .category import Category
-from .option import Option
-from .price import Price
-from .offers import (
-    SimplifiedOffer,
-    ArbitraryOffer,
-    BookOffer,
-    AudioBookOffer,
-    MusicVideoOffer,
-    MedicineOffer,
-    EventTicketOffer,
-    AlcoholOffer,
-)
-from .parameter import Parameter
-from .condition import Condition
-from .dimensions import Dimensions
-from .age import Age
-from .gift import Gift
-from .promo import Promo, Purchase, Product, PromoGift
+"""
+Models of the feed elements.
 
+The model modules are imported on the first access to their names, so
+importing the package doesn't load the models that aren't used.
+"""
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import fields
+    from .abstract import AbstractModel
+    from .feed import Feed
+    from .shop import Shop
+    from .currency import Currency
+    from .category import Category
+    from .option import Option
+    from .price import Price
+    from .offers import (
+        OFFER_TYPES,
+        register_offer_type,
+        get_offer_class,
+        SimplifiedOffer,
+        ArbitraryOffer,
+        BookOffer,
+        AudioBookOffer,
+        MusicVideoOffer,
+        MedicineOffer,
+        EventTicketOffer,
+        AlcoholOffer,
+    )
+    from .lazy import LazyOffer
+    from .indexes import CategoryIndex, OfferList
+    from .parameter import Parameter
+    from .condition import Condition
+    from .dimensions import Dimensions
+    from .age import Age
+    from .gift import Gift
+    from .promo import Promo, Purchase, Product, PromoGift
+
+
+# Name -> module defining it
+_MODULES = {
+    "AbstractModel": ".abstract",
+    "Feed": ".feed",
+    "Shop": ".shop",
+    "Currency": ".currency",
+    "Category": ".category",
+    "Option": ".option",
+    "Price": ".price",
+    "OFFER_TYPES": ".offers",
+    "register_offer_type": ".offers",
+    "get_offer_class": ".offers",
+    "SimplifiedOffer": ".offers",
+    "ArbitraryOffer": ".offers",
+    "BookOffer": ".offers",
+    "AudioBookOffer": ".offers",
+    "MusicVideoOffer": ".offers",
+    "MedicineOffer": ".offers",
+    "EventTicketOffer": ".offers",
+    "AlcoholOffer": ".offers",
+    "LazyOffer": ".lazy",
+    "CategoryIndex": ".indexes",
+    "OfferList": ".indexes",
+    "Parameter": ".parameter",
+    "Condition": ".condition",
+    "Dimensions": ".dimensions",
+    "Age": ".age",
+    "Gift": ".gift",
+    "Promo": ".promo",
+    "Purchase": ".promo",
+    "Product": ".promo",
+    "PromoGift": ".promo",
+}
 
 __all__ = [
     "fields",
@@ -34,6 +83,9 @@ __all__ = [
     "Category",
     "Option",
     "Price",
+    "OFFER_TYPES",
+    "register_offer_type",
+    "get_offer_class",
     "SimplifiedOffer",
     "ArbitraryOffer",
     "BookOffer",
@@ -42,6 +94,9 @@ __all__ = [
     "MedicineOffer",
     "EventTicketOffer",
     "AlcoholOffer",
+    "LazyOffer",
+    "CategoryIndex",
+    "OfferList",
     "Parameter",
     "Condition",
     "Dimensions",
@@ -52,3 +107,46 @@ __all__ = [
     "Product",
     "PromoGift",
 ]
+
+_SUBMODULES = frozenset({
+    "abstract",
+    "age",
+    "category",
+    "condition",
+    "currency",
+    "dimensions",
+    "feed",
+    "fields",
+    "gift",
+    "indexes",
+    "lazy",
+    "offers",
+    "option",
+    "parameter",
+    "price",
+    "promo",
+    "schema",
+    "shop",
+})
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module("." + name, __name__)
+    if name not in _MODULES:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name)
+        )
+    value = getattr(import_module(_MODULES[name], __name__), name)
+    # Later lookups find the name without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):  # Module __getattr__ is called since 3.7
+    for _name in __all__:
+        __getattr__(_name)
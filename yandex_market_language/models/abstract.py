@@ -1,19 +1,88 @@
+import os
+import random
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, Union
+from inspect import Parameter, signature
+from typing import Dict, List, Optional, Union
 from xml.etree import ElementTree as ET
 
-from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.exceptions import ValidationError, YMLException
+from yandex_market_language.validation import Validated
+
+from .schema import dict_fields
 
 
 XMLElement = ET.Element
 XMLSubElement = ET.SubElement
 
+_init_fields = {}
+_trusted_plans = {}
+_trusted_inits = {}
+
+# Share of the models created with trusted() that are validated after the
+# creation, set with the YML_VALIDATE_TRUSTED environment variable
+TRUSTED_VALIDATION_RATE = float(os.environ.get("YML_VALIDATE_TRUSTED", 0))
+
+_MISSING = object()
+
+
+class TrustedConstructor:
+    """
+    Model.trusted(**fields) creates the model from the values in the form
+    the model stores them, writing the slots without validation: strings
+    for numbers, "true" and "false" for booleans, formatted strings for
+    dates and models for nested elements. Missing fields get the default
+    values.
+
+    It's meant for the data known to be valid, e.g. taken from the own
+    database. The share of the models set by TRUSTED_VALIDATION_RATE is
+    validated with validate_trusted().
+
+    The descriptor returns the function compiled for the model class, so
+    the call costs no more than the slot writes.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance, owner):
+        try:
+            return _trusted_inits[owner]
+        except KeyError:
+            return owner._trusted_init()
+
 
 class AbstractModel(ABC):
     """
     Abstract model for creating child models.
     """
+
+    __slots__ = ()
+
+    # Constructor arguments stored in the slots with other names
+    FIELD_SLOTS = {}
+
+    # Constructor arguments with other keys in the model dictionary, the
+    # models with XML_FIELDS set the keys in the fields
+    FIELD_KEYS = {}
+
+    # Keys of the model dictionary in the order of create_dict, the keys of
+    # the arguments by default
+    DICT_KEYS = None
+
+    # Slots which aren't set from the constructor arguments, with defaults
+    SLOT_DEFAULTS = {}
+
+    # Constructor arguments set by trusted() through the property setters
+    TRUSTED_SETTERS = ()
+
+    # Models of the nested constructor arguments, created by from_dict, or
+    # their "module.Model" names in the models package to import them lazily
+    NESTED_MODELS = {}
+
+    # Model.trusted(**fields) constructor
+    trusted = TrustedConstructor()
+
     @abstractmethod
     def create_dict(self, **kwargs) -> dict:
         """
@@ -38,6 +107,206 @@ class AbstractModel(ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "AbstractModel":
+        """
+        Creates the model from the dictionary in the form of create_dict,
+        the nested models are created from their dictionaries. The keys
+        which aren't constructor arguments, e.g. the offer type, are
+        skipped, while unknown keys raise TypeError.
+        """
+        arguments, nested = dict_fields(cls)
+        kwargs = {}
+        for key, value in data.items():
+            name = arguments.get(key, key)
+            if name is None:
+                continue
+            model = nested.get(name)
+            if model is not None and value is not None:
+                if isinstance(value, dict):
+                    value = model.from_dict(value)
+                else:
+                    value = [model.from_dict(v) for v in value]
+            kwargs[name] = value
+        return cls(**kwargs)
+
+    @classmethod
+    def init_parameters(cls) -> Dict[str, "Parameter"]:
+        """
+        Returns the keyword parameters of the model constructor, collected
+        from the whole class hierarchy.
+        """
+        parameters = {}
+        for klass in cls.__mro__:
+            init = klass.__dict__.get("__init__")
+            if init is None or klass is object:
+                continue
+            for p in list(signature(init).parameters.values())[1:]:
+                if p.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+                    continue
+                parameters.setdefault(p.name, p)
+        return parameters
+
+    @classmethod
+    def init_fields(cls) -> dict:
+        """
+        Returns the keyword arguments of the model constructor, collected
+        from the whole class hierarchy, with their default values.
+        Required arguments have None as default value.
+        """
+        try:
+            return _init_fields[cls]
+        except KeyError:
+            pass
+
+        fields = {
+            name: None if p.default is Parameter.empty else p.default
+            for name, p in cls.init_parameters().items()
+        }
+        _init_fields[cls] = fields
+        return fields
+
+    @classmethod
+    def _field_slot(cls, name: str) -> str:
+        """
+        Returns the slot the constructor argument is stored in: the
+        underscored name for the properties, unless set in FIELD_SLOTS.
+        """
+        try:
+            return cls.FIELD_SLOTS[name]
+        except KeyError:
+            pass
+        if isinstance(getattr(cls, name, None), property):
+            return "_" + name
+        return name
+
+    @classmethod
+    def _trusted_plan(cls) -> List[tuple]:
+        """
+        Returns the slot of every constructor argument (None if it's set
+        through the setter), its stored default value, if it's required
+        and if the default is mutable, so it's copied for every model.
+        """
+        try:
+            return _trusted_plans[cls]
+        except KeyError:
+            pass
+
+        plan = []
+        blank = cls.__new__(cls)
+        for name, p in cls.init_parameters().items():
+            required = p.default is Parameter.empty
+            default = None if required else p.default
+            attr = getattr(cls, name, None)
+            if name in cls.TRUSTED_SETTERS:
+                slot = None
+            else:
+                slot = cls._field_slot(name)
+            if slot is not None and slot != name and isinstance(
+                attr, property
+            ):
+                if not required:
+                    # The default value is stored as the setter stores it,
+                    # or as is if the setter depends on other fields
+                    try:
+                        attr.fset(blank, default)
+                        default = getattr(blank, slot)
+                    except (
+                        YMLException, AttributeError, TypeError, ValueError
+                    ):
+                        pass
+            mutable = isinstance(default, (list, dict, set))
+            plan.append((name, slot, default, required, mutable))
+
+        _trusted_plans[cls] = plan
+        return plan
+
+    @classmethod
+    def _trusted_init(cls):
+        """
+        Compiles the function creating the model for trusted(): the
+        arguments are the keyword-only fields and it writes every field
+        with a single assignment, so it runs as fast as the slots allow.
+        """
+        try:
+            return _trusted_inits[cls]
+        except KeyError:
+            pass
+
+        namespace = {
+            "_cls": cls,
+            "_MISSING": _MISSING,
+            "_random": random.random,
+            "_settings": sys.modules[__name__],
+        }
+        args = []
+        lines = []
+        for name, slot, default, required, mutable in cls._trusted_plan():
+            attr = name if slot is None else slot
+            if required:
+                args.append(name)
+            elif mutable:
+                namespace["_d_" + name] = default
+                args.append("{0}=_MISSING".format(name))
+                lines.append(
+                    "if {n} is _MISSING: {n} = _d_{n}.copy()".format(n=name)
+                )
+            else:
+                namespace["_d_" + name] = default
+                args.append("{0}=_d_{0}".format(name))
+            lines.append("_self.{a} = {n}".format(a=attr, n=name))
+        for slot, default in cls.SLOT_DEFAULTS.items():
+            namespace["_s_" + slot] = default
+            copy = ".copy()" if isinstance(default, (list, dict, set)) else ""
+            lines.append("_self.{s} = _s_{s}{c}".format(s=slot, c=copy))
+
+        source = "def trusted(*, {args}):\n{body}".format(
+            args=", ".join(args),
+            body="".join(
+                "    {0}\n".format(line)
+                for line in ["_self = _cls.__new__(_cls)"] + lines + [
+                    "_rate = _settings.TRUSTED_VALIDATION_RATE",
+                    "if _rate and _random() < _rate: _self.validate_trusted()",
+                    "return _self",
+                ]
+            ),
+        )
+        exec(source, namespace)
+        init = namespace["trusted"]
+        init.__qualname__ = "{0}.trusted".format(cls.__name__)
+        init.__doc__ = TrustedConstructor.__doc__
+        _trusted_inits[cls] = init
+        return init
+
+    def validate_trusted(self):
+        """
+        Checks the fields of the model created with trusted() by running
+        the property setters on the stored values. Raises ValidationError
+        if a value is invalid or isn't in the stored form.
+        """
+        cls = self.__class__
+        for name, slot, _, _, _ in cls._trusted_plan():
+            if slot is None or not slot.startswith("_"):
+                continue
+            attr = getattr(cls, slot[1:], None)
+            if not isinstance(attr, property) or attr.fset is None:
+                continue
+            stored = getattr(self, slot)
+            try:
+                attr.fset(self, stored)
+            except YMLException:
+                setattr(self, slot, stored)
+                raise
+            if getattr(self, slot) != stored:
+                setattr(self, slot, stored)
+                raise ValidationError(
+                    "{f} isn't in the stored form: {v!r}".format(
+                        f=name, v=stored
+                    ),
+                    name,
+                    stored,
+                )
+
     def to_xml(self, root_el: XMLElement = None) -> XMLElement:
         """
         Calls the inherited method to create the element and appends it to the
@@ -73,13 +342,21 @@ class AbstractModel(ABC):
         A helper method for checking if a value is a valid number and returning
         a value if the check succeeds or raising an error.
         """
+        if value.__class__ is Validated and convert_to_str:
+            return str(value)
         try:
-            value = int(value)
-            return str(value) if convert_to_str else value
+            number = int(value)
         except (TypeError, ValueError):
             if value is None and allow_none:
                 return None
-            raise ValidationError("{a} must be a valid int".format(a=attr))
+            raise ValidationError(
+                "{a} must be a valid int".format(a=attr), attr, value
+            )
+        if not convert_to_str:
+            return number
+        # Keep the source string if it's already in the canonical form
+        converted = str(number)
+        return value if converted == value else converted
 
     @staticmethod
     def _is_valid_bool(
@@ -102,7 +379,9 @@ class AbstractModel(ABC):
         else:
             raise ValidationError(
                 "The {attr} parameter should be boolean. "
-                "Got {t} instead.".format(attr=attr, t=type(value))
+                "Got {t} instead.".format(attr=attr, t=type(value)),
+                attr,
+                value,
             )
 
     @staticmethod
@@ -116,13 +395,17 @@ class AbstractModel(ABC):
         A helper method for checking if a value is a valid float and returning
         a value if the check succeeds or raising an error.
         """
+        if value.__class__ is Validated and convert_to_str:
+            return str(value)
         try:
             float(value)
             return str(value) if convert_to_str else value
         except (TypeError, ValueError):
             if value is None and allow_none:
                 return None
-            raise ValidationError("{a} must be a valid float".format(a=attr))
+            raise ValidationError(
+                "{a} must be a valid float".format(a=attr), attr, value
+            )
 
     @staticmethod
     def _str_to_bool(value: str) -> Optional[bool]:
@@ -147,17 +430,19 @@ class AbstractModel(ABC):
         A helper method for checking if a value is a valid datetime and
         returning a value if the check succeeds or raising an error.
         """
+        if dt.__class__ is Validated:
+            return str(dt)
         if isinstance(dt, datetime):
             return dt.strftime(dt_format)
         elif isinstance(dt, str):
             try:
                 datetime.strptime(dt, dt_format)
             except ValueError as e:
-                raise ValidationError(e)
+                raise ValidationError(str(e), attr, dt)
             return dt
         elif dt is None and allow_none:
             return None
         else:
             raise ValidationError(
-                "{a} must be a valid datetime".format(a=attr)
+                "{a} must be a valid datetime".format(a=attr), attr, dt
             )
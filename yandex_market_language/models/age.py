@@ -29,9 +29,13 @@ class Age(AbstractModel):
     @unit.setter
     def unit(self, value):
         if value and value not in UNIT_CHOICES:
-            raise ValidationError("unit must be a valid choice: {c}".format(
-                c=", ".join(UNIT_CHOICES)
-            ))
+            raise ValidationError(
+                "unit must be a valid choice: {c}".format(
+                    c=", ".join(UNIT_CHOICES)
+                ),
+                "unit",
+                value,
+            )
         self._unit = value
 
     @property
@@ -56,12 +60,14 @@ class Age(AbstractModel):
             if not_valid:
                 raise ValidationError(
                     "value for unit 'year' must be a valid choice: "
-                    "{c}".format(c=", ".join(str(c) for c in choices))
+                    "{c}".format(c=", ".join(str(c) for c in choices)),
+                    "value",
+                    v,
                 )
 
             self._value = str(v)
         except (TypeError, ValueError):
-            raise ValidationError("value must be a valid int")
+            raise ValidationError("value must be a valid int", "value", v)
 
     def create_dict(self, **kwargs) -> dict:
         return dict(unit=self.unit, value=self.value)
@@ -15,6 +15,8 @@ class Category(AbstractModel):
         'parent_id'
     ]
 
+    FIELD_KEYS = {"category_id": "id"}
+
     def __init__(self, category_id, name, parent_id=None):
         self.category_id = category_id
         self.name = name
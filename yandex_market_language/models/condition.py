@@ -33,7 +33,9 @@ class Condition(AbstractModel):
         if value not in CONDITION_CHOICES:
             raise ValidationError(
                 "condition_type attribute must be a value from a list: "
-                "{list}".format(list=", ".join(CONDITION_CHOICES))
+                "{list}".format(list=", ".join(CONDITION_CHOICES)),
+                "condition_type",
+                value,
             )
         self._condition_type = value
 
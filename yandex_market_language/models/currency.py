@@ -24,6 +24,8 @@ class Currency(AbstractModel):
         '_plus'
     ]
 
+    FIELD_KEYS = {"currency": "id"}
+
     def __init__(self, currency, rate, plus=None):
         self.currency = currency
         self.rate = rate
@@ -39,7 +41,9 @@ class Currency(AbstractModel):
             raise ValidationError(
                 "Price data is accepted only in: (formatted_choices)".format(
                     formatted_choices=", ".join(CURRENCY_CHOICES)
-                )
+                ),
+                "currency",
+                value,
             )
         self._currency = value
 
@@ -59,7 +63,9 @@ class Currency(AbstractModel):
                         "number (int or float), (rate_choices)".format(
                             rate_choices=', '.join(RATE_CHOICES)
                         )
-                    )
+                    ),
+                    "rate",
+                    value,
                 )
 
         self._rate = str(value)
@@ -81,5 +87,8 @@ class Currency(AbstractModel):
 
     @staticmethod
     def from_xml(el: XMLElement) -> "Currency":
-        el.attrib["currency"] = el.attrib.pop("id")
-        return Currency(**el.attrib)
+        return Currency(
+            currency=el.attrib.get("id"),
+            rate=el.attrib.get("rate"),
+            plus=el.attrib.get("plus"),
+        )
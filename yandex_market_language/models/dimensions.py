@@ -13,6 +13,10 @@ class Dimensions(AbstractModel):
         '_height'
     ]
 
+    FIELD_SLOTS = {"wight": "_width"}
+
+    FIELD_KEYS = {"wight": "width"}
+
     def __init__(self, length, wight, height):
         self.length = length
         self.width = wight
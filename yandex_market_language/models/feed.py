@@ -1,8 +1,13 @@
 from datetime import datetime
+from typing import TYPE_CHECKING, List
 
 from .abstract import AbstractModel, XMLElement
 from .shop import Shop
 
+if TYPE_CHECKING:
+    from yandex_market_language.delta import FeedDelta
+    from yandex_market_language.errors import OfferError
+
 DATE_FORMAT = "%Y-%m-%d %H:%M"
 
 
@@ -16,12 +21,18 @@ class Feed(AbstractModel):
 
     __slots__ = [
         'shop',
-        '_date'
+        '_date',
+        'errors'
     ]
 
+    SLOT_DEFAULTS = {"errors": []}
+
+    NESTED_MODELS = {"shop": Shop}
+
     def __init__(self, shop: Shop, date: datetime.date = None):
         self.shop = shop
         self.date = date
+        self.errors = []
 
     @property
     def date(self) -> datetime:
@@ -34,6 +45,13 @@ class Feed(AbstractModel):
             dt = datetime.now().strftime(DATE_FORMAT)
         self._date = dt
 
+    def delta(self, other: "Feed") -> "FeedDelta":
+        """
+        Returns the offers added, removed and changed in the other feed.
+        """
+        from yandex_market_language.delta import diff_feeds
+        return diff_feeds(self, other)
+
     def create_dict(self, **kwargs) -> dict:
         return dict(
             shop=self.shop.to_dict(),
@@ -46,7 +64,14 @@ class Feed(AbstractModel):
         return feed_el
 
     @staticmethod
-    def from_xml(el: XMLElement) -> "Feed":
-        shop = Shop.from_xml(el[0])
+    def from_xml(
+        el: XMLElement,
+        lazy: bool = False,
+        errors: List["OfferError"] = None,
+    ) -> "Feed":
+        shop = Shop.from_xml(el[0], lazy, errors)
         date = el.attrib.get("date")
-        return Feed(shop, date=date)
+        feed = Feed(shop, date=date)
+        if errors is not None:
+            feed.errors = errors
+        return feed
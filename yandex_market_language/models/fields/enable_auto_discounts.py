@@ -7,7 +7,11 @@ ENABLE_AUTO_DISCOUNTS_CHOICES = ("yes", "true", "1", "no", "false", "0")
 
 
 class EnableAutoDiscountField:
-    _enable_auto_discounts = None
+    """
+    Stores the value in the _enable_auto_discounts slot of the model.
+    """
+
+    __slots__ = ()
 
     @property
     def enable_auto_discounts(self) -> Optional[bool]:
@@ -35,5 +39,7 @@ class EnableAutoDiscountField:
                     "or str from available values: {values}".format(
                         values=", ".join(ENABLE_AUTO_DISCOUNTS_CHOICES)
                     )
-                )
+                ),
+                "enable_auto_discounts",
+                value,
             )
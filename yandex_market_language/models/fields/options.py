@@ -1,5 +1,9 @@
 class DeliveryOptionsField:
-    _delivery_options = []
+    """
+    Stores the value in the _delivery_options slot of the model.
+    """
+
+    __slots__ = ()
 
     @property
     def delivery_options(self):
@@ -11,7 +15,11 @@ class DeliveryOptionsField:
 
 
 class PickupOptionsField:
-    _pickup_options = []
+    """
+    Stores the value in the _pickup_options slot of the model.
+    """
+
+    __slots__ = ()
 
     @property
     def pickup_options(self):
@@ -2,7 +2,11 @@ from typing import Optional
 
 
 class YearField:
-    _year = None
+    """
+    Stores the value in the _year slot of the model.
+    """
+
+    __slots__ = ()
 
     @property
     def year(self) -> Optional[int]:
@@ -0,0 +1,428 @@
+"""
+Indexes over the shop categories and offers.
+
+The indexes are built on the first query and are kept until the indexed
+lists are changed: the lists count their mutations, so a stale index is
+detected by comparing the counters.
+"""
+from collections.abc import Mapping
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from yandex_market_language import models
+
+
+class VersionedList(list):
+    """
+    List which counts its mutations in the version attribute.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self.version = 0
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (list(self),)
+
+
+def _mutator(name: str):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = name
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(VersionedList, _name, _mutator(_name))
+
+
+def versioned(
+    value: Optional[Iterable], cls: type = VersionedList
+) -> Optional[VersionedList]:
+    """
+    Wraps the value into the versioned list of the class unless it is one
+    already.
+    """
+    if value is None or isinstance(value, cls):
+        return value
+    return cls(value)
+
+
+def _single(name: str):
+    def keys(offer) -> tuple:
+        value = getattr(offer, name)
+        return () if value is None else (value,)
+    return keys
+
+
+def _barcodes(offer) -> list:
+    return offer.barcodes or ()
+
+
+# Functions returning the index keys of an offer by the index name
+OFFER_INDEX_KEYS = {
+    "id": _single("offer_id"),
+    "group": _single("group_id"),
+    "vendor": _single("vendor"),
+    "vendor_code": _single("vendor_code"),
+    "barcode": _barcodes,
+}
+
+
+def _discard_from(index: Dict[object, list], key, offer) -> bool:
+    """
+    Removes the offer from the bucket of the key, returns False if it's
+    not there.
+    """
+    bucket = index.get(key, ())
+    for i, o in enumerate(bucket):
+        if o is offer:
+            del bucket[i]
+            if not bucket:
+                del index[key]
+            return True
+    return False
+
+
+class OfferIdIndex(Mapping):
+    """
+    Read-only mapping of the offer ids to the offers. For a duplicated id
+    the first added offer is returned.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, buckets: Dict[str, list]):
+        self._buckets = buckets
+
+    def __getitem__(self, offer_id: str) -> "models.offers.AbstractOffer":
+        return self._buckets[offer_id][0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buckets)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class OfferList(VersionedList):
+    """
+    List of the shop offers with hash indexes by the offer id, group id,
+    vendor, vendor code and barcode.
+
+    Every index is built on its first query and then kept up to date as
+    the offers are added to or removed from the list. Changes of the
+    offers themselves aren't tracked, call reindex() after them.
+    """
+
+    __slots__ = ("_indexes",)
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self._indexes = {}
+
+    def reindex(self):
+        """
+        Drops the built indexes, they are rebuilt on the next query.
+        """
+        self._indexes = {}
+
+    def _index(self, name: str) -> Dict[object, list]:
+        index = self._indexes.get(name)
+        if index is None:
+            keys = OFFER_INDEX_KEYS[name]
+            index = {}
+            for offer in self:
+                for key in keys(offer):
+                    index.setdefault(key, []).append(offer)
+            self._indexes[name] = index
+        return index
+
+    def _add(self, offers: Iterable):
+        for name, index in self._indexes.items():
+            keys = OFFER_INDEX_KEYS[name]
+            for offer in offers:
+                for key in keys(offer):
+                    index.setdefault(key, []).append(offer)
+
+    def _discard(self, offers: Iterable):
+        """
+        Removes the offers from the built indexes. An index missing an
+        offer by its keys, as the offer was changed after it was indexed,
+        is dropped and rebuilt on the next query.
+        """
+        for name, index in list(self._indexes.items()):
+            keys = OFFER_INDEX_KEYS[name]
+            if not all(
+                _discard_from(index, key, offer)
+                for offer in offers
+                for key in keys(offer)
+            ):
+                del self._indexes[name]
+
+    def append(self, offer):
+        super().append(offer)
+        if self._indexes:
+            self._add((offer,))
+
+    def extend(self, offers: Iterable):
+        start = len(self)
+        super().extend(offers)
+        if self._indexes:
+            self._add(self[start:])
+
+    def __iadd__(self, offers: Iterable):
+        self.extend(offers)
+        return self
+
+    def insert(self, i: int, offer):
+        super().insert(i, offer)
+        if self._indexes:
+            self._add((offer,))
+
+    def remove(self, offer):
+        super().remove(offer)
+        if self._indexes:
+            self._discard((offer,))
+
+    def pop(self, i: int = -1):
+        offer = super().pop(i)
+        if self._indexes:
+            self._discard((offer,))
+        return offer
+
+    def __delitem__(self, key):
+        removed = self[key] if isinstance(key, slice) else [self[key]]
+        super().__delitem__(key)
+        if self._indexes:
+            self._discard(removed)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            removed = self[key]
+            value = list(value)
+            added = value
+        else:
+            removed = [self[key]]
+            added = [value]
+        super().__setitem__(key, value)
+        if self._indexes:
+            self._discard(removed)
+            self._add(added)
+
+    def clear(self):
+        super().clear()
+        self._indexes = {}
+
+    def __imul__(self, n: int):
+        super().__imul__(n)
+        self._indexes = {}
+        return self
+
+    @property
+    def by_id(self) -> OfferIdIndex:
+        return OfferIdIndex(self._index("id"))
+
+    def by_group(self, group_id: int) -> List["models.offers.AbstractOffer"]:
+        return list(self._index("group").get(group_id, ()))
+
+    def by_vendor(self, vendor: str) -> List["models.offers.AbstractOffer"]:
+        return list(self._index("vendor").get(vendor, ()))
+
+    def by_vendor_code(
+        self, vendor_code: str
+    ) -> List["models.offers.AbstractOffer"]:
+        return list(self._index("vendor_code").get(vendor_code, ()))
+
+    def by_barcode(self, barcode: str) -> List["models.offers.AbstractOffer"]:
+        return list(self._index("barcode").get(barcode, ()))
+
+    def duplicates(self) -> Dict[str, List["models.offers.AbstractOffer"]]:
+        """
+        Returns the offers sharing an id by the duplicated ids.
+        """
+        return {
+            offer_id: list(bucket)
+            for offer_id, bucket in self._index("id").items()
+            if len(bucket) > 1
+        }
+
+
+class CategoryIndex:
+    """
+    Tree of the shop categories with the offers of every category.
+
+    Categories are numbered in the depth-first order, so the subtree of
+    a category is the interval [tin, tout) of the numbers and the subtree
+    membership is checked in constant time. Categories with a missing
+    parent are roots; cycles of parents are cut at the first visited
+    category.
+    """
+
+    def __init__(
+        self,
+        categories: List["models.Category"],
+        offers: List["models.offers.AbstractOffer"] = (),
+    ):
+        self.nodes = {}
+        self.children = {}
+        for c in categories:
+            category_id = str(c.category_id)
+            self.nodes[category_id] = c
+            self.children[category_id] = []
+
+        self.roots = []
+        for category_id, c in self.nodes.items():
+            parent_id = self._parent_id(c)
+            if parent_id is None:
+                self.roots.append(category_id)
+            else:
+                self.children[parent_id].append(category_id)
+
+        self.order = []
+        self.depth = {}
+        self.tin = {}
+        self.tout = {}
+        for category_id in self.roots:
+            self._visit(category_id)
+        for category_id in self.nodes:
+            if category_id not in self.tin:
+                self._visit(category_id)
+
+        self.offers = list(offers)
+        self._offer_rows = {}
+        for i, o in enumerate(self.offers):
+            if o.category_id is not None:
+                self._offer_rows.setdefault(str(o.category_id), []).append(i)
+        self._cache = {}
+
+    def __repr__(self) -> str:
+        return "<CategoryIndex categories={c} offers={o}>".format(
+            c=len(self.nodes), o=len(self.offers)
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, category_id) -> bool:
+        return str(category_id) in self.nodes
+
+    def _parent_id(self, c: "models.Category") -> Optional[str]:
+        if c.parent_id is None:
+            return None
+        parent_id = str(c.parent_id)
+        if parent_id not in self.nodes or parent_id == str(c.category_id):
+            return None
+        return parent_id
+
+    def _visit(self, root: str):
+        """
+        Numbers the subtree of the root category without recursion.
+        """
+        self.depth[root] = 0
+        self.tin[root] = len(self.order)
+        self.order.append(root)
+        stack = [(root, iter(self.children[root]))]
+        while stack:
+            category_id, children = stack[-1]
+            for child_id in children:
+                if child_id in self.tin:
+                    continue
+                self.depth[child_id] = self.depth[category_id] + 1
+                self.tin[child_id] = len(self.order)
+                self.order.append(child_id)
+                stack.append((child_id, iter(self.children[child_id])))
+                break
+            else:
+                self.tout[category_id] = len(self.order)
+                stack.pop()
+
+    def node(self, category_id) -> "models.Category":
+        return self.nodes[str(category_id)]
+
+    def parent(self, category_id) -> Optional["models.Category"]:
+        parent_id = self._parent_id(self.node(category_id))
+        if parent_id is None or self._is_cut(str(category_id), parent_id):
+            return None
+        return self.nodes[parent_id]
+
+    def _is_cut(self, category_id: str, parent_id: str) -> bool:
+        # The parent link of the category closing a cycle isn't in the tree
+        return self.depth[category_id] != self.depth[parent_id] + 1
+
+    def ancestors(self, category_id) -> List["models.Category"]:
+        """
+        Returns the ancestors of the category from its parent to the root.
+        """
+        result = []
+        c = self.parent(category_id)
+        while c is not None:
+            result.append(c)
+            c = self.parent(c.category_id)
+        return result
+
+    def descendants(self, category_id) -> List["models.Category"]:
+        """
+        Returns the descendants of the category in the depth-first order.
+        """
+        category_id = str(category_id)
+        ids = self.order[self.tin[category_id] + 1:self.tout[category_id]]
+        return [self.nodes[i] for i in ids]
+
+    def is_descendant(self, category_id, ancestor_id) -> bool:
+        """
+        Checks if the category is in the subtree of the ancestor category,
+        the category itself included.
+        """
+        category_id = str(category_id)
+        ancestor_id = str(ancestor_id)
+        if category_id not in self.tin or ancestor_id not in self.tin:
+            return False
+        return (
+            self.tin[ancestor_id]
+            <= self.tin[category_id]
+            < self.tout[ancestor_id]
+        )
+
+    def offers_in_category(
+        self, category_id, recursive: bool = True
+    ) -> List["models.offers.AbstractOffer"]:
+        """
+        Returns the offers of the category in the feed order, with the
+        offers of its descendant categories if recursive is set. The list
+        is a copy of the cached one, so it can be changed by the caller.
+        """
+        key = (str(category_id), recursive)
+        if key not in self._cache:
+            category_id = key[0]
+            if recursive and category_id in self.tin:
+                ids = self.order[self.tin[category_id]:self.tout[category_id]]
+                rows = sorted(
+                    chain.from_iterable(
+                        self._offer_rows.get(i, ()) for i in ids
+                    )
+                )
+            else:
+                rows = self._offer_rows.get(category_id, [])
+            self._cache[key] = [self.offers[i] for i in rows]
+        return list(self._cache[key])
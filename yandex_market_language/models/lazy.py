@@ -0,0 +1,101 @@
+from typing import Type
+
+from .abstract import XMLElement
+from .offers import AbstractOffer, get_offer_class
+from .schema import get_field_decoder
+
+
+class LazyOffer:
+    """
+    Offer proxy that keeps the offer element and decodes each field only
+    when it's read for the first time. The raw value goes through the setter
+    of the offer model, so it's validated in the same way, and the result
+    is cached.
+
+    Any other attribute (e.g. to_dict or to_xml) is taken from the offer
+    model, which is built from the element with full validation on the
+    first such access.
+    """
+
+    __slots__ = [
+        "_el",
+        "_offer_cls",
+        "_values",
+        "_shell",
+        "_offer",
+    ]
+
+    def __init__(
+        self,
+        offer_el: XMLElement,
+        offer_cls: Type["AbstractOffer"] = None,
+    ):
+        if offer_cls is None:
+            offer_cls = get_offer_class(offer_el.attrib.get("type"))
+        setattr_ = object.__setattr__
+        setattr_(self, "_el", offer_el)
+        setattr_(self, "_offer_cls", offer_cls)
+        setattr_(self, "_values", {})
+        setattr_(self, "_shell", None)
+        setattr_(self, "_offer", None)
+
+    def __repr__(self) -> str:
+        return "<LazyOffer {cls} id={id!r}>".format(
+            cls=self._offer_cls.__name__, id=self.offer_id
+        )
+
+    def __getattr__(self, name: str):
+        if name in LazyOffer.__slots__:
+            raise AttributeError(name)
+        if self._offer is not None:
+            return getattr(self._offer, name)
+        values = self._values
+        if name in values:
+            return values[name]
+        if name in self._offer_cls.init_fields():
+            values[name] = value = self._decode(name)
+            return value
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self.materialize(), name, value)
+
+    @property
+    def offer_cls(self) -> Type["AbstractOffer"]:
+        return self._offer_cls
+
+    def materialize(self) -> "AbstractOffer":
+        """
+        Builds and returns the offer model with all fields validated.
+        """
+        if self._offer is None:
+            setattr_ = object.__setattr__
+            setattr_(self, "_offer", self._offer_cls.from_xml(self._el))
+            setattr_(self, "_el", None)
+            setattr_(self, "_values", None)
+            setattr_(self, "_shell", None)
+        return self._offer
+
+    def _decode(self, name: str):
+        """
+        Parses and validates the raw value of the field with the setter of
+        the offer model and returns the value from the getter. The raw
+        value is decoded from the XML_FIELDS of the model, as the parser of
+        the model does it.
+        """
+        offer_cls = self._offer_cls
+        kwargs = {}
+        get_field_decoder(offer_cls, name)(self._el, kwargs)
+        value = kwargs.get(name, offer_cls.init_fields()[name])
+
+        shell = self._shell
+        if shell is None:
+            shell = offer_cls.__new__(offer_cls)
+            object.__setattr__(self, "_shell", shell)
+        setattr(shell, name, value)
+
+        try:
+            return getattr(shell, name)
+        except AttributeError:
+            # The getter depends on the other fields
+            return getattr(self.materialize(), name)
@@ -1,23 +1,158 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from hashlib import sha256
+from typing import List, Optional, Type
+from xml.etree import ElementTree as ET
 import warnings
 
-from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.exceptions import ParseError, ValidationError
 
-from .abstract import AbstractModel, XMLElement, XMLSubElement
+from .abstract import AbstractModel, XMLElement
 from .price import Price
 from .option import Option
 from .parameter import Parameter
 from .condition import Condition
 from .dimensions import Dimensions
 from .age import Age
+from .schema import (
+    ATTRIBUTE,
+    MODEL,
+    MODELS,
+    REFERENCE,
+    TEXTS,
+    WRAPPED_MODELS,
+    Field,
+    get_parser,
+    get_serializer,
+)
 from . import fields
 
 
 EXPIRY_FORMAT = "YYYY-MM-DDThh:mm"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Fields of the offer element, the offer models declare their XML_FIELDS
+# from them and put their own text fields between the text fields and the
+# nested elements
+OFFER_ATTRIBUTES = (
+    Field("offer_id", "id", ATTRIBUTE, optional=False),
+    Field("type", kind=ATTRIBUTE, slot="__TYPE__"),
+    Field("bid", kind=ATTRIBUTE),
+    Field("cbid", kind=ATTRIBUTE),
+    Field("available", kind=ATTRIBUTE),
+)
+
+OFFER_TEXT_FIELDS = (
+    Field("vendor"),
+    Field("vendor_code", "vendorCode"),
+    Field("url"),
+    Field("old_price", "oldprice"),
+    Field("enable_auto_discounts"),
+    Field("currency", "currencyId"),
+    Field("category_id", "categoryId"),
+    Field("delivery"),
+    Field("pickup"),
+    Field("store"),
+    Field("description"),
+    Field("sales_notes"),
+    Field("min_quantity", "min-quantity"),
+    Field("manufacturer_warranty"),
+    Field("country_of_origin"),
+    Field("adult"),
+    Field("expiry"),
+    Field("weight"),
+    Field("downloadable"),
+    Field("group_id"),
+)
+
+OFFER_ELEMENT_FIELDS = (
+    Field("price", kind=MODEL, model=Price, optional=False),
+    Field("pictures", "picture", TEXTS),
+    Field("supplier", kind=REFERENCE, attribute="ogrn"),
+    Field(
+        "delivery_options", "delivery-options", WRAPPED_MODELS, model=Option
+    ),
+    Field("pickup_options", "pickup-options", WRAPPED_MODELS, model=Option),
+    Field("barcodes", "barcode", TEXTS),
+    Field("parameters", "param", MODELS, model=Parameter),
+    Field("condition", kind=MODEL, model=Condition),
+    Field("credit_template_id", "credit-template", REFERENCE, attribute="id"),
+    Field("dimensions", kind=MODEL, model=Dimensions),
+    Field("age", kind=MODEL, model=Age),
+)
+
+BOOK_TEXT_FIELDS = (
+    Field("name"),
+    Field("publisher"),
+    Field("isbn", "ISBN"),
+    Field("author"),
+    Field("series"),
+    Field("year"),
+    Field("volume"),
+    Field("part"),
+    Field("language"),
+    Field("table_of_contents"),
+)
+
+# Keys of the offer dictionary in the order of create_dict, the offer models
+# declare their DICT_KEYS from them and add their own keys after them
+OFFER_DICT_KEYS = (
+    "type",
+    "vendor",
+    "vendor_code",
+    "offer_id",
+    "bid",
+    "url",
+    "price",
+    "old_price",
+    "enable_auto_discounts",
+    "currency",
+    "category_id",
+    "pictures",
+    "supplier",
+    "delivery",
+    "pickup",
+    "delivery_options",
+    "pickup_options",
+    "store",
+    "description",
+    "sales_notes",
+    "min_quantity",
+    "manufacturer_warranty",
+    "country_of_origin",
+    "adult",
+    "barcodes",
+    "parameters",
+    "condition",
+    "credit_template_id",
+    "expiry",
+    "weight",
+    "dimensions",
+    "downloadable",
+    "available",
+    "age",
+    "group_id",
+)
+
+BOOK_DICT_KEYS = (
+    "name",
+    "publisher",
+    "isbn",
+    "author",
+    "series",
+    "year",
+    "volume",
+    "part",
+    "language",
+    "table_of_contents",
+)
+
+# Maps the type attribute of the offer element to the offer model
+OFFER_TYPES = {}
+
+# Size of the offer content digest in bytes
+DIGEST_SIZE = 16
+
 
 class AbstractOffer(
     fields.EnableAutoDiscountField,
@@ -32,6 +167,16 @@ class AbstractOffer(
 
     __TYPE__ = None
 
+    XML_TAG = "offer"
+
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = OFFER_DICT_KEYS
+
     __slots__ = [
         '_cbid',
         '_delivery',
@@ -39,6 +184,7 @@ class AbstractOffer(
         '_store',
         '_min_quantity',
         '_manufacturer_warranty',
+        'country_of_origin',
         '_adult',
         '_parameters',
         '_expiry',
@@ -270,7 +416,9 @@ class AbstractOffer(
         # Validate group id and raise an error if it's not valid
         if len(str(value)) > 9:
             raise ValidationError(
-                "group_id must be an integer, maximum 9 characters."
+                "group_id must be an integer, maximum 9 characters.",
+                "group_id",
+                value,
             )
 
         self._group_id = str(value) if value else None
@@ -316,177 +464,42 @@ class AbstractOffer(
             **kwargs
         )
 
-    @abstractmethod
     def create_xml(self, **kwargs) -> XMLElement:
-        offer_el = XMLElement("offer", {"id": self.offer_id})
-
-        # Add offer type
-        if self.__TYPE__:
-            offer_el.attrib["type"] = self.__TYPE__
-
-        # Add offer bid attribute
-        if self.bid:
-            offer_el.attrib["bid"] = self.bid
-
-        # Add offer cbid attribute (deprecated)
-        if self.cbid:
-            offer_el.attrib["cbid"] = self.cbid
-
-        # Add offer available attribute
-        if self.available is not None:
-            offer_el.attrib["available"] = self._available
-
-        # Add simple values
-        for tag, attr in {
-            "vendor": "vendor",
-            "vendorCode": "vendor_code",
-            "url": "url",
-            "oldprice": "old_price",
-            "enable_auto_discounts": "_enable_auto_discounts",
-            "currencyId": "currency",
-            "categoryId": "category_id",
-            "delivery": "_delivery",
-            "pickup": "_pickup",
-            "store": "_store",
-            "description": "description",
-            "sales_notes": "sales_notes",
-            "min-quantity": "_min_quantity",
-            "manufacturer_warranty": "_manufacturer_warranty",
-            "country_of_origin": "country_of_origin",
-            "adult": "_adult",
-            "expiry": "_expiry",
-            "weight": "_weight",
-            "downloadable": "_downloadable",
-            "group_id": "_group_id",
-            **kwargs,
-        }.items():
-            value = getattr(self, attr)
-            if value:
-                el = XMLSubElement(offer_el, tag)
-                el.text = value
-
-        # Add price
-        self.price.to_xml(offer_el)
-
-        # Add pictures
-        if self.pictures:
-            for url in self.pictures:
-                picture_el = XMLSubElement(offer_el, "picture")
-                picture_el.text = url
-
-        # Add supplier
-        if self.supplier:
-            XMLSubElement(offer_el, "supplier", {"ogrn": self.supplier})
-
-        # Add delivery options
-        if self.delivery_options:
-            delivery_options_el = XMLSubElement(offer_el, "delivery-options")
-            for o in self.delivery_options:
-                o.to_xml(delivery_options_el)
-
-        # Add pickup options
-        if self.pickup_options:
-            pickup_options_el = XMLSubElement(offer_el, "pickup-options")
-            for o in self.pickup_options:
-                o.to_xml(pickup_options_el)
-
-        # Add barcodes
-        if self.barcodes:
-            for b in self.barcodes:
-                b_el = XMLSubElement(offer_el, "barcode")
-                b_el.text = b
-
-        # Add parameters
-        if self.parameters:
-            for p in self.parameters:
-                p.to_xml(offer_el)
-
-        # Add condition
-        if self.condition:
-            self.condition.to_xml(offer_el)
-
-        # Add credit template
-        if self.credit_template_id:
-            XMLSubElement(
-                offer_el, "credit-template", {"id": self.credit_template_id}
-            )
-
-        # Add dimensions
-        if self.dimensions:
-            self.dimensions.to_xml(offer_el)
-
-        # Add age
-        if self.age:
-            self.age.to_xml(offer_el)
+        """
+        Creates the offer element with the serializer compiled from the
+        XML_FIELDS of the offer model. The keyword arguments map the tags
+        of extra text elements to the attributes of the model.
+        """
+        return get_serializer(self.__class__, kwargs)(self)
 
-        return offer_el
+    def digest(self) -> bytes:
+        """
+        Returns the digest of the offer content, which is computed from the
+        serialized offer element, so it's the same for equal offers in
+        different feeds or processes.
+        """
+        content = ET.tostring(self.to_xml(), "utf-8")
+        return sha256(content).digest()[:DIGEST_SIZE]
 
     @staticmethod
     @abstractmethod
     def from_xml(offer_el: XMLElement, **mapping) -> dict:
         """
         Abstract method for parsing the xml element into a dictionary.
+        The offer models parse their elements with the parsers compiled
+        from their XML_FIELDS, the mapping adds tags of other elements.
+        """
+        return get_parser(AbstractOffer, mapping)(offer_el)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AbstractOffer":
         """
-        kwargs = {}
-        mapping = {
-            "vendorCode": "vendor_code",
-            "oldprice": "old_price",
-            "currencyId": "currency",
-            "categoryId": "category_id",
-            "min-quantity": "min_quantity",
-            **mapping
-        }
-
-        pictures = []
-        barcodes = []
-        parameters = []
-
-        for el in offer_el:
-            if el.tag == "picture":
-                pictures.append(el.text)
-            elif el.tag == "delivery-options":
-                delivery_options = []
-                for option_el in el:
-                    delivery_options.append(Option.from_xml(option_el))
-                kwargs["delivery_options"] = delivery_options
-            elif el.tag == "pickup-options":
-                pickup_options = []
-                for option_el in el:
-                    pickup_options.append(Option.from_xml(option_el))
-                kwargs["pickup_options"] = pickup_options
-            elif el.tag == "barcode":
-                barcodes.append(el.text)
-            elif el.tag == "param":
-                parameters.append(Parameter.from_xml(el))
-            elif el.tag == "credit-template":
-                kwargs["credit_template_id"] = el.attrib["id"]
-            elif el.tag == "dimensions":
-                kwargs["dimensions"] = Dimensions.from_xml(el)
-            elif el.tag == "price":
-                kwargs["price"] = Price.from_xml(el)
-            elif el.tag == "condition":
-                kwargs["condition"] = Condition.from_xml(el)
-            elif el.tag == "age":
-                kwargs["age"] = Age.from_xml(el)
-            elif el.tag == "supplier":
-                kwargs["supplier"] = el.attrib["ogrn"]
-            else:
-                k = mapping.get(el.tag, el.tag)
-                kwargs[k] = el.text
-
-        if pictures:
-            kwargs["pictures"] = pictures
-        if barcodes:
-            kwargs["barcodes"] = barcodes
-        if parameters:
-            kwargs["parameters"] = parameters
-
-        kwargs["offer_id"] = offer_el.attrib["id"]
-        kwargs["bid"] = offer_el.attrib.get("bid")
-        kwargs["cbid"] = offer_el.attrib.get("cbid")
-        kwargs["available"] = offer_el.attrib.get("available")
-
-        return kwargs
+        Creates the offer from the dictionary, as the model of its type
+        if it's called on AbstractOffer.
+        """
+        if cls is AbstractOffer:
+            cls = get_offer_class(data.get("type"))
+        return super(AbstractOffer, cls).from_dict(data)
 
 
 class SimplifiedOffer(AbstractOffer):
@@ -501,8 +514,16 @@ class SimplifiedOffer(AbstractOffer):
 
     __TYPE__ = None
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        Field("name", optional=False),
+        *OFFER_TEXT_FIELDS,
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (*OFFER_DICT_KEYS, "name")
+
     __slots__ = [
-        *AbstractOffer.__slots__,
         'name'
     ]
 
@@ -513,17 +534,11 @@ class SimplifiedOffer(AbstractOffer):
     def create_dict(self, **kwargs) -> dict:
         return super().create_dict(name=self.name)
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        offer_el = super().create_xml()
-        name_el = XMLElement("name")
-        name_el.text = self.name
-        offer_el.insert(0, name_el)
-        return offer_el
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "SimplifiedOffer":
-        kwargs = AbstractOffer.from_xml(offer_el, **mapping)
-        return SimplifiedOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "SimplifiedOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class ArbitraryOffer(AbstractOffer):
@@ -538,10 +553,18 @@ class ArbitraryOffer(AbstractOffer):
 
     __TYPE__ = "vendor.model"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        *OFFER_ELEMENT_FIELDS,
+        Field("model", optional=False),
+        Field("type_prefix", "typePrefix"),
+    )
+
+    DICT_KEYS = (*OFFER_DICT_KEYS, "model", "type_prefix")
+
     __slots__ = [
-        *AbstractOffer.__slots__,
         'model',
-        'vendor',
         'type_prefix'
     ]
 
@@ -562,27 +585,11 @@ class ArbitraryOffer(AbstractOffer):
             type_prefix=self.type_prefix
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        offer_el = super().create_xml()
-
-        # Add model element
-        model_el = XMLSubElement(offer_el, "model")
-        model_el.text = self.model
-
-        # Add typePrefix element
-        if self.type_prefix:
-            type_prefix_el = XMLSubElement(offer_el, "typePrefix")
-            type_prefix_el.text = self.type_prefix
-
-        return offer_el
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "ArbitraryOffer":
-        mapping.update({
-            "typePrefix": "type_prefix",
-        })
-        kwargs = AbstractOffer.from_xml(offer_el, **mapping)
-        return ArbitraryOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "ArbitraryOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class AbstractBookOffer(fields.YearField, AbstractOffer, ABC):
@@ -590,13 +597,20 @@ class AbstractBookOffer(fields.YearField, AbstractOffer, ABC):
     Abstract book offer for book & audio book offer types.
     """
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        *BOOK_TEXT_FIELDS,
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (*OFFER_DICT_KEYS, *BOOK_DICT_KEYS)
+
     __slots__ = [
-        *AbstractOffer.__slots__,
         '_volume',
         '_part',
         'name',
         'publisher',
-        'age',
         'isbn',
         'author',
         'series',
@@ -664,32 +678,10 @@ class AbstractBookOffer(fields.YearField, AbstractOffer, ABC):
             **kwargs
         )
 
-    @abstractmethod
-    def create_xml(self, **kwargs) -> XMLElement:
-        offer_el = super().create_xml(
-            name="name",
-            publisher="publisher",
-            ISBN="isbn",
-            author="author",
-            series="series",
-            year="_year",
-            volume="_volume",
-            part="_part",
-            language="language",
-            table_of_contents="table_of_contents",
-            **kwargs
-        )
-
-        return offer_el
-
     @staticmethod
     @abstractmethod
     def from_xml(offer_el: XMLElement, **mapping) -> dict:
-        mapping.update({
-            "publisher": "publisher",
-            "ISBN": "isbn",
-        })
-        return AbstractOffer.from_xml(offer_el, **mapping)
+        return get_parser(AbstractBookOffer, mapping)(offer_el)
 
 
 class BookOffer(AbstractBookOffer):
@@ -702,8 +694,23 @@ class BookOffer(AbstractBookOffer):
 
     __TYPE__ = "book"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        *BOOK_TEXT_FIELDS,
+        Field("binding"),
+        Field("page_extent"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (
+        *OFFER_DICT_KEYS,
+        *BOOK_DICT_KEYS,
+        "binding",
+        "page_extent",
+    )
+
     __slots__ = [
-        *AbstractBookOffer.__slots__,
         'binding',
         '_page_extent'
     ]
@@ -721,7 +728,9 @@ class BookOffer(AbstractBookOffer):
     def page_extent(self, value):
         value = self._is_valid_int(value, "page_extent", True, False)
         if value <= 0:
-            raise ValidationError("page_extent must be positive int")
+            raise ValidationError(
+                "page_extent must be positive int", "page_extent", value
+            )
         self._page_extent = str(value)
 
     def create_dict(self, **kwargs) -> dict:
@@ -729,17 +738,11 @@ class BookOffer(AbstractBookOffer):
             binding=self.binding, page_extent=self.page_extent
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        offer_el = super().create_xml(
-            binding="binding",
-            page_extent="_page_extent"
-        )
-        return offer_el
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "BookOffer":
-        kwargs = AbstractBookOffer.from_xml(offer_el, **mapping)
-        return BookOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "BookOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class AudioBookOffer(AbstractBookOffer):
@@ -752,8 +755,29 @@ class AudioBookOffer(AbstractBookOffer):
 
     __TYPE__ = "audiobook"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        *BOOK_TEXT_FIELDS,
+        Field("performed_by"),
+        Field("performance_type"),
+        Field("storage"),
+        Field("audio_format", "format"),
+        Field("recording_length"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (
+        *OFFER_DICT_KEYS,
+        *BOOK_DICT_KEYS,
+        "performed_by",
+        "performance_type",
+        "storage",
+        "audio_format",
+        "recording_length",
+    )
+
     __slots__ = [
-        *AbstractBookOffer.__slots__,
         'performed_by',
         'performance_type',
         'storage',
@@ -786,20 +810,11 @@ class AudioBookOffer(AbstractBookOffer):
             recording_length=self.recording_length
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        return super().create_xml(
-            performed_by="performed_by",
-            performance_type="performance_type",
-            storage="storage",
-            format="audio_format",
-            recording_length="recording_length"
-        )
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "AudioBookOffer":
-        mapping.update({"format": "audio_format"})
-        kwargs = AbstractBookOffer.from_xml(offer_el, **mapping)
-        return AudioBookOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "AudioBookOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class MusicVideoOffer(fields.YearField, AbstractOffer):
@@ -812,8 +827,33 @@ class MusicVideoOffer(fields.YearField, AbstractOffer):
 
     __TYPE__ = "artist.title"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        Field("artist"),
+        Field("title"),
+        Field("year"),
+        Field("media"),
+        Field("starring"),
+        Field("director"),
+        Field("original_name", "originalName"),
+        Field("country"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (
+        *OFFER_DICT_KEYS,
+        "artist",
+        "title",
+        "year",
+        "media",
+        "starring",
+        "director",
+        "original_name",
+        "country",
+    )
+
     __slots__ = [
-        *AbstractOffer.__slots__,
         'title',
         'artist',
         '_year',
@@ -858,25 +898,11 @@ class MusicVideoOffer(fields.YearField, AbstractOffer):
             country=self.country,
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        return super().create_xml(
-            artist="artist",
-            title="title",
-            year="_year",
-            media="media",
-            starring="starring",
-            director="director",
-            originalName="original_name",
-            country="country",
-        )
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "MusicVideoOffer":
-        mapping.update({
-            "originalName": "original_name"
-        })
-        kwargs = AbstractOffer.from_xml(offer_el, **mapping)
-        return MusicVideoOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "MusicVideoOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class MedicineOffer(AbstractOffer):
@@ -889,11 +915,17 @@ class MedicineOffer(AbstractOffer):
 
     __TYPE__ = "medicine"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        Field("name"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (*OFFER_DICT_KEYS, "name")
+
     __slots__ = [
-        *AbstractOffer.__slots__,
-        'name',
-        '_delivery',
-        '_pickup'
+        'name'
     ]
 
     def __init__(self, name, delivery, pickup, **kwargs):
@@ -903,13 +935,11 @@ class MedicineOffer(AbstractOffer):
     def create_dict(self, **kwargs) -> dict:
         return super().create_dict(name=self.name)
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        return super().create_xml(name="name")
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "MedicineOffer":
-        kwargs = AbstractOffer.from_xml(offer_el)
-        return MedicineOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "MedicineOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class EventTicketOffer(AbstractOffer):
@@ -922,8 +952,31 @@ class EventTicketOffer(AbstractOffer):
 
     __TYPE__ = "event-ticket"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        Field("name"),
+        Field("place"),
+        Field("hall"),
+        Field("hall_part"),
+        Field("date"),
+        Field("is_premiere"),
+        Field("is_kids"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (
+        *OFFER_DICT_KEYS,
+        "name",
+        "place",
+        "hall",
+        "hall_part",
+        "date",
+        "is_premiere",
+        "is_kids",
+    )
+
     __slots__ = [
-        *AbstractOffer.__slots__,
         '_date',
         '_is_premiere',
         '_is_kids',
@@ -988,21 +1041,11 @@ class EventTicketOffer(AbstractOffer):
             is_kids=self.is_kids,
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        return super().create_xml(
-            name="name",
-            place="place",
-            hall="hall",
-            hall_part="hall_part",
-            date="_date",
-            is_premiere="_is_premiere",
-            is_kids="_is_kids",
-        )
-
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "EventTicketOffer":
-        kwargs = AbstractOffer.from_xml(offer_el)
-        return EventTicketOffer(**kwargs)
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "EventTicketOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
 
 class AlcoholOffer(AbstractOffer):
@@ -1015,12 +1058,17 @@ class AlcoholOffer(AbstractOffer):
 
     __TYPE__ = "alco"
 
+    XML_FIELDS = (
+        *OFFER_ATTRIBUTES,
+        *OFFER_TEXT_FIELDS,
+        Field("name"),
+        *OFFER_ELEMENT_FIELDS,
+    )
+
+    DICT_KEYS = (*OFFER_DICT_KEYS, "name")
+
     __slots__ = [
-        *AbstractOffer.__slots__,
-        'name',
-        'vendor',
-        'barcodes',
-        'parameters'
+        'name'
     ]
 
     def __init__(
@@ -1042,10 +1090,43 @@ class AlcoholOffer(AbstractOffer):
     def create_dict(self, **kwargs) -> dict:
         return super().create_dict(name=self.name)
 
-    def create_xml(self, **kwargs) -> XMLElement:
-        return super().create_xml(name="name")
+    @classmethod
+    def from_xml(
+        cls, offer_el: XMLElement, **mapping
+    ) -> "AlcoholOffer":
+        return cls(**get_parser(cls, mapping)(offer_el))
 
-    @staticmethod
-    def from_xml(offer_el: XMLElement, **mapping) -> "AlcoholOffer":
-        kwargs = AbstractOffer.from_xml(offer_el)
-        return AlcoholOffer(**kwargs)
+
+def register_offer_type(offer_cls: Type["AbstractOffer"]):
+    """
+    Registers the offer model for the type from its __TYPE__ attribute,
+    replacing the model registered before for the same type.
+    Can be used as a class decorator.
+    """
+    OFFER_TYPES[offer_cls.__TYPE__] = offer_cls
+    return offer_cls
+
+
+def get_offer_class(offer_type: Optional[str]) -> Type["AbstractOffer"]:
+    """
+    Returns the offer model registered for the offer type.
+    """
+    try:
+        return OFFER_TYPES[offer_type]
+    except KeyError:
+        raise ParseError(
+            "Got unexpected offer type: {0}".format(offer_type)
+        )
+
+
+for _offer_cls in (
+    SimplifiedOffer,
+    ArbitraryOffer,
+    BookOffer,
+    AudioBookOffer,
+    MusicVideoOffer,
+    MedicineOffer,
+    EventTicketOffer,
+    AlcoholOffer,
+):
+    register_offer_type(_offer_cls)
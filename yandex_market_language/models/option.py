@@ -35,5 +35,8 @@ class Option(AbstractModel):
 
     @staticmethod
     def from_xml(el: XMLElement) -> "Option":
-        el.attrib["order_before"] = el.attrib.pop("order-before", None)
-        return Option(**el.attrib)
+        return Option(
+            cost=el.attrib.get("cost"),
+            days=el.attrib.get("days"),
+            order_before=el.attrib.get("order-before"),
+        )
@@ -31,7 +31,7 @@ class Parameter(AbstractModel):
         try:
             self._value = str(v)
         except (TypeError, ValueError):
-            raise ValidationError("value must be a string")
+            raise ValidationError("value must be a string", "value", v)
 
     def create_dict(self, **kwargs) -> dict:
         return dict(name=self.name, value=self.value, unit=self.unit)
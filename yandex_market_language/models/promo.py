@@ -212,3 +212,7 @@ class PromoGift(models.AbstractModel):
             offer_id=el.attrib.get("offer-id"),
             gift_id=el.attrib.get("gift-id")
         )
+
+
+Promo.NESTED_MODELS = {"purchase": Purchase, "promo_gifts": PromoGift}
+Purchase.NESTED_MODELS = {"products": Product}
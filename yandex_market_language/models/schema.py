@@ -0,0 +1,883 @@
+"""
+Declarative metadata of the model fields in the XML elements, and the
+serializers compiled from it once for every model class.
+"""
+from importlib import import_module
+from types import MemberDescriptorType
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type
+from xml.etree import ElementTree as ET
+
+from yandex_market_language.validation import Validated
+
+
+# XML attribute of the model element
+ATTRIBUTE = "attribute"
+
+# Child element with the value as the text
+TEXT = "text"
+
+# Child element with the text for every value of the list
+TEXTS = "texts"
+
+# Empty child element with the value in the attribute, e.g. <supplier ogrn>
+REFERENCE = "reference"
+
+# Nested model
+MODEL = "model"
+
+# Nested model for every value of the list
+MODELS = "models"
+
+# Child element wrapping the nested models of the list
+WRAPPED_MODELS = "wrapped_models"
+
+KINDS = (ATTRIBUTE, TEXT, TEXTS, REFERENCE, MODEL, MODELS, WRAPPED_MODELS)
+
+
+class Field:
+    """
+    Field of the model in the XML element.
+
+    The name is the keyword argument of the model, the tag is the name of
+    the attribute or the child element, the name by default. The value is
+    read from the slot, which is the one the model stores the field in if
+    it isn't set. The attribute is the attribute of the reference element,
+    the model is the class of the nested models. Optional fields are
+    written only if they have a value. The key is the key of the value in
+    the model dictionary, the name by default.
+    """
+
+    __slots__ = (
+        "name",
+        "tag",
+        "kind",
+        "optional",
+        "attribute",
+        "model",
+        "slot",
+        "key",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        tag: str = None,
+        kind: str = TEXT,
+        optional: bool = True,
+        attribute: str = None,
+        model: Type = None,
+        slot: str = None,
+        key: str = None,
+    ):
+        if kind not in KINDS:
+            raise ValueError("kind must be one of: {0}".format(
+                ", ".join(KINDS)
+            ))
+        self.name = name
+        self.tag = tag or name
+        self.kind = kind
+        self.optional = optional
+        self.attribute = attribute
+        self.model = model
+        self.slot = slot
+        self.key = key or name
+
+    def __repr__(self) -> str:
+        return "<Field {name} <{tag}> {kind}>".format(
+            name=self.name, tag=self.tag, kind=self.kind
+        )
+
+
+def _element_lines(field: Field, value: str) -> list:
+    """
+    Returns the source lines writing the child element of the value.
+    """
+    tag = repr(field.tag)
+    if field.kind == TEXT:
+        return ["_SubElement(_el, {t}).text = {v}".format(t=tag, v=value)]
+    if field.kind == TEXTS:
+        return [
+            "for _x in {v}:".format(v=value),
+            "    _SubElement(_el, {t}).text = _x".format(t=tag),
+        ]
+    if field.kind == REFERENCE:
+        return ["_SubElement(_el, {t}, {{{a!r}: {v}}})".format(
+            t=tag, a=field.attribute, v=value
+        )]
+    # The nested elements are appended as to_xml() does it
+    if field.kind == MODEL:
+        return ["_append({v}.create_xml())".format(v=value)]
+    if field.kind == MODELS:
+        return [
+            "for _x in {v}:".format(v=value),
+            "    _append(_x.create_xml())",
+        ]
+    return [
+        "_parent = _SubElement(_el, {t})".format(t=tag),
+        "for _x in {v}:".format(v=value),
+        "    _parent.append(_x.create_xml())",
+    ]
+
+
+def compile_serializer(
+    cls: Type, tag: str, fields: Sequence[Field]
+) -> Callable:
+    """
+    Compiles the function creating the XML element of the model from the
+    fields: every field is read once from its slot and written without
+    lookups of the field metadata. The attributes are set in the declared
+    order, and the child elements are appended in the declared order.
+    """
+    attrib = []
+    children = []
+    for field in fields:
+        slot = field.slot or cls._field_slot(field.name)
+        value = "self.{0}".format(slot)
+        if field.kind == ATTRIBUTE:
+            if field.optional:
+                attrib += [
+                    "_v = {v}".format(v=value),
+                    "if _v:",
+                    "    _attrib[{t!r}] = _v".format(t=field.tag),
+                ]
+            else:
+                attrib.append(
+                    "_attrib[{t!r}] = {v}".format(t=field.tag, v=value)
+                )
+        elif field.optional:
+            children += ["_v = {v}".format(v=value), "if _v:"] + [
+                "    " + line for line in _element_lines(field, "_v")
+            ]
+        else:
+            children += _element_lines(field, value)
+
+    lines = (
+        ["_attrib = {}"]
+        + attrib
+        + [
+            "_el = _Element({t!r}, _attrib)".format(t=tag),
+            "_append = _el.append",
+        ]
+        + children
+        + ["return _el"]
+    )
+    source = "def create_xml(self):\n{body}".format(
+        body="".join("    {0}\n".format(line) for line in lines)
+    )
+    namespace = {"_Element": ET.Element, "_SubElement": ET.SubElement}
+    exec(source, namespace)
+    serializer = namespace["create_xml"]
+    serializer.__qualname__ = "{0}.create_xml".format(cls.__name__)
+    return serializer
+
+
+_serializers = {}
+
+
+def get_serializer(cls: Type, extra: Dict[str, str] = None) -> Callable:
+    """
+    Returns the serializer compiled for the model class from its XML_TAG
+    and XML_FIELDS. The extra text elements (tag -> slot) are written
+    after the text fields of the class.
+    """
+    key = (cls, tuple(extra.items())) if extra else cls
+    try:
+        return _serializers[key]
+    except KeyError:
+        pass
+
+    fields = list(cls.XML_FIELDS)
+    if extra:
+        last_text = max(
+            (i for i, f in enumerate(fields) if f.kind == TEXT), default=-1
+        )
+        fields[last_text + 1:last_text + 1] = [
+            Field(slot, tag, slot=slot) for tag, slot in extra.items()
+        ]
+    serializer = compile_serializer(cls, cls.XML_TAG, fields)
+    _serializers[key] = serializer
+    return serializer
+
+
+def _handler(field: Field, as_dict: bool = False) -> Callable:
+    """
+    Returns the handler setting the keyword argument of the field from
+    the child element. With as_dict set, the nested models are set as
+    their dictionaries.
+    """
+    name = field.name
+    kind = field.kind
+
+    if kind == REFERENCE:
+        attribute = field.attribute
+
+        def handler(el, kwargs):
+            kwargs[name] = el.attrib[attribute]
+
+        return handler
+
+    if kind == TEXTS:
+        def parse(el):
+            return el.text
+    else:
+        model = field.model
+        if as_dict:
+            def parse(el):
+                return model.from_xml(el).create_dict()
+        else:
+            def parse(el):
+                return model.from_xml(el)
+
+    if kind == MODEL:
+        def handler(el, kwargs):
+            kwargs[name] = parse(el)
+
+    elif kind == WRAPPED_MODELS:
+        def handler(el, kwargs):
+            kwargs[name] = [parse(o) for o in el]
+
+    else:
+        def handler(el, kwargs):
+            values = kwargs.get(name)
+            if values is None:
+                kwargs[name] = [parse(el)]
+            else:
+                values.append(parse(el))
+
+    return handler
+
+
+def compile_parser(
+    cls: Type,
+    fields: Sequence[Field],
+    mapping: Dict[str, str] = None,
+    as_dict: bool = False,
+) -> Callable:
+    """
+    Compiles the function returning the keyword arguments of the model
+    from the XML element. Child elements are dispatched by the tag: the
+    text fields and the mapping (tag -> keyword argument) through the
+    table of the keyword arguments, the other fields through the table of
+    the handlers. The text of the elements with other tags is passed with
+    the tag as the keyword argument. The attributes are read after the
+    child elements. With as_dict set, the nested models are passed as
+    their dictionaries.
+    """
+    parameters = cls.init_parameters()
+    texts = {}
+    handlers = {}
+    lists = []
+    attributes = []
+    for field in fields:
+        if field.kind == ATTRIBUTE:
+            if field.name in parameters:
+                attributes.append(field)
+        elif field.kind == TEXT:
+            texts[field.tag] = field.name
+        else:
+            handlers[field.tag] = _handler(field, as_dict)
+            if field.kind in (TEXTS, MODELS, WRAPPED_MODELS):
+                lists.append(field.name)
+    for tag, name in (mapping or {}).items():
+        if tag not in handlers:
+            texts[tag] = name
+
+    lines = [
+        "kwargs = {}",
+        "for _child in el:",
+        "    _tag = _child.tag",
+        "    _name = _texts_get(_tag)",
+        "    if _name is not None:",
+        "        kwargs[_name] = _child.text",
+        "        continue",
+        "    _handler = _handlers_get(_tag)",
+        "    if _handler is None:",
+        "        kwargs[_tag] = _child.text",
+        "    else:",
+        "        _handler(_child, kwargs)",
+    ]
+    # Copy the lists of values to release the spare capacity left by
+    # appending, since the models keep them as they are
+    for name in lists:
+        lines += [
+            "_v = kwargs.get({n!r})".format(n=name),
+            "if _v is not None:",
+            "    kwargs[{n!r}] = _v[:]".format(n=name),
+        ]
+    if attributes:
+        lines.append("_attrib = el.attrib")
+    for field in attributes:
+        get = "[{t!r}]" if not field.optional else ".get({t!r})"
+        lines.append("kwargs[{n!r}] = _attrib{get}".format(
+            n=field.name, get=get.format(t=field.tag)
+        ))
+    lines.append("return kwargs")
+
+    source = "def from_xml(el):\n{body}".format(
+        body="".join("    {0}\n".format(line) for line in lines)
+    )
+    namespace = {"_texts_get": texts.get, "_handlers_get": handlers.get}
+    exec(source, namespace)
+    parser = namespace["from_xml"]
+    parser.__qualname__ = "{0}.from_xml".format(cls.__name__)
+    return parser
+
+
+_parsers = {}
+
+
+def get_parser(cls: Type, mapping: Dict[str, str] = None) -> Callable:
+    """
+    Returns the parser compiled for the model class from its XML_FIELDS,
+    with the extra tags mapped to the keyword arguments.
+    """
+    key = (cls, tuple(mapping.items())) if mapping else cls
+    try:
+        return _parsers[key]
+    except KeyError:
+        pass
+
+    parser = compile_parser(cls, cls.XML_FIELDS, mapping)
+    _parsers[key] = parser
+    return parser
+
+
+def _field_decoder(field: Field) -> Callable:
+    """
+    Returns the function setting the keyword argument of the field from
+    the XML element as the compiled parser does it: the attribute is read
+    in the same way, and the child elements of the tag go through the
+    same handler in the document order.
+    """
+    name = field.name
+    tag = field.tag
+
+    if field.kind == ATTRIBUTE:
+        if field.optional:
+            def decoder(el, kwargs):
+                kwargs[name] = el.attrib.get(tag)
+        else:
+            def decoder(el, kwargs):
+                kwargs[name] = el.attrib[tag]
+        return decoder
+
+    if field.kind == TEXT:
+        def handler(child, kwargs):
+            kwargs[name] = child.text
+    else:
+        handler = _handler(field)
+
+    def decoder(el, kwargs):
+        for child in el:
+            if child.tag == tag:
+                handler(child, kwargs)
+
+    return decoder
+
+
+_field_decoders = {}
+
+
+def get_field_decoder(cls: Type, name: str) -> Callable:
+    """
+    Returns the decoder of the single keyword argument of the model from
+    its XML_FIELDS, as the parser of the model sets it. The arguments
+    without a field are decoded from the text of the element of their
+    name, as the parser passes the unknown tags.
+    """
+    key = (cls, name)
+    try:
+        return _field_decoders[key]
+    except KeyError:
+        pass
+
+    fields = [f for f in cls.XML_FIELDS if f.name == name]
+    decoder = _field_decoder(fields[-1] if fields else Field(name))
+    _field_decoders[key] = decoder
+    return decoder
+
+
+_dict_fields = {}
+
+
+def dict_fields(cls: Type) -> Tuple[Dict[str, Optional[str]], dict]:
+    """
+    Returns the constructor argument of every key of the model dictionary
+    in the order of DICT_KEYS, None for the keys which aren't arguments
+    (e.g. the offer type), and the nested models of the arguments: the
+    models of XML_FIELDS and NESTED_MODELS. The keys of the arguments are
+    the keys of XML_FIELDS and FIELD_KEYS, the names by default.
+    """
+    try:
+        return _dict_fields[cls]
+    except KeyError:
+        pass
+
+    parameters = cls.init_parameters()
+    fields = getattr(cls, "XML_FIELDS", ())
+    keys = {name: cls.FIELD_KEYS.get(name, name) for name in parameters}
+    keys.update((field.name, field.key) for field in fields)
+    names = {key: name for name, key in keys.items()}
+    arguments = {}
+    for key in keys.values() if cls.DICT_KEYS is None else cls.DICT_KEYS:
+        name = names.get(key)
+        arguments[key] = name if name in parameters else None
+    nested = {
+        field.name: field.model
+        for field in fields
+        if field.kind in (MODEL, MODELS, WRAPPED_MODELS)
+    }
+    for name, model in cls.NESTED_MODELS.items():
+        if isinstance(model, str):
+            module, model = model.rsplit(".", 1)
+            model = getattr(import_module("." + module, __package__), model)
+        nested[name] = model
+
+    _dict_fields[cls] = arguments, nested
+    return arguments, nested
+
+
+def _fields_error(cls: Type, missing: set, unknown: set) -> TypeError:
+    if missing:
+        return TypeError("{cls} is missing required fields: {f}".format(
+            cls=cls.__name__, f=", ".join(sorted(missing))
+        ))
+    return TypeError("{cls} got unexpected fields: {f}".format(
+        cls=cls.__name__, f=", ".join(sorted(unknown))
+    ))
+
+
+def compile_dict_parser(cls: Type, fields: Sequence[Field]) -> Callable:
+    """
+    Compiles the function returning the dictionary of the model from the
+    XML element, equal to the one of create_dict with the keys declared by
+    the model, without creating the model. The keyword arguments are
+    parsed with the nested models as dictionaries, the values of the
+    properties go through the setters and the getters of a blank model,
+    so they're validated and converted as the model does it, while the
+    other values are taken as they are.
+    Missing optional values are stored as by the trusted constructor.
+    Missing required and unknown fields raise TypeError.
+    """
+    parameters = cls.init_parameters()
+    arguments, _ = dict_fields(cls)
+    by_name = {field.name: field for field in fields}
+    by_key = {field.key: field for field in fields}
+    namespace = {
+        "_parse": compile_parser(cls, fields, as_dict=True),
+        "_new": cls.__new__,
+        "_cls": cls,
+        "_required": frozenset(
+            name for name, p in parameters.items()
+            if p.default is p.empty
+        ),
+        "_known": frozenset(parameters),
+        "_fields_error": _fields_error,
+    }
+    plan = {
+        name: (slot, default, mutable)
+        for name, slot, default, required, mutable in cls._trusted_plan()
+        if slot is not None and slot != name and not required
+    }
+    setters = []
+    values = []
+    for key, name in arguments.items():
+        if name is None:
+            # Set by the model class itself, e.g. the offer type
+            field = by_key.get(key)
+            value = getattr(cls, field.slot or key, None) if field else None
+            if isinstance(value, MemberDescriptorType):
+                value = cls.SLOT_DEFAULTS.get(field.slot or key)
+            namespace["_k_" + key] = value
+            values.append("    {k!r}: _k_{k},".format(k=key))
+            continue
+
+        field = by_name.get(name)
+        p = parameters[name]
+        default = None if p.default is p.empty else p.default
+        attr = getattr(cls, name, None)
+        if field is not None and field.kind == MODEL:
+            value = "kwargs.get({n!r})".format(n=name)
+        elif field is not None and field.kind in (MODELS, WRAPPED_MODELS):
+            value = "kwargs.get({n!r}) or []".format(n=name)
+        elif isinstance(attr, property):
+            namespace["_set_" + name] = attr.fset
+            namespace["_get_" + name] = attr.fget
+            namespace["_d_" + name] = default
+            stored = plan.get(name)
+            if stored is None:
+                setters.append(
+                    "_set_{n}(_self, kwargs.get({n!r}, _d_{n}))".format(n=name)
+                )
+            else:
+                # Missing values are stored as the setter stores the default
+                slot, namespace["_s_" + name], mutable = stored
+                setters += [
+                    "if {n!r} in kwargs:".format(n=name),
+                    "    _set_{n}(_self, kwargs[{n!r}])".format(n=name),
+                    "else:",
+                    "    _self.{s} = _s_{n}{c}".format(
+                        s=slot, n=name, c=".copy()" if mutable else ""
+                    ),
+                ]
+            value = "_get_{n}(_self)".format(n=name)
+        else:
+            namespace["_d_" + name] = default
+            value = "kwargs.get({n!r}, _d_{n})".format(n=name)
+        values.append("    {k!r}: {v},".format(k=key, v=value))
+
+    lines = [
+        "kwargs = _parse(el)",
+        "_keys = kwargs.keys()",
+        "if not _required <= _keys or not _keys <= _known:",
+        "    raise _fields_error(_cls, _required - _keys, _keys - _known)",
+        "_self = _new(_cls)",
+    ] + setters + ["return {"] + values + ["}"]
+    source = "def to_dict(el):\n{body}".format(
+        body="".join("    {0}\n".format(line) for line in lines)
+    )
+    exec(source, namespace)
+    parser = namespace["to_dict"]
+    parser.__qualname__ = "{0}.dict_from_xml".format(cls.__name__)
+    return parser
+
+
+_dict_parsers = {}
+
+
+def get_dict_parser(cls: Type) -> Callable:
+    """
+    Returns the dictionary parser compiled for the model class from its
+    XML_FIELDS.
+    """
+    try:
+        return _dict_parsers[cls]
+    except KeyError:
+        pass
+
+    parser = compile_dict_parser(cls, cls.XML_FIELDS)
+    _dict_parsers[cls] = parser
+    return parser
+
+
+def _serialization_error(value) -> TypeError:
+    return TypeError("cannot serialize {0!r} (type {1})".format(
+        value, type(value).__name__
+    ))
+
+
+def _escape_text(text: str) -> str:
+    """
+    Escapes the text of the element as ElementTree does it.
+    """
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        return text
+    except (TypeError, AttributeError):
+        raise _serialization_error(text)
+
+
+def _escape_attribute(value: str) -> str:
+    """
+    Escapes the attribute value as ElementTree does it.
+    """
+    try:
+        if "&" in value:
+            value = value.replace("&", "&amp;")
+        if "<" in value:
+            value = value.replace("<", "&lt;")
+        if ">" in value:
+            value = value.replace(">", "&gt;")
+        if "\"" in value:
+            value = value.replace("\"", "&quot;")
+        if "\r" in value:
+            value = value.replace("\r", "&#13;")
+        if "\n" in value:
+            value = value.replace("\n", "&#10;")
+        if "\t" in value:
+            value = value.replace("\t", "&#09;")
+        return value
+    except (TypeError, AttributeError):
+        raise _serialization_error(value)
+
+
+def element_text(el: ET.Element, level: int = None) -> str:
+    """
+    Returns the XML text of the element as ET.tostring returns it, with
+    the element indented at the level as YML.indent indents it, unless the
+    level is None. The element isn't changed.
+    """
+    tag = el.tag
+    parts = ["<", tag]
+    for key, value in el.items():
+        parts += [" ", key, "=\"", _escape_attribute(value), "\""]
+    text = el.text
+    if len(el):
+        child_level = None
+        if level is not None:
+            child_level = level + 1
+            indent = "\n" + child_level * "\t"
+            if not text or not text.strip():
+                text = indent
+        parts.append(">")
+        if text:
+            parts.append(_escape_text(text))
+        last = len(el) - 1
+        for i, child in enumerate(el):
+            parts.append(element_text(child, child_level))
+            tail = child.tail
+            if level is not None and (not tail or not tail.strip()):
+                tail = indent if i < last else indent[:-1]
+            if tail:
+                parts.append(_escape_text(tail))
+        parts += ["</", tag, ">"]
+    elif text:
+        parts += [">", _escape_text(text), "</", tag, ">"]
+    else:
+        parts.append(" />")
+    return "".join(parts)
+
+
+def _text_lines(field: Field, value: str, nl: str, level: int) -> list:
+    """
+    Returns the source lines appending the XML text of the child element
+    of the value, indented with nl, the nested elements at the level.
+    """
+    tag = field.tag
+    if field.kind in (TEXT, TEXTS):
+        line = "_append({o!r} + _text({v}) + {c!r} if {v} else {e!r})"
+        line = line.format(
+            o="{0}<{1}>".format(nl, tag),
+            c="</{0}>".format(tag),
+            e="{0}<{1} />".format(nl, tag),
+            v="_x" if field.kind == TEXTS else value,
+        )
+        if field.kind == TEXT:
+            return [line]
+        return ["for _x in {v}:".format(v=value), "    " + line]
+    if field.kind == REFERENCE:
+        return ["_append({o!r} + _attr({v}) + '\" />')".format(
+            o="{0}<{1} {2}=\"".format(nl, tag, field.attribute), v=value
+        )]
+    child_level = None if level is None else level + 1
+    if field.kind == MODEL:
+        return ["_append({nl!r} + _element({v}.create_xml(), {l}))".format(
+            nl=nl, v=value, l=child_level
+        )]
+    if field.kind == MODELS:
+        return [
+            "for _x in {v}:".format(v=value),
+            "    _append({nl!r} + _element(_x.create_xml(), {l}))".format(
+                nl=nl, l=child_level
+            ),
+        ]
+    inner = nl + "\t" if nl else ""
+    return [
+        "_append({o!r})".format(o="{0}<{1}>".format(nl, tag)),
+        "for _x in {v}:".format(v=value),
+        "    _append({nl!r} + _element(_x.create_xml(), {l}))".format(
+            nl=inner, l=None if level is None else level + 2
+        ),
+        "_append({c!r})".format(c="{0}</{1}>".format(nl, tag)),
+    ]
+
+
+def _value_lines(
+    cls: Type,
+    field: Field,
+    key: str,
+    parameter,
+    model: Type,
+    owner: Type,
+    plan: dict,
+    namespace: dict,
+) -> list:
+    """
+    Returns the source lines setting _v to the value of the argument as
+    the model stores it, formatted with the name and the slot. The values
+    of the column of the owner are taken from the batch columns if the
+    argument is the same property with the same default in both models.
+    The plan has the stored defaults of the optional properties.
+    """
+    name = field.name
+    attr = getattr(cls, name, None)
+    namespace["_d_" + name] = None if parameter.default is parameter.empty \
+        else parameter.default
+    setter = ["_set_{n}(_blank, _v)", "_v = _blank.{s}"]
+    if isinstance(attr, property):
+        namespace["_set_" + name] = attr.fset
+
+    if owner is not None and attr is getattr(owner, name, None) and (
+        parameter.default == owner.init_parameters()[name].default
+    ):
+        return [
+            "_v = c[{n!r}][i]",
+            "if _v.__class__ is not _Validated:",
+        ] + ["    " + line for line in setter]
+
+    if model is None and name in plan and isinstance(attr, property):
+        # Missing values are stored as the setter stores the default
+        namespace["_s_" + name] = plan[name]
+        return [
+            "if {k!r} in d:".format(k=key),
+            "    _v = d[{k!r}]".format(k=key),
+        ] + ["    " + line for line in setter] + ["else:", "    _v = _s_{n}"]
+
+    lines = ["_v = _get({k!r}, _d_{{n}})".format(k=key)]
+    if model is not None:
+        namespace["_new_" + name] = model.from_dict
+        if field.kind == MODEL:
+            new = "_v = _new_{n}(_v)"
+        else:
+            new = "_v = [_new_{n}(_x) for _x in _v]"
+        lines += ["if _v is not None:", "    " + new]
+    if isinstance(attr, property):
+        lines += setter
+    return lines
+
+
+def compile_dict_writer(
+    cls: Type,
+    fields: Sequence[Field],
+    level: int = None,
+    columns: Dict[str, Type] = None,
+) -> Callable:
+    """
+    Compiles the function returning the XML text of the model element
+    from the model dictionary in the form of create_dict, without creating
+    the model: the values of the properties are validated and stored by
+    the setters of a blank model, the nested models are created from their
+    dictionaries, and the stored values are written as the serializer
+    writes them. The element is indented at the level as YML.indent does
+    it, unless the level is None. The blank model is created for every
+    call, so the function can be called from several threads.
+
+    The function takes the dictionary, the batch columns and the position
+    of the dictionary in the batch. The columns (argument name -> model
+    class which validated them) are used for the properties shared with
+    that model, and only the values not marked as Validated go through
+    the setters. Missing required and unknown fields raise TypeError.
+    """
+    parameters = cls.init_parameters()
+    arguments, nested = dict_fields(cls)
+    keys = {name: key for key, name in arguments.items() if name is not None}
+    plan = {
+        name: default
+        for name, slot, default, required, mutable in cls._trusted_plan()
+        if slot is not None and slot != name and not required
+    }
+    namespace = {
+        "_cls": cls,
+        "_new": cls.__new__,
+        "_required": frozenset(
+            keys.get(name, name) for name, p in parameters.items()
+            if p.default is p.empty
+        ),
+        "_known": frozenset(arguments) | frozenset(
+            keys.get(name, name) for name in parameters
+        ),
+        "_fields_error": _fields_error,
+        "_Validated": Validated,
+        "_text": _escape_text,
+        "_attr": _escape_attribute,
+        "_element": element_text,
+    }
+    nl = "" if level is None else "\n" + (level + 1) * "\t"
+
+    attrib = []
+    children = []
+    for field in fields:
+        name = field.name
+        slot = field.slot or cls._field_slot(name)
+        lines = []
+        if name not in parameters:
+            # Set by the model class itself, e.g. the offer type
+            value = getattr(cls, slot, None)
+            if isinstance(value, MemberDescriptorType):
+                value = cls.SLOT_DEFAULTS.get(slot)
+            namespace["_k_" + name] = value
+            lines.append("_v = _k_{n}".format(n=name))
+        else:
+            lines += _value_lines(
+                cls, field, keys.get(name, name), parameters[name],
+                nested.get(name), (columns or {}).get(name), plan, namespace,
+            )
+            lines = [line.format(n=name, s=slot) for line in lines]
+
+        if field.kind == ATTRIBUTE:
+            written = ["_append({o!r} + _attr(_v) + '\"')".format(
+                o=" {0}=\"".format(field.tag)
+            )]
+        else:
+            written = _text_lines(field, "_v", nl, level)
+        if field.optional:
+            lines += ["if _v:"] + ["    " + line for line in written]
+        elif field.kind == WRAPPED_MODELS:
+            lines += ["if _v:"] + ["    " + line for line in written] + [
+                "else:",
+                "    _append({e!r})".format(e="{0}<{1} />".format(
+                    nl, field.tag
+                )),
+            ]
+        else:
+            lines += written
+        if field.kind == ATTRIBUTE:
+            attrib += lines
+        else:
+            children += lines
+
+    end = "" if level is None else "\n" + level * "\t"
+    lines = (
+        [
+            "_keys = d.keys()",
+            "if not _required <= _keys or not _keys <= _known:",
+            "    raise _fields_error(_cls, _required - _keys, _keys - _known)",
+            "_get = d.get",
+            "_blank = _new(_cls)",
+            "_parts = [{o!r}]".format(o="<" + cls.XML_TAG),
+            "_append = _parts.append",
+        ]
+        + attrib
+        + ["_append('>')", "_attributes = len(_parts)"]
+        + children
+        + [
+            "if len(_parts) == _attributes:",
+            "    _parts[-1] = ' />'",
+            "    return ''.join(_parts)",
+            "_append({c!r})".format(c="{0}</{1}>".format(end, cls.XML_TAG)),
+            "return ''.join(_parts)",
+        ]
+    )
+    source = "def to_xml(d, c, i):\n{body}".format(
+        body="".join("    {0}\n".format(line) for line in lines)
+    )
+    exec(source, namespace)
+    writer = namespace["to_xml"]
+    writer.__qualname__ = "{0}.xml_from_dict".format(cls.__name__)
+    return writer
+
+
+_dict_writers = {}
+
+
+def get_dict_writer(
+    cls: Type, level: int = None, columns: Dict[str, Type] = None
+) -> Callable:
+    """
+    Returns the dictionary writer compiled for the model class from its
+    XML_FIELDS, indented at the level and taking the values of the columns.
+    """
+    key = (cls, level, tuple(columns.items()) if columns else None)
+    try:
+        return _dict_writers[key]
+    except KeyError:
+        pass
+
+    writer = compile_dict_writer(cls, cls.XML_FIELDS, level, columns)
+    _dict_writers[key] = writer
+    return writer
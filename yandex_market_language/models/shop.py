@@ -1,11 +1,20 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from yandex_market_language import models, exceptions
+from yandex_market_language import models
 from yandex_market_language.models import fields
 from yandex_market_language.models.abstract import XMLElement, XMLSubElement
+from yandex_market_language.models.indexes import (
+    CategoryIndex,
+    OfferList,
+    versioned,
+)
 
+from yandex_market_language.errors import COLLECTED_ERRORS, OfferError
 from yandex_market_language.exceptions import ValidationError
 
+if TYPE_CHECKING:
+    from yandex_market_language.table import OfferTable
+
 
 class Shop(
     fields.EnableAutoDiscountField,
@@ -25,8 +34,9 @@ class Shop(
         'name',
         'company',
         'currencies',
-        'categories',
-        'offers',
+        '_categories',
+        '_offers',
+        '_category_index',
         'platform',
         'version',
         'agency',
@@ -38,6 +48,20 @@ class Shop(
         'promos'
     ]
 
+    SLOT_DEFAULTS = {"_category_index": None}
+
+    TRUSTED_SETTERS = ("categories", "offers")
+
+    NESTED_MODELS = {
+        "currencies": "currency.Currency",
+        "categories": "category.Category",
+        "delivery_options": "option.Option",
+        "pickup_options": "option.Option",
+        "offers": "offers.AbstractOffer",
+        "gifts": "gift.Gift",
+        "promos": "promo.Promo",
+    }
+
     def __init__(
         self,
         name: str,
@@ -71,6 +95,7 @@ class Shop(
         self.offers = offers
         self.gifts = gifts
         self.promos = promos
+        self._category_index = None
 
     @property
     def url(self):
@@ -79,9 +104,95 @@ class Shop(
     @url.setter
     def url(self, value: str):
         if len(value) > 512:
-            raise ValidationError("The maximum url length is 512 characters.")
+            raise ValidationError(
+                "The maximum url length is 512 characters.", "url", value
+            )
         self._url = value
 
+    @property
+    def categories(self) -> List["models.Category"]:
+        """
+        Returns the categories list. A list set to the shop is copied into
+        a VersionedList unless it's one already, so later changes of the
+        list set aren't seen by the shop.
+        """
+        return self._categories
+
+    @categories.setter
+    def categories(self, value: List["models.Category"]):
+        # Copied unless it's a VersionedList, which is kept as it is
+        self._categories = versioned(value)
+
+    @property
+    def offers(self) -> "OfferList":
+        """
+        Returns the offers list with indexes by the offer id, group id,
+        vendor, vendor code and barcode. A list set to the shop is copied
+        into an OfferList unless it's one already, so later changes of the
+        list set aren't seen by the shop.
+        """
+        return self._offers
+
+    @offers.setter
+    def offers(self, value: List["models.offers.AbstractOffer"]):
+        # Copied unless it's an OfferList, which is kept as it is
+        self._offers = versioned(value, OfferList)
+
+    @property
+    def category_index(self) -> "CategoryIndex":
+        """
+        Returns the index of the category tree and the offers by category.
+        The index is rebuilt after the categories or the offers lists are
+        changed; changes of the models in the lists aren't tracked.
+        """
+        categories, offers = self._categories, self._offers
+        key = (categories.version, offers.version)
+        cached = self._category_index
+        if (
+            cached is None
+            or cached[0] is not categories
+            or cached[1] is not offers
+            or cached[2] != key
+        ):
+            cached = (
+                categories, offers, key, CategoryIndex(categories, offers)
+            )
+            self._category_index = cached
+        return cached[3]
+
+    def offers_in_category(
+        self, category_id, recursive: bool = True
+    ) -> List["models.offers.AbstractOffer"]:
+        """
+        Returns the offers of the category, with the offers of its
+        descendant categories if recursive is set.
+        """
+        return self.category_index.offers_in_category(category_id, recursive)
+
+    def promo_offers(
+        self, promo: "models.Promo"
+    ) -> List["models.offers.AbstractOffer"]:
+        """
+        Returns the offers taking part in the promo purchase, found by the
+        offer ids and the category ids of its products.
+        """
+        by_id = self.offers.by_id
+        result = []
+        seen = set()
+        for product in promo.purchase.products:
+            if product.offer_id is not None:
+                offer = by_id.get(product.offer_id)
+                offers = [offer] if offer is not None else []
+            elif product.category_id is not None:
+                offers = self.offers_in_category(product.category_id)
+            else:
+                offers = []
+            for offer in offers:
+                if id(offer) not in seen:
+                    seen.add(id(offer))
+                    result.append(offer)
+        return result
+
     def create_dict(self, **kwargs) -> dict:
         return dict(
             name=self.name,
@@ -101,7 +212,7 @@ class Shop(
             promos=[p.to_dict() for p in self.promos] if self.promos else [],
         )
 
-    def create_xml(self, **kwargs) -> XMLElement:
+    def create_xml(self, with_offers: bool = True, **kwargs) -> XMLElement:
         shop_el = XMLElement("shop")
 
         # Add simple elements
@@ -150,8 +261,9 @@ class Shop(
 
         # Add offers
         offers_el = XMLSubElement(shop_el, "offers")
-        for o in self.offers:
-            o.to_xml(offers_el)
+        if with_offers:
+            for o in self.offers:
+                o.to_xml(offers_el)
 
         # Add gifts
         if self.gifts:
@@ -167,8 +279,53 @@ class Shop(
 
         return shop_el
 
+    def offers_table(self) -> "OfferTable":
+        """
+        Returns the shop offers stored column-wise. NumPy is required.
+        """
+        from yandex_market_language.table import OfferTable
+        return OfferTable.from_offers(self.offers)
+
+    @staticmethod
+    def offer_from_xml(
+        offer_el: XMLElement,
+        lazy: bool = False,
+    ) -> "models.offers.AbstractOffer":
+        """
+        Creates an offer model of the type set in the offer element.
+        With lazy set, returns the offer proxy which parses fields on access.
+        """
+        offer_cls = models.get_offer_class(offer_el.attrib.get("type"))
+        if lazy:
+            return models.LazyOffer(offer_el, offer_cls)
+        return offer_cls.from_xml(offer_el)
+
+    @staticmethod
+    def collect_offers(
+        offers_el: XMLElement, errors: List["OfferError"]
+    ) -> List["models.offers.AbstractOffer"]:
+        """
+        Creates the offer models, skipping invalid offers and adding their
+        errors to the list.
+        """
+        offers = []
+        for i, offer_el in enumerate(offers_el):
+            try:
+                offers.append(Shop.offer_from_xml(offer_el))
+            except COLLECTED_ERRORS as e:
+                errors.append(OfferError.from_exception(e, i, offer_el))
+        return offers
+
     @staticmethod
-    def from_xml(shop_el: XMLElement) -> "Shop":
+    def from_xml(
+        shop_el: XMLElement,
+        lazy: bool = False,
+        errors: List["OfferError"] = None,
+    ) -> "Shop":
+        """
+        With the errors list set, invalid offers are skipped and their
+        errors are added to the list.
+        """
         kwargs = {}
 
         for el in shop_el:
@@ -193,30 +350,12 @@ class Shop(
                     pickup_options.append(models.Option.from_xml(option_el))
                 kwargs["pickup_options"] = pickup_options
             elif el.tag == "offers":
+                if errors is not None:
+                    kwargs["offers"] = Shop.collect_offers(el, errors)
+                    continue
                 offers = []
                 for offer_el in el:
-                    offer_type = offer_el.attrib.get("type")
-                    if offer_type is None:
-                        offer = models.SimplifiedOffer.from_xml(offer_el)
-                    elif offer_type == "vendor.model":
-                        offer = models.ArbitraryOffer.from_xml(offer_el)
-                    elif offer_type == "book":
-                        offer = models.BookOffer.from_xml(offer_el)
-                    elif offer_type == "audiobook":
-                        offer = models.AudioBookOffer.from_xml(offer_el)
-                    elif offer_type == "artist.title":
-                        offer = models.MusicVideoOffer.from_xml(offer_el)
-                    elif offer_type == "medicine":
-                        offer = models.MedicineOffer.from_xml(offer_el)
-                    elif offer_type == "event-ticket":
-                        offer = models.EventTicketOffer.from_xml(offer_el)
-                    elif offer_type == "alco":
-                        offer = models.AlcoholOffer.from_xml(offer_el)
-                    else:
-                        raise exceptions.ParseError(
-                            "Got unexpected offer type: {0}".format(offer_type)
-                        )
-                    offers.append(offer)
+                    offers.append(Shop.offer_from_xml(offer_el, lazy))
                 kwargs["offers"] = offers
             elif el.tag == "gifts":
                 gifts = []
@@ -0,0 +1,88 @@
+"""
+Parallel parsing of the feed offers.
+
+The <offers> section of the file is split into byte ranges aligned to the
+offer elements, and every range is parsed in a separate process from the
+memory-mapped file.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Union
+
+from yandex_market_language.mapped import MappedFeed
+from yandex_market_language.models import Feed
+from yandex_market_language.models.offers import AbstractOffer
+
+
+CHUNKS_PER_WORKER = 4
+
+
+def split_offers(path, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Splits the <offers> section of the file into byte ranges aligned to
+    the offer elements.
+    Returns the list of ranges in the document order.
+    """
+    with MappedFeed(path) as feed:
+        return feed.offer_chunks(chunks)
+
+
+def _parse_chunk(task: tuple) -> list:
+    """
+    Parses the offers from the byte range of the mapped file.
+    """
+    path, start, end, as_dict = task
+    with MappedFeed(path) as feed:
+        return [
+            offer.to_dict() if as_dict else offer
+            for offer in feed.iter_range(start, end)
+        ]
+
+
+def _split_tasks(path, workers: int, as_dict: bool) -> list:
+    """
+    Returns the tasks for the workers.
+    """
+    ranges = split_offers(path, workers * CHUNKS_PER_WORKER)
+    return [(path, start, end, as_dict) for start, end in ranges]
+
+
+def parse_offers(
+    path,
+    workers: int = None,
+    as_dict: bool = False,
+) -> List[Union["AbstractOffer", dict]]:
+    """
+    Parses the feed offers in the pool of processes and returns them in the
+    document order. With as_dict the offers are converted to dictionaries
+    in the workers, so the model graphs are not sent between processes.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = _split_tasks(path, workers, as_dict)
+
+    offers = []
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in executor.map(_parse_chunk, tasks):
+            offers.extend(chunk)
+    return offers
+
+
+def parse(path, workers: int = None) -> "Feed":
+    """
+    Parses the feed offers in the pool of processes, while the feed header
+    is parsed in the current process.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = _split_tasks(path, workers, False)
+
+    with ProcessPoolExecutor(workers) as executor:
+        chunks = executor.map(_parse_chunk, tasks)
+
+        # Parse the header skipping the content of the offers section
+        with MappedFeed(path) as mapped_feed:
+            feed = mapped_feed.parse_header()
+
+        for chunk in chunks:
+            feed.shop.offers.extend(chunk)
+
+    return feed
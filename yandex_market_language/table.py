@@ -0,0 +1,261 @@
+"""
+Columnar representation of the feed offers.
+
+Numeric fields of the offers are stored in NumPy arrays, so the offers can
+be filtered with vectorised expressions, e.g. ``table[table.price < 1000]``.
+"""
+import sys
+from typing import Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from yandex_market_language.models.offers import AbstractOffer
+
+
+# Value of the missing optional integers (group_id is a positive int)
+MISSING_INT = 0
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "NumPy is required for the columnar offers, "
+            "install it with: pip install numpy"
+        )
+
+
+def _object_array(values: list) -> "np.ndarray":
+    """
+    Returns a one-dimensional array of objects, which keeps tuples and lists
+    as elements instead of adding dimensions.
+    """
+    array = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        array[i] = v
+    return array
+
+
+def _float(value) -> float:
+    return float(value) if value is not None and value != "" else np.nan
+
+
+class ListColumn:
+    """
+    Lists of values of all rows stored as one flat array of values and an
+    array of offsets: values of the row i are values[offsets[i]:offsets[i+1]].
+    """
+
+    __slots__ = [
+        "values",
+        "offsets",
+    ]
+
+    def __init__(self, values: "np.ndarray", offsets: "np.ndarray"):
+        self.values = values
+        self.offsets = offsets
+
+    @staticmethod
+    def from_lists(lists: List[list], width: int = None) -> "ListColumn":
+        """
+        Builds the column from the lists of values, with the width set the
+        values are tuples stored as rows of the two-dimensional array.
+        """
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum([len(v) for v in lists], out=offsets[1:])
+        flat = [v for row in lists for v in row]
+        if width is None:
+            values = _object_array(flat)
+        else:
+            values = np.empty((len(flat), width), dtype=object)
+            if flat:
+                values[:] = flat
+        return ListColumn(values, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> list:
+        values = self.values[self.offsets[i]:self.offsets[i + 1]].tolist()
+        if self.values.ndim > 1:
+            return [tuple(v) for v in values]
+        return values
+
+    def lengths(self) -> "np.ndarray":
+        """
+        Returns the number of values in each row.
+        """
+        return np.diff(self.offsets)
+
+    def take(self, indices: "np.ndarray") -> "ListColumn":
+        """
+        Returns the column with the rows at the indices.
+        """
+        starts = self.offsets[indices]
+        lengths = self.lengths()[indices]
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = np.repeat(starts - offsets[:-1], lengths)
+        flat += np.arange(offsets[-1], dtype=np.int64)
+        return ListColumn(self.values[flat], offsets)
+
+
+class OfferTable:
+    """
+    Offers of the feed stored column-wise.
+
+    Prices, old prices, weights and bids are float arrays with NaN for the
+    missing values, min_quantity and group_id are integer arrays with
+    MISSING_INT for the missing group. Offer ids, categories and currencies
+    are arrays of interned strings. Pictures, barcodes and parameters are
+    list columns, parameters are stored as (name, value, unit) tuples.
+
+    The table is filtered with boolean masks, index arrays or slices, while
+    the rows keep their positions in the source of the offers, so the offer
+    models can be built back with to_offers.
+    """
+
+    FLOAT_COLUMNS = ("price", "old_price", "weight", "bid")
+    INT_COLUMNS = ("min_quantity", "group_id")
+    STR_COLUMNS = ("offer_id", "category_id", "currency")
+    LIST_COLUMNS = ("pictures", "barcodes", "parameters")
+
+    __slots__ = [
+        *FLOAT_COLUMNS,
+        *INT_COLUMNS,
+        *STR_COLUMNS,
+        *LIST_COLUMNS,
+        "rows",
+        "_source",
+    ]
+
+    def __init__(self, columns: dict, rows: "np.ndarray", source=None):
+        _require_numpy()
+        for name in self.columns():
+            setattr(self, name, columns[name])
+        self.rows = rows
+        self._source = source
+
+    def __repr__(self) -> str:
+        return "<OfferTable rows={0}>".format(len(self))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, key) -> "OfferTable":
+        return self.take(np.arange(len(self))[key])
+
+    @classmethod
+    def columns(cls) -> tuple:
+        return (
+            cls.FLOAT_COLUMNS
+            + cls.INT_COLUMNS
+            + cls.STR_COLUMNS
+            + cls.LIST_COLUMNS
+        )
+
+    @classmethod
+    def from_offers(
+        cls,
+        offers: Iterable["AbstractOffer"],
+        source=None,
+    ) -> "OfferTable":
+        """
+        Builds the table from the offer models (or lazy offers) in one pass.
+        The source is a list of the offers or a path of the feed file, which
+        is used to build the offer models back. A list of offers is used as
+        the source by default.
+        """
+        _require_numpy()
+        if source is None and isinstance(offers, list):
+            source = offers
+
+        values = {name: [] for name in cls.columns()}
+        intern = sys.intern
+        for o in offers:
+            values["price"].append(o.price.value)
+            values["old_price"].append(_float(o.old_price))
+            values["weight"].append(_float(o.weight))
+            values["bid"].append(_float(o.bid))
+            values["min_quantity"].append(o.min_quantity)
+            values["group_id"].append(o.group_id or MISSING_INT)
+            values["offer_id"].append(intern(str(o.offer_id)))
+            values["category_id"].append(intern(str(o.category_id)))
+            values["currency"].append(intern(str(o.currency)))
+            values["pictures"].append(o.pictures or [])
+            values["barcodes"].append(o.barcodes or [])
+            values["parameters"].append([
+                (intern(p.name), p.value, p.unit and intern(p.unit))
+                for p in o.parameters
+            ])
+
+        columns = {}
+        for name in cls.FLOAT_COLUMNS:
+            columns[name] = np.array(values[name], dtype=np.float64)
+        for name in cls.INT_COLUMNS:
+            columns[name] = np.array(values[name], dtype=np.int64)
+        for name in cls.STR_COLUMNS:
+            columns[name] = _object_array(values[name])
+        columns["pictures"] = ListColumn.from_lists(values["pictures"])
+        columns["barcodes"] = ListColumn.from_lists(values["barcodes"])
+        columns["parameters"] = ListColumn.from_lists(
+            values["parameters"], width=3
+        )
+
+        rows = np.arange(len(columns["price"]), dtype=np.int64)
+        return cls(columns, rows, source)
+
+    def take(self, indices) -> "OfferTable":
+        """
+        Returns the table with the rows at the indices.
+        """
+        indices = np.atleast_1d(np.asarray(indices, dtype=np.int64))
+        columns = {}
+        for name in self.columns():
+            column = getattr(self, name)
+            if isinstance(column, ListColumn):
+                columns[name] = column.take(indices)
+            else:
+                columns[name] = column[indices]
+        return type(self)(columns, self.rows[indices], self._source)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns the size of the arrays, for the object arrays it's the size
+        of the references only.
+        """
+        size = self.rows.nbytes
+        for name in self.columns():
+            column = getattr(self, name)
+            if isinstance(column, ListColumn):
+                size += column.values.nbytes + column.offsets.nbytes
+            else:
+                size += column.nbytes
+        return size
+
+    def to_offers(self) -> List["AbstractOffer"]:
+        """
+        Returns the offer models of the table rows. With a feed file as the
+        source, the file is read up to the last row of the table.
+        """
+        if self._source is None:
+            raise ValueError("The table has no source of the offer models")
+        if isinstance(self._source, list):
+            return [self._source[i] for i in self.rows]
+
+        from yandex_market_language.yml import iter_offers
+
+        positions = {}
+        for n, row in enumerate(self.rows.tolist()):
+            positions.setdefault(row, []).append(n)
+
+        offers = [None] * len(self)
+        for row, offer in enumerate(iter_offers(self._source)):
+            if not positions:
+                break
+            for n in positions.pop(row, ()):
+                offers[n] = offer
+        return offers
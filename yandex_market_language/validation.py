@@ -0,0 +1,336 @@
+"""
+Batch validation of the offer field columns.
+
+A column of raw values (e.g. all prices of a feed) is checked at once:
+distinct values are converted in one pass by the built-in converters, and
+only the chunks with invalid values are checked one by one; numeric NumPy
+arrays are checked with vectorised functions. The result has the
+mask of valid values and the positions of invalid ones, and the valid
+values marked as Validated, which the model setters take without checks.
+"""
+import re
+from datetime import datetime
+from itertools import repeat
+from operator import not_
+from typing import Callable, Dict, Optional, Sequence
+
+
+class Validated(str):
+    """
+    String which passed the batch validation and is in the form stored by
+    the model setters, so the setters store it without checks.
+    """
+
+    __slots__ = ()
+
+
+# Integers stored by the setters as is
+CANONICAL_INT_PATTERN = re.compile(r"-?(?:0|[1-9][0-9]*)")
+
+BOOL_VALUES = {"true": "true", "false": "false", True: "true", False: "false"}
+
+CONVERSION_ERRORS = (TypeError, ValueError, OverflowError)
+
+# Number of distinct values converted at once after a failed conversion
+CHUNK_SIZE = 256
+
+# Maximum length of the group_id integers, as checked by the setter
+GROUP_ID_MAX_LENGTH = 9
+
+# Offer fields whose valid values are marked as Validated, so the writers
+# of the offer dictionaries take them without the setters: their column
+# validators must check every rule of the setters
+MARKED_FIELDS = ("weight", "min_quantity", "group_id", "expiry")
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+class BatchResult:
+    """
+    Result of the column validation: the mask of valid values and the
+    positions of invalid ones, NumPy arrays if NumPy is installed.
+    The values property returns the column with the valid values marked
+    as Validated where their form is the one stored by the setters.
+    """
+
+    __slots__ = ("mask", "errors", "_source", "_mark", "_values")
+
+    def __init__(self, mask, errors, source: Sequence, mark: Callable):
+        self.mask = mask
+        self.errors = errors
+        self._source = source
+        self._mark = mark
+        self._values = None
+
+    def __repr__(self) -> str:
+        return "<BatchResult values={n} errors={e}>".format(
+            n=len(self.mask), e=len(self.errors)
+        )
+
+    def __bool__(self) -> bool:
+        return len(self.errors) == 0
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    @property
+    def values(self) -> list:
+        if self._values is None:
+            source = self._source
+            if hasattr(source, "tolist"):
+                source = source.tolist()
+            mask = self.mask
+            if hasattr(mask, "tolist"):
+                mask = mask.tolist()
+            mark = self._mark
+            self._values = [
+                mark(v) if valid else v for v, valid in zip(source, mask)
+            ]
+        return self._values
+
+
+def _result(valid: Sequence[bool], source: Sequence, mark) -> BatchResult:
+    np = _numpy()
+    if np is None:
+        mask = list(valid)
+        errors = [i for i, ok in enumerate(mask) if not ok]
+        return BatchResult(mask, errors, source, mark)
+    mask = np.fromiter(valid, dtype=bool, count=len(source))
+    return BatchResult(mask, np.flatnonzero(~mask), source, mark)
+
+
+def _numeric_array(values) -> Optional[str]:
+    """
+    Returns the dtype kind of a numeric NumPy array, or None.
+    """
+    kind = getattr(getattr(values, "dtype", None), "kind", None)
+    return kind if kind in ("i", "u", "f") else None
+
+
+def _accepts(convert: Callable, value) -> bool:
+    try:
+        convert(value)
+        return True
+    except CONVERSION_ERRORS:
+        return False
+
+
+def _rejected(convert: Callable, values: list) -> list:
+    """
+    Returns the values not accepted by the converter. Values are converted
+    by chunks, and only the values of the failed chunks one by one.
+    """
+    try:
+        list(map(convert, values))
+        return []
+    except CONVERSION_ERRORS:
+        pass
+    rejected = []
+    for start in range(0, len(values), CHUNK_SIZE):
+        chunk = values[start:start + CHUNK_SIZE]
+        try:
+            list(map(convert, chunk))
+        except CONVERSION_ERRORS:
+            rejected.extend(v for v in chunk if not _accepts(convert, v))
+    return rejected
+
+
+def _validate(
+    values: Sequence, convert: Callable, mark: Callable, allow_none: bool
+) -> BatchResult:
+    """
+    Checks the values are accepted by the converter. Columns of strings are
+    checked by distinct values.
+    """
+    types = set(map(type, values))
+    if types <= {str, Validated, type(None)}:
+        distinct = set(values)
+        invalid = set()
+        if None in distinct:
+            distinct.discard(None)
+            if not allow_none:
+                invalid.add(None)
+        invalid.update(_rejected(convert, list(distinct)))
+        if not invalid:
+            return _result(repeat(True, len(values)), values, mark)
+        valid = map(not_, map(invalid.__contains__, values))
+        return _result(valid, values, mark)
+
+    return _result(
+        (
+            allow_none if v is None else _accepts(convert, v)
+            for v in values
+        ),
+        values,
+        mark,
+    )
+
+
+def _mark_int(value):
+    if value.__class__ is str:
+        if CANONICAL_INT_PATTERN.fullmatch(value) is not None:
+            return Validated(value)
+    elif value.__class__ is int:
+        return Validated(value)
+    return value
+
+
+def _mark_float(value):
+    if value.__class__ in (str, int, float):
+        return Validated(value)
+    return value
+
+
+def validate_ints(values: Sequence, allow_none: bool = False) -> BatchResult:
+    """
+    Checks the values are accepted by the integer fields.
+    """
+    np = _numpy()
+    kind = _numeric_array(values)
+    if kind is not None and np is not None:
+        if kind == "f":
+            mask = np.isfinite(values)
+            return BatchResult(
+                mask,
+                np.flatnonzero(~mask),
+                values,
+                lambda v: Validated(int(v)),
+            )
+        mask = np.ones(len(values), dtype=bool)
+        return BatchResult(mask, np.flatnonzero(~mask), values, Validated)
+    return _validate(values, int, _mark_int, allow_none)
+
+
+def validate_floats(
+    values: Sequence, allow_none: bool = False
+) -> BatchResult:
+    """
+    Checks the values are accepted by the float fields.
+    """
+    np = _numpy()
+    if _numeric_array(values) is not None and np is not None:
+        mask = np.ones(len(values), dtype=bool)
+        return BatchResult(mask, np.flatnonzero(~mask), values, Validated)
+    return _validate(values, float, _mark_float, allow_none)
+
+
+def validate_bools(values: Sequence, allow_none: bool = False) -> BatchResult:
+    """
+    Checks the values are accepted by the boolean fields, the values are
+    converted to the stored "true" and "false" strings.
+    """
+    def valid(v) -> bool:
+        if v.__class__ in (str, bool):
+            return v in BOOL_VALUES
+        return v is None and allow_none
+
+    def stored(v):
+        return BOOL_VALUES.get(v, v) if v.__class__ in (str, bool) else v
+
+    return _result(map(valid, values), values, stored)
+
+
+def validate_datetimes(
+    values: Sequence, dt_format: str, allow_none: bool = False
+) -> BatchResult:
+    """
+    Checks the values are accepted by the datetime fields with the format.
+    Every distinct string is parsed once.
+    """
+    checked = {}
+
+    def valid(v) -> bool:
+        if isinstance(v, datetime):
+            return True
+        if isinstance(v, str):
+            if v not in checked:
+                checked[v] = _accepts(
+                    lambda s: datetime.strptime(s, dt_format), v
+                )
+            return checked[v]
+        return v is None and allow_none
+
+    def mark(v):
+        if isinstance(v, datetime):
+            return Validated(v.strftime(dt_format))
+        return Validated(v) if isinstance(v, str) else v
+
+    return _result(map(valid, values), values, mark)
+
+
+def _validate_group_ids(
+    values: Sequence, allow_none: bool = False
+) -> BatchResult:
+    """
+    Checks the values are accepted by the group_id field: the integers of
+    at most GROUP_ID_MAX_LENGTH characters.
+    """
+    ints = validate_ints(values, allow_none)
+    source = values.tolist() if hasattr(values, "tolist") else values
+    mask = ints.mask.tolist() if hasattr(ints.mask, "tolist") else ints.mask
+    valid = (
+        ok and (v is None or len(str(int(v))) <= GROUP_ID_MAX_LENGTH)
+        for v, ok in zip(source, mask)
+    )
+    return _result(valid, values, ints._mark)
+
+
+def _offer_fields() -> Dict[str, Callable]:
+    from yandex_market_language.models.offers import EXPIRY_FORMAT
+
+    def optional(validate):
+        return lambda values: validate(values, True)
+
+    return {
+        "price": validate_floats,
+        "weight": optional(validate_floats),
+        "min_quantity": optional(validate_ints),
+        "group_id": optional(_validate_group_ids),
+        "delivery": validate_bools,
+        "pickup": validate_bools,
+        "store": optional(validate_bools),
+        "manufacturer_warranty": optional(validate_bools),
+        "adult": optional(validate_bools),
+        "downloadable": optional(validate_bools),
+        "available": optional(validate_bools),
+        "expiry": lambda values: validate_datetimes(
+            values, EXPIRY_FORMAT, True
+        ),
+    }
+
+
+def validate_columns(columns: Dict[str, Sequence]) -> Dict[str, BatchResult]:
+    """
+    Validates the columns of the offer fields by the field names, e.g.
+    ``validate_columns({"price": prices, "weight": weights})``.
+    """
+    fields = _offer_fields()
+    unknown = set(columns) - set(fields)
+    if unknown:
+        raise ValueError("Unknown offer fields: {0}".format(
+            ", ".join(sorted(unknown))
+        ))
+    return {name: fields[name](values) for name, values in columns.items()}
+
+
+def validate_dict_columns(
+    offers: Sequence[dict], defaults: Dict[str, object]
+) -> Dict[str, list]:
+    """
+    Validates the MARKED_FIELDS of the offer dictionaries by columns, with
+    the defaults for the missing values, and returns the columns of the
+    values, the valid ones marked as Validated.
+    """
+    fields = _offer_fields()
+    return {
+        name: fields[name](
+            [offer.get(name, defaults[name]) for offer in offers]
+        ).values
+        for name in MARKED_FIELDS
+    }
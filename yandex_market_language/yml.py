@@ -1,48 +1,597 @@
-from xml.dom import minidom
+import json
+import os
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
 from xml.etree import ElementTree as ET
 
-from yandex_market_language.models import Feed
+from yandex_market_language import compression, instrumentation
+from yandex_market_language.errors import check_mode, parse_positions
+from yandex_market_language.exceptions import ValidationError
+from yandex_market_language.instrumentation import CONVERT, PARSE
+from yandex_market_language.models import Feed, Shop, get_offer_class
+from yandex_market_language.models.schema import (
+    get_dict_parser,
+    get_dict_writer,
+)
+
+if TYPE_CHECKING:
+    from yandex_market_language.cache import FeedCache
+    from yandex_market_language.errors import OfferError
+    from yandex_market_language.instrumentation import Hooks
+    from yandex_market_language.models.offers import AbstractOffer
+    from yandex_market_language.table import OfferTable
+
+# Number of JSON lines written at once
+JSONL_BATCH_SIZE = 1000
+
+# Number of offer dictionaries validated and written at once
+DICT_BATCH_SIZE = 1000
+
+
+@contextmanager
+def _open(file_or_path, mode: str, **options):
+    """
+    Opens the file by path, decoding or encoding compressed files on the
+    fly, or uses the given file object as is.
+    """
+    if hasattr(file_or_path, "read") or hasattr(file_or_path, "write"):
+        yield file_or_path
+    else:
+        with compression.open_file(file_or_path, mode, **options) as f:
+            yield f
+
+
+def _newline(level: int, pretty: bool) -> bytes:
+    return ("\n" + level * "\t").encode() if pretty else b""
+
+
+def _start_tag(tag: str, attrib: dict = None) -> bytes:
+    """
+    Returns an opening tag with escaped attributes.
+    """
+    from xml.sax.saxutils import quoteattr  # Imports urllib, slow to load
+
+    attrs = "".join(
+        " {k}={v}".format(k=k, v=quoteattr(v)) for k, v in attrib.items()
+    ) if attrib else ""
+    return "<{tag}{attrs}>".format(tag=tag, attrs=attrs).encode("utf-8")
 
 
 class YML:
     """
     Main class for feed parse and conversion.
+
+    Compressed files are detected by the magic bytes when they're parsed
+    and by the extension when they're converted, unless the compression is
+    set explicitly (None for plain files). The compression level and the
+    size of the blocks passed to the codec are configurable. File objects
+    are read and written as is, without compression.
     """
-    def __init__(self, file_or_path):
+    def __init__(
+        self,
+        file_or_path,
+        compression: Optional[str] = "infer",
+        compression_level: int = None,
+        buffer_size: int = compression.DEFAULT_BUFFER_SIZE,
+    ):
         self._file_or_path = file_or_path
+        self._compression = compression
+        self._compression_level = compression_level
+        self._buffer_size = buffer_size
+
+    @property
+    def _path(self):
+        if hasattr(self._file_or_path, "read"):
+            raise ValueError("A file path is required, got a file object")
+        return self._file_or_path
+
+    @property
+    def _plain_path(self):
+        """
+        Returns the path of the uncompressed file, which can be read by
+        byte ranges.
+        """
+        c = self._compression
+        if c == "infer":
+            c = compression.detect(self._path)
+        if c is not None:
+            raise ValueError(
+                "Compressed feeds can't be mapped or parsed in workers"
+            )
+        return self._path
+
+    def _open(self, mode: str):
+        return _open(
+            self._file_or_path,
+            mode,
+            compression=self._compression,
+            level=self._compression_level,
+            buffer_size=self._buffer_size,
+        )
+
+    @staticmethod
+    def indent(el: "ET.Element", level: int = 0):
+        """
+        Indents the element and its children in place with tabs, placing
+        every element on a separate line. Elements with text are left as is.
+        """
+        i = "\n" + level * "\t"
+        if len(el):
+            if not el.text or not el.text.strip():
+                el.text = i + "\t"
+            for child in el:
+                YML.indent(child, level + 1)
+            if not child.tail or not child.tail.strip():
+                child.tail = i
+        if level and (not el.tail or not el.tail.strip()):
+            el.tail = i
 
     @staticmethod
     def prettify_el(el: "ET.Element") -> "ET.Element":
         """
-        Return a pretty-printed XML string for the Element.
+        Return a pretty-printed Element.
         """
-        raw = ET.tostring(el, "utf-8")
-        parsed = minidom.parseString(raw)
-        prettified = parsed.toprettyxml(indent="\t")
-        return ET.fromstring(prettified)
+        YML.indent(el)
+        return el
 
-    def parse(self) -> "Feed":
+    def parse(
+        self,
+        workers: int = None,
+        lazy: bool = False,
+        cache: "FeedCache" = None,
+        mapped: bool = False,
+        errors: str = "raise",
+        hooks: "Hooks" = None,
+    ) -> "Feed":
         """
         Parses an XML feed file to the Feed model.
+        With workers set, the offers are parsed in the pool of processes.
+        With lazy set, the offers are proxies that parse fields on access.
+        With cache set, the feed is taken from the cache if the file wasn't
+        changed since it was parsed, otherwise it's parsed and cached.
+        With mapped set, the file is memory-mapped and every offer is parsed
+        from its own slice of the mapping.
+        With errors set to "collect", invalid offers are skipped and their
+        errors are listed in feed.errors with the line numbers and the byte
+        positions of the offers, the whole tree is parsed then.
+        With hooks set, the stage timings, the offer counts, the validation
+        failures and the bytes read are reported to the hooks.
+        """
+        check_mode(errors)
+        if hooks is None:
+            return self._parse(workers, lazy, cache, mapped, errors)
+
+        try:
+            feed = self._parse(workers, lazy, cache, mapped, errors, hooks)
+        except ValidationError:
+            hooks.validation_failures(PARSE, 1)
+            raise
+        hooks.offers(PARSE, instrumentation.offer_counts(feed.shop.offers))
+        hooks.validation_failures(PARSE, len(feed.errors))
+        return feed
+
+    def _parse(
+        self,
+        workers: int = None,
+        lazy: bool = False,
+        cache: "FeedCache" = None,
+        mapped: bool = False,
+        errors: str = "raise",
+        hooks: "Hooks" = None,
+    ) -> "Feed":
+        if cache is not None:
+            if lazy:
+                raise ValueError("Lazy offers can't be cached")
+            timer = hooks and instrumentation.Timer(hooks, PARSE)
+            feed = cache.get(self._path, errors)
+            if feed is None:
+                if timer:
+                    timer.stage(instrumentation.CACHE)
+                feed = self._parse(
+                    workers, mapped=mapped, errors=errors, hooks=hooks
+                )
+                if timer:
+                    timer.reset()
+                cache.put(self._path, feed, errors)
+            if timer:
+                timer.stage(instrumentation.CACHE)
+            return feed
+
+        if errors == "collect":
+            return self._parse_collect(workers, lazy, hooks)
+
+        if workers and lazy:
+            raise ValueError("Lazy offers can't be parsed in workers")
+        if workers or mapped:
+            return self._parse_mapped(workers, lazy, hooks=hooks)
+        return self._parse_tree(lazy, hooks=hooks)
+
+    def _parse_collect(
+        self,
+        workers: int = None,
+        lazy: bool = False,
+        hooks: "Hooks" = None,
+    ) -> "Feed":
+        if workers or lazy:
+            raise ValueError(
+                "Errors can't be collected for lazy offers or in workers"
+            )
+        return self._parse_tree(errors=[], hooks=hooks)
+
+    def _parse_mapped(
+        self,
+        workers: int = None,
+        lazy: bool = False,
+        hooks: "Hooks" = None,
+    ) -> "Feed":
+        """
+        Parses the plain feed file memory-mapped or in workers.
+        """
+        timer = hooks and instrumentation.Timer(hooks, PARSE)
+        path = self._plain_path
+        if workers:
+            from yandex_market_language import parallel
+            feed = parallel.parse(path, workers)
+        else:
+            from yandex_market_language.mapped import MappedFeed
+            with MappedFeed(path) as mapped_feed:
+                feed = mapped_feed.parse(lazy)
+        if timer:
+            timer.stage(PARSE)
+            hooks.bytes_read(os.path.getsize(path))
+        return feed
+
+    def _parse_tree(
+        self,
+        lazy: bool = False,
+        errors: List["OfferError"] = None,
+        hooks: "Hooks" = None,
+    ) -> "Feed":
+        """
+        Parses the whole XML tree of the feed, then builds the models.
+        With the errors list set, the errors get the positions of the
+        offer elements from the parser.
+        """
+        timer = hooks and instrumentation.Timer(hooks, PARSE)
+        with self._open("rb") as f:
+            if timer:
+                f = instrumentation.CountingFile(f)
+            if errors is None:
+                root = ET.parse(f).getroot()
+            else:
+                root, positions = parse_positions(f)
+        if timer:
+            timer.stage(instrumentation.READ)
+            hooks.bytes_read(f.count)
+        feed = Feed.from_xml(root, lazy, errors)
+        if errors:
+            for error in errors:
+                error.line, error.position = positions[error.element]
+        if timer:
+            timer.stage(instrumentation.BUILD)
+        return feed
+
+    def parse_offers(
+        self,
+        workers: int = None,
+        as_dict: bool = False,
+        columnar: bool = False,
+    ) -> Union[List[Union["AbstractOffer", dict]], "OfferTable"]:
+        """
+        Parses offers of an XML feed file in the pool of processes and
+        returns them in the document order, as models or as dictionaries.
+        With columnar set, the offers are streamed in the current process
+        into the OfferTable, only the fields of the table are parsed.
+        """
+        if columnar:
+            if workers or as_dict:
+                raise ValueError(
+                    "Columnar offers can't be parsed in workers or as dict"
+                )
+            from yandex_market_language.table import OfferTable
+            source = self._file_or_path
+            if hasattr(source, "read"):
+                source = None
+            return OfferTable.from_offers(self.iter_offers(lazy=True), source)
+
+        from yandex_market_language import parallel
+        return parallel.parse_offers(self._plain_path, workers, as_dict)
+
+    def parse_header(self) -> "Feed":
+        """
+        Parses an XML feed file to the Feed model without offers.
+        The shop contains currencies, categories, options, gifts and promos,
+        while offer elements are dropped as soon as they were read.
         """
-        tree = ET.parse(self._file_or_path)
-        root = tree.getroot()
+        root = offers_el = None
+        with self._open("rb") as f:
+            for event, el in ET.iterparse(f, ("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = el
+                    elif el.tag == "offers":
+                        offers_el = el
+                elif el.tag == "offer" and offers_el is not None:
+                    offers_el.clear()
         return Feed.from_xml(root)
 
-    def convert(self, feed: "Feed", pretty: bool = True):
+    def iter_offers(self, lazy: bool = False) -> Iterator["AbstractOffer"]:
+        """
+        Iterates over the feed offers, yielding each offer model as soon as
+        its element is closed. Processed elements are detached from the tree,
+        so memory usage doesn't depend on the number of offers.
+        With lazy set, yields offer proxies that parse fields on access.
+        """
+        for el in self._iter_offer_elements():
+            yield Shop.offer_from_xml(el, lazy)
+
+    def iter_offer_dicts(self, clean: bool = False) -> Iterator[dict]:
+        """
+        Iterates over the feed offers as dictionaries, equal to the ones of
+        offer.to_dict(clean), without creating the offer models: the offer
+        elements are mapped to the dictionaries by the parsers compiled
+        from the XML_FIELDS of the offer models. The values are validated
+        as the models do it. Memory usage doesn't depend on the number of
+        offers.
+        """
+        for el in self._iter_offer_elements():
+            d = get_dict_parser(get_offer_class(el.attrib.get("type")))(el)
+            yield {k: v for k, v in d.items() if v} if clean else d
+
+    def parse_to_jsonl(self, out, clean: bool = False) -> int:
+        """
+        Writes the feed offers as dictionaries to the JSON lines file
+        (a path or a binary file object), one offer per line, and returns
+        the number of offers. Dates are written as strings. The output file
+        is compressed if its extension is of a compression format.
+        """
+        encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        count = 0
+        with _open(out, "wb") as f:
+            lines = []
+            for d in self.iter_offer_dicts(clean):
+                lines.append(encode(d))
+                if len(lines) == JSONL_BATCH_SIZE:
+                    lines.append("")
+                    f.write("\n".join(lines).encode("utf-8"))
+                    count += len(lines) - 1
+                    lines = []
+            if lines:
+                lines.append("")
+                f.write("\n".join(lines).encode("utf-8"))
+                count += len(lines) - 1
+        return count
+
+    def _iter_offer_elements(self) -> Iterator["ET.Element"]:
+        """
+        Iterates over the offer elements as soon as they're closed, the
+        processed elements are detached from the tree.
+        """
+        offers_el = None
+        with self._open("rb") as f:
+            for event, el in ET.iterparse(f, ("start", "end")):
+                if event == "start":
+                    if el.tag == "offers":
+                        offers_el = el
+                elif el.tag == "offer" and offers_el is not None:
+                    yield el
+                    offers_el.clear()
+                elif el.tag == "offers":
+                    offers_el = None
+
+    def convert(
+        self,
+        feed: "Feed",
+        pretty: bool = True,
+        hooks: "Hooks" = None,
+    ):
         """
         Converts Feed model to XML file.
+        With hooks set, the stage timings, the offer counts and the bytes
+        written are reported to the hooks.
         """
+        timer = hooks and instrumentation.Timer(hooks, CONVERT)
         feed_el = feed.to_xml()
+        if timer:
+            timer.stage(instrumentation.SERIALIZE)
         if pretty:
             feed_el = self.prettify_el(feed_el)
+            if timer:
+                timer.stage(instrumentation.PRETTIFY)
         tree = ET.ElementTree(feed_el)
-        tree.write(self._file_or_path, encoding="utf-8")
+        with self._open("wb") as f:
+            if timer:
+                f = instrumentation.CountingFile(f)
+            tree.write(f, encoding="utf-8")
+        if timer:
+            timer.stage(instrumentation.WRITE)
+            hooks.bytes_written(f.count)
+            hooks.offers(
+                CONVERT, instrumentation.offer_counts(feed.shop.offers)
+            )
+
+    def convert_stream(
+        self,
+        feed: "Feed",
+        offers: Iterable["AbstractOffer"] = (),
+        pretty: bool = True,
+    ):
+        """
+        Converts Feed model to XML file incrementally.
+        The feed is used as a header: the shop offers are written first,
+        followed by the offers from the iterable, each one serialized and
+        written as soon as it was taken, so the whole tree is never built.
+        """
+        def tostring(el: "ET.Element") -> bytes:
+            if pretty:
+                self.indent(el, 3)
+                el.tail = None
+            return _newline(3, pretty) + ET.tostring(el, "utf-8")
+
+        self._write_feed(
+            feed,
+            (tostring(o.to_xml()) for o in chain(feed.shop.offers, offers)),
+            pretty,
+        )
+
+    def convert_dicts(
+        self,
+        shop: dict,
+        offers: Iterable[dict] = (),
+        pretty: bool = True,
+        date=None,
+        batch_size: int = DICT_BATCH_SIZE,
+    ) -> int:
+        """
+        Converts the shop and the offers dictionaries in the form of
+        create_dict to XML file incrementally, without creating the offer
+        models, and returns the number of offers. The shop dictionary is
+        the header: its offers are written first, followed by the offers
+        from the iterable.
+
+        The offers are taken by batches: the numeric and the date fields
+        of the batch are validated by columns, the other values go through
+        the setters of the models, so the offers are validated as the
+        models do it, then the XML of the batch is written at once.
+        """
+        from yandex_market_language.models.offers import AbstractOffer
+        from yandex_market_language.validation import (
+            MARKED_FIELDS,
+            validate_dict_columns,
+        )
+
+        header = dict(shop, offers=[])
+        feed = Feed(Shop.from_dict(header), date)
+        level = 3 if pretty else None
+        columns = {name: AbstractOffer for name in MARKED_FIELDS}
+        defaults = AbstractOffer.init_fields()
+        newline = _newline(3, pretty).decode()
+        writers = {}
+        count = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal count
+            it = chain(shop.get("offers") or (), offers)
+            while True:
+                batch = list(islice(it, batch_size))
+                if not batch:
+                    return
+                c = validate_dict_columns(batch, defaults)
+                parts = []
+                for i, d in enumerate(batch):
+                    offer_type = d.get("type")
+                    try:
+                        writer = writers[offer_type]
+                    except KeyError:
+                        writer = writers[offer_type] = get_dict_writer(
+                            get_offer_class(offer_type), level, columns
+                        )
+                    parts.append(newline)
+                    parts.append(writer(d, c, i))
+                count += len(batch)
+                yield "".join(parts).encode("utf-8")
+
+        self._write_feed(feed, chunks(), pretty)
+        return count
+
+    def _write_feed(
+        self, feed: "Feed", offers: Iterable[bytes], pretty: bool
+    ):
+        """
+        Writes the feed with the offers elements (serialized and indented)
+        instead of the offers of the feed.
+        """
+        shop_el = feed.shop.create_xml(with_offers=False)
+
+        def tostring(el: "ET.Element", level: int) -> bytes:
+            if pretty:
+                self.indent(el, level)
+                el.tail = None
+            return _newline(level, pretty) + ET.tostring(el, "utf-8")
+
+        with self._open("wb") as f:
+            f.write(_start_tag("yml_catalog", {"date": feed._date}))
+            f.write(_newline(1, pretty) + _start_tag("shop"))
+            for el in shop_el:
+                if el.tag != "offers":
+                    f.write(tostring(el, 2))
+                    continue
+                f.write(_newline(2, pretty) + _start_tag("offers"))
+                for chunk in offers:
+                    f.write(chunk)
+                f.write(_newline(2, pretty) + b"</offers>")
+            f.write(
+                _newline(1, pretty) + b"</shop>" + _newline(0, pretty)
+                + b"</yml_catalog>"
+            )
+
+
+def parse(
+    file_or_path,
+    workers: int = None,
+    lazy: bool = False,
+    cache: "FeedCache" = None,
+    mapped: bool = False,
+    errors: str = "raise",
+    hooks: "Hooks" = None,
+):
+    return YML(file_or_path).parse(
+        workers, lazy, cache, mapped, errors, hooks
+    )
+
+
+def parse_offers(
+    file_or_path,
+    workers: int = None,
+    as_dict: bool = False,
+    columnar: bool = False,
+):
+    return YML(file_or_path).parse_offers(workers, as_dict, columnar)
+
+
+def parse_header(file_or_path):
+    return YML(file_or_path).parse_header()
+
+
+def iter_offers(file_or_path, lazy: bool = False):
+    return YML(file_or_path).iter_offers(lazy)
+
+
+def iter_offer_dicts(file_or_path, clean: bool = False):
+    return YML(file_or_path).iter_offer_dicts(clean)
+
+
+def parse_to_jsonl(file_or_path, out, clean: bool = False) -> int:
+    return YML(file_or_path).parse_to_jsonl(out, clean)
+
+
+def dicts_to_yml(
+    shop: dict,
+    offers: Iterable[dict],
+    file_or_path,
+    pretty: bool = True,
+    date=None,
+    batch_size: int = DICT_BATCH_SIZE,
+) -> int:
+    return YML(file_or_path).convert_dicts(
+        shop, offers, pretty, date, batch_size
+    )
 
 
-def parse(file_or_path):
-    return YML(file_or_path).parse()
+def convert(
+    file_or_path,
+    feed: "Feed",
+    pretty: bool = True,
+    hooks: "Hooks" = None,
+):
+    YML(file_or_path).convert(feed, pretty, hooks)
 
 
-def convert(file_or_path, feed: "Feed", pretty: bool = True):
-    YML(file_or_path).convert(feed, pretty)
+def convert_stream(
+    file_or_path,
+    feed: "Feed",
+    offers: Iterable["AbstractOffer"] = (),
+    pretty: bool = True,
+):
+    YML(file_or_path).convert_stream(feed, offers, pretty)